@@ -0,0 +1,215 @@
+"""Response cache with version-based ETags for read-mostly GET endpoints.
+
+Responses are keyed by path, normalized query parameters and the client's
+accepted encodings. Their ETag is derived from the key and the current
+versions of the tables the route reads (see `app.db.versioning`), so a write
+to any of those tables invalidates both the server-side entry and any ETag a
+client holds. Cache hits and 304 replies
+are answered before routing, without touching the database or Pydantic;
+a rule's `on_hit` callback (run in a worker thread) lets the route keep
+side effects such as view tracking for those requests.
+
+Cache misses are routed to the primary database even for GETs: the ETag comes
+from primary-side table versions, so a body built from a lagging replica
+would be stored (and revalidated) under a version it does not reflect.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+import anyio
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.db.session import read_from_primary
+from app.db.versioning import TableVersionRegistry, table_versions
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    """Cache GET responses under *prefix*; *tables* are the tables the route reads.
+
+    *on_hit* is called with the request path for responses answered from the
+    cache (hits and 304s), which never reach the route.
+    """
+
+    prefix: str
+    tables: Tuple[str, ...]
+    ttl: float = 60.0
+    on_hit: Optional[Callable[[str], None]] = None
+
+
+@dataclass
+class _CachedResponse:
+    etag: str
+    status: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+    expires_at: float
+
+
+def _cache_key(scope: Scope) -> str:
+    query = parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True)
+    # 인코딩별로 본문이 달라질 수 있으므로 Accept-Encoding도 키에 포함
+    encodings = sorted(
+        token.split(";")[0].strip()
+        for token in (_header(scope, b"accept-encoding") or "").lower().split(",")
+        if token.strip()
+    )
+    return f"{scope['path']}?{urlencode(sorted(query))}#{','.join(encodings)}"
+
+
+def _make_etag(key: str, versions: Sequence[int]) -> str:
+    digest = hashlib.blake2b(f"{key}|{versions}".encode(), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def _header(scope: Scope, name: bytes) -> Optional[str]:
+    for key, value in scope.get("headers", []):
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates
+
+
+class ResponseCacheMiddleware:
+    """ASGI middleware serving cached GET responses and 304 revalidations."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        rules: Sequence[CacheRule],
+        registry: TableVersionRegistry = table_versions,
+        max_entries: int = settings.RESPONSE_CACHE_MAX_ENTRIES,
+        max_body_bytes: int = settings.RESPONSE_CACHE_MAX_BODY_BYTES,
+    ) -> None:
+        self.app = app
+        # 가장 구체적인(긴) prefix가 먼저 매칭되도록 정렬
+        self.rules = sorted(rules, key=lambda rule: len(rule.prefix), reverse=True)
+        self.registry = registry
+        self.max_entries = max_entries
+        self.max_body_bytes = max_body_bytes
+        self._entries: "OrderedDict[str, _CachedResponse]" = OrderedDict()
+
+    def _match(self, path: str) -> Optional[CacheRule]:
+        for rule in self.rules:
+            if path == rule.prefix or path.startswith(rule.prefix.rstrip("/") + "/"):
+                return rule
+        return None
+
+    def invalidate(self) -> None:
+        """Drop every cached entry (ETags stay valid until table versions change)."""
+
+        self._entries.clear()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+        rule = self._match(scope["path"])
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        if self.registry.is_stale():
+            await anyio.to_thread.run_sync(self.registry.refresh)
+        key = _cache_key(scope)
+        etag = _make_etag(key, self.registry.current(rule.tables))
+        cache_headers = [
+            (b"etag", etag.encode("latin-1")),
+            (b"cache-control", b"no-cache"),
+        ]
+
+        if _etag_matches(_header(scope, b"if-none-match"), etag):
+            await self._notify_hit(rule, scope)
+            await send({"type": "http.response.start", "status": 304, "headers": cache_headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and entry.etag == etag and entry.expires_at > now:
+            self._entries.move_to_end(key)
+            await self._notify_hit(rule, scope)
+            await send({"type": "http.response.start", "status": entry.status, "headers": entry.headers})
+            await send({"type": "http.response.body", "body": entry.body})
+            return
+
+        # 저장될 본문은 ETag와 같은 primary 기준으로 만든다 (복제 지연 본문이 새 ETag로 캐시되지 않도록)
+        read_from_primary(scope)
+        await self._call_and_store(scope, receive, send, key, etag, rule.ttl, cache_headers)
+
+    @staticmethod
+    async def _notify_hit(rule: CacheRule, scope: Scope) -> None:
+        if rule.on_hit is not None:
+            await anyio.to_thread.run_sync(rule.on_hit, scope["path"])
+
+    async def _call_and_store(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        key: str,
+        etag: str,
+        ttl: float,
+        cache_headers: List[Tuple[bytes, bytes]],
+    ) -> None:
+        status = 0
+        headers: List[Tuple[bytes, bytes]] = []
+        chunks: List[bytes] = []
+        size = 0
+        cacheable = True
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, headers, size, cacheable
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if status == 200:
+                    headers = [
+                        (name, value)
+                        for name, value in message.get("headers", [])
+                        if name.lower() not in (b"etag", b"cache-control")
+                    ] + cache_headers
+                    message = {**message, "headers": headers}
+                else:
+                    cacheable = False
+            elif message["type"] == "http.response.body" and cacheable:
+                body = message.get("body", b"")
+                size += len(body)
+                if size > self.max_body_bytes:
+                    cacheable = False
+                    chunks.clear()
+                else:
+                    chunks.append(body)
+                if not message.get("more_body", False) and cacheable:
+                    self._store(key, _CachedResponse(
+                        etag=etag,
+                        status=status,
+                        headers=headers,
+                        body=b"".join(chunks),
+                        expires_at=time.monotonic() + ttl,
+                    ))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _store(self, key: str, entry: _CachedResponse) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,72 @@
+"""Single-flight coalescing of identical concurrent reads.
+
+`SingleFlight.do(key, fn)` runs *fn* once for all callers that ask for the
+same *key* while a call is in flight; the others block until it finishes and
+receive the same result (or exception). Nothing is cached afterwards — the
+next call after completion runs *fn* again.
+
+Routes coalesce the query *and* the serialization by returning encoded bytes
+from *fn*, so a burst of identical requests (e.g. right after a collector
+refresh invalidated the response cache) costs one database round trip and
+one JSON encode.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Return `fn()`, sharing one execution between concurrent callers of *key*."""
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> Tuple[int, int]:
+        """(calls in flight, callers coalesced so far)."""
+
+        with self._lock:
+            return len(self._calls), self.coalesced
+
+
+single_flight = SingleFlight()
@@ -0,0 +1,153 @@
+"""Negotiated response compression (brotli or gzip).
+
+`CompressionMiddleware` compresses a response when the client accepts it and
+either the body reaches `COMPRESSION_MIN_SIZE` bytes or the response is
+streamed (no `Content-Length`). Streamed bodies are compressed chunk by chunk
+and flushed after every chunk, so the first bytes still go out before the
+handler has produced the whole body.
+
+Brotli is used only when the optional `brotli` package is installed and the
+client prefers it at least as much as gzip. Responses that already carry a
+`Content-Encoding` (e.g. the prebuilt gzip stock documents), event streams
+and non-text types are passed through untouched.
+"""
+
+from __future__ import annotations
+
+import zlib
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+_COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "image/svg+xml")
+_EXCLUDED_TYPES = ("text/event-stream",)
+
+
+def _accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    accepted: Dict[str, float] = {}
+    for token in accept_encoding.lower().split(","):
+        name, _, params = token.strip().partition(";")
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip()] = quality
+    return accepted
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick "br" or "gzip" from an Accept-Encoding header (None for identity)."""
+
+    accepted = _accepted_encodings(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    gzip_q = accepted.get("gzip", wildcard)
+    br_q = accepted.get("br", wildcard) if brotli is not None else 0.0
+    if br_q > 0 and br_q >= gzip_q:
+        return "br"
+    if gzip_q > 0:
+        return "gzip"
+    return None
+
+
+class _Encoder:
+    def __init__(self, encoding: str) -> None:
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+            self._zlib = None
+        else:
+            self._brotli = None
+            # wbits 16+: gzip 헤더/트레일러 포함
+            self._zlib = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, *, final: bool) -> bytes:
+        if self._brotli is not None:
+            out = self._brotli.process(data)
+            return out + (self._brotli.finish() if final else self._brotli.flush())
+        out = self._zlib.compress(data)
+        return out + self._zlib.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+def _compressible(headers: Headers) -> bool:
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "").lower()
+    if content_type.startswith(_EXCLUDED_TYPES):
+        return False
+    return content_type.startswith(_COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """ASGI middleware applying gzip/brotli based on Accept-Encoding."""
+
+    def __init__(self, app: ASGIApp, *, minimum_size: int = settings.COMPRESSION_MIN_SIZE) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        encoder: Optional[_Encoder] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, encoder, passthrough
+            if message["type"] == "http.response.start":
+                # 본문 첫 조각을 보고 압축 여부를 정하므로 시작 메시지는 잠시 보류
+                start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if encoder is None:
+                headers = MutableHeaders(raw=list(start["headers"]))
+                small = not more_body and len(body) < self.minimum_size
+                if small or not _compressible(headers):
+                    passthrough = True
+                    if _compressible(headers):
+                        headers.add_vary_header("Accept-Encoding")
+                    await send({**start, "headers": headers.raw})
+                    await send(message)
+                    return
+                encoder = _Encoder(encoding)
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if "content-length" in headers:
+                    del headers["content-length"]
+                if not more_body:
+                    compressed = encoder.compress(body, final=True)
+                    headers["Content-Length"] = str(len(compressed))
+                    await send({**start, "headers": headers.raw})
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+                await send({**start, "headers": headers.raw})
+
+            await send({
+                "type": "http.response.body",
+                "body": encoder.compress(body, final=not more_body),
+                "more_body": more_body,
+            })
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import List, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -18,11 +19,122 @@ class Settings(BaseSettings):
         default="sqlite:///./alphabot.db",
         env="DATABASE_URL",
     )
+    # 읽기 전용 복제본. 설정하면 GET 요청의 세션은 복제본을 사용한다 (테스트에서는 별도 SQLite 파일도 가능).
+    # 쓰기 직후 READ_YOUR_WRITES_SECONDS 동안은 해당 클라이언트의 읽기도 primary로 보내 복제 지연을 숨긴다
+    # (rw_until 쿠키로 표시하므로 워커가 여러 개여도 적용된다).
+    database_replica_url: Optional[str] = Field(
+        default=None,
+        env="DATABASE_REPLICA_URL",
+    )
+    READ_YOUR_WRITES_SECONDS: float = 5.0
+    # 수집기 DB (collector 모델, public 스키마). COLLECTOR_DATABASE_URL이 없으면
+    # DB_USER/DB_PASSWORD/DB_HOST/DB_PORT/DB_NAME으로 PostgreSQL URL을 조합한다.
+    collector_database_url: Optional[str] = Field(
+        default=None,
+        env="COLLECTOR_DATABASE_URL",
+    )
+    DB_USER: Optional[str] = None
+    DB_PASSWORD: Optional[str] = None
+    DB_HOST: Optional[str] = None
+    DB_PORT: Optional[int] = None
+    DB_NAME: Optional[str] = None
     
     # jwt설정
     SECRET_KEY: str = "secret_key" #나중에 키 수정
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # 카테고리 생성/수정/삭제가 허용되는 관리자 이메일 목록 (JSON 배열, 예: '["admin@example.com"]')
+    ADMIN_EMAILS: List[str] = []
+
+    # 비밀번호 해시 설정
+    # bcrypt 연산은 전용 스레드 풀에서 실행되며, 대기열이 가득 차면 로그인 요청을 503으로 거절한다.
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32
+
+    # 응답 캐시 설정
+    # 다른 프로세스(수집기 등)의 쓰기는 최대 TABLE_VERSION_REFRESH_SECONDS 이후 캐시에 반영된다.
+    TABLE_VERSION_REFRESH_SECONDS: float = 2.0
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1024
+    RESPONSE_CACHE_MAX_BODY_BYTES: int = 1_048_576
+
+    # 로컬 벡터 인덱스 설정 (종목 사업 개요, 채팅 메시지 검색)
+    # EMBEDDER가 사용 불가능하면 결정적인 hashing 임베더로 대체된다.
+    # 메시지 인덱스는 API 프로세스가 VECTOR_SYNC_SECONDS 주기로 동기화한다 (0이면 끔).
+    VECTOR_INDEX_DIR: str = "./vector_index"
+    VECTOR_INDEX_KIND: str = "ivf"  # "flat" | "ivf"
+    EMBEDDER: str = "hashing"  # "hashing" | "sentence-transformers"
+    EMBEDDING_DIM: int = 384
+    EMBEDDING_MODEL: str = "sentence-transformers/all-MiniLM-L6-v2"
+    VECTOR_SYNC_SECONDS: float = 5.0
+
+    # 관심 종목 시세 팬아웃 설정
+    # 구독자가 있는 종목만 QUOTE_REFRESH_SECONDS 주기로 종목당 한 번씩 조회한다.
+    QUOTE_REFRESH_SECONDS: float = 15.0
+    QUOTE_FETCH_WORKERS: int = 4
+
+    # 수집 스케줄러 설정
+    # 거래량 상위·관심 종목·최근 조회 종목은 HOT 주기, 나머지는 기본 주기로 시세를 갱신한다.
+    # SCHEDULER_MAX_CONCURRENCY는 모든 스케줄러 프로세스를 합친 동시 실행 작업 수 상한이다.
+    SCHEDULER_HOT_QUOTE_SECONDS: int = 300
+    SCHEDULER_QUOTE_SECONDS: int = 3600
+    SCHEDULER_STATEMENT_SECONDS: int = 7 * 24 * 3600
+    SCHEDULER_HOT_VOLUME_TOP: int = 200
+    SCHEDULER_RECENT_QUERY_SECONDS: int = 24 * 3600
+    SCHEDULER_MAX_CONCURRENCY: int = 4
+    SCHEDULER_JITTER: float = 0.1
+    STOCK_INTEREST_FLUSH_SECONDS: float = 60.0
+
+    # DB 커넥션 풀 설정 (API와 수집기가 같은 엔진 팩토리 사용, SQLite에는 적용하지 않음)
+    # pgbouncer(transaction 모드) 뒤에서는 DB_PGBOUNCER=true로 psycopg prepared statement를 끈다.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_PRE_PING: bool = True
+    DB_PGBOUNCER: bool = False
+    DB_PREPARE_THRESHOLD: Optional[int] = 5
+
+    # 요청 지표 설정 (/metrics)
+    # PROFILE_TOKEN을 설정하면 `X-Profile: <토큰>` 헤더가 있는 요청만 샘플링 프로파일링한다.
+    # /metrics 이하 엔드포인트는 `Authorization: Bearer <PROFILE_TOKEN>`이 필요하고, 토큰이 없으면 loopback에서만 열린다.
+    METRICS_SLOW_QUERY_SECONDS: float = 0.2
+    METRICS_SLOW_QUERY_SAMPLES: int = 100
+    PROFILE_TOKEN: Optional[str] = None
+    PROFILE_INTERVAL_SECONDS: float = 0.005
+    PROFILE_MAX_STORED: int = 20
+
+    # 응답 압축 / 대용량 목록 스트리밍 설정
+    # 응답이 STREAM_JSON_MIN_ROWS 행을 넘으면 STREAM_JSON_CHUNK_ROWS 행씩 JSON 배열로 스트리밍한다.
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    STREAM_JSON_MIN_ROWS: int = 500
+    STREAM_JSON_CHUNK_ROWS: int = 200
+
+    # 사용자별 요청 제한 설정 ("memory": 프로세스별, "redis": 워커 간 공유)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"  # "memory" | "redis"
+    RATE_LIMIT_REDIS_URL: Optional[str] = None
+    RATE_LIMIT_MESSAGES_PER_MINUTE: int = 120
+    RATE_LIMIT_SEARCH_PER_MINUTE: int = 30
+
+    # 메시지 파티션 / 보관(archival) 설정
+    # 휴지통(OUT) 채팅은 ARCHIVE_TRASHED_AFTER_DAYS, 그 외 채팅은 마지막 대화 후
+    # ARCHIVE_INACTIVE_AFTER_DAYS가 지나면 ARCHIVE_DIR에 gzip NDJSON으로 옮기고 DB에서 지운다.
+    MESSAGE_PARTITION_MONTHS_AHEAD: int = 3
+    ARCHIVE_DIR: str = "./archive"
+    ARCHIVE_TRASHED_AFTER_DAYS: int = 30
+    ARCHIVE_INACTIVE_AFTER_DAYS: int = 365
+    ARCHIVE_BATCH_CHATS: int = 200
+
+    # 서버 시작 워밍업 설정
+    # 여러 워커가 동시에 떠도 DB에 몰리지 않도록 0~STARTUP_JITTER_SECONDS 사이 임의 지연 후 워밍업한다.
+    # DB 단계가 실패하면 STARTUP_RETRY_SECONDS부터 두 배씩(최대 STARTUP_RETRY_MAX_SECONDS) 기다렸다 다시 시도한다.
+    STARTUP_WARM_CONNECTIONS: int = 2
+    STARTUP_JITTER_SECONDS: float = 1.0
+    STARTUP_RETRY_SECONDS: float = 1.0
+    STARTUP_RETRY_MAX_SECONDS: float = 30.0
 
 
 @lru_cache(maxsize=1)
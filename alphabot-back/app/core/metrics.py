@@ -0,0 +1,350 @@
+"""Request metrics, SQL query accounting and an opt-in sampling profiler.
+
+`MetricsMiddleware` times every HTTP request and labels it with the matched
+route template (`/chats/api/rooms/{room_id}/messages`, not the raw path).
+Requests answered before routing (response-cache hits and 304s) are labelled
+with the route that would have served them, resolved through `app.router`.
+SQLAlchemy engine events count the queries each request runs and the time
+spent in them, so N+1 patterns show up as a high `db_queries_per_request`
+for one route. Queries slower than `METRICS_SLOW_QUERY_SECONDS` are kept as
+samples.
+
+A request carrying `X-Profile: <PROFILE_TOKEN>` is sampled by a background
+thread (`sys._current_frames()` every `PROFILE_INTERVAL_SECONDS`); the
+collapsed stacks (flamegraph.pl format) are stored under the id returned in
+the `X-Profile-Id` response header. Profiling is disabled while
+`PROFILE_TOKEN` is unset.
+
+`metrics.render()` returns everything (plus the pool counters from
+`app.db.engines`) in the Prometheus text exposition format.
+"""
+
+from __future__ import annotations
+
+import hmac
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict, deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.routing import BaseRoute, Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS: Tuple[float, ...] = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+UNROUTED = "unrouted"
+_POOL_GAUGES = frozenset({"wait_seconds_max", "size", "checked_out", "overflow"})
+
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus semantics)."""
+
+    __slots__ = ("buckets", "counts", "total", "count")
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+        self.total += value
+        self.count += 1
+
+
+@dataclass
+class RequestStats:
+    scope: Scope
+    queries: int = 0
+    query_seconds: float = 0.0
+
+
+@dataclass
+class SlowQuery:
+    statement: str
+    seconds: float
+    route: str
+    at: float = field(default_factory=time.time)
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+class MetricsRegistry:
+    def __init__(self, *, slow_query_seconds: float, slow_query_samples: int) -> None:
+        self.slow_query_seconds = slow_query_seconds
+        self._lock = threading.Lock()
+        self._latency: Dict[Tuple[str, str], Histogram] = {}
+        self._queries: Dict[str, Histogram] = {}
+        self._query_seconds: Counter = Counter()
+        self._requests: Counter = Counter()
+        self.slow_queries: Deque[SlowQuery] = deque(maxlen=slow_query_samples)
+
+    def observe_request(self, method: str, route: str, status: int, seconds: float, stats: RequestStats) -> None:
+        with self._lock:
+            histogram = self._latency.get((method, route))
+            if histogram is None:
+                histogram = self._latency[(method, route)] = Histogram(LATENCY_BUCKETS)
+            histogram.observe(seconds)
+            queries = self._queries.get(route)
+            if queries is None:
+                queries = self._queries[route] = Histogram(QUERY_COUNT_BUCKETS)
+            queries.observe(stats.queries)
+            self._query_seconds[route] += stats.query_seconds
+            self._requests[(method, route, status)] += 1
+
+    def observe_query(self, statement: str, seconds: float) -> None:
+        stats = _current.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.query_seconds += seconds
+        if seconds >= self.slow_query_seconds:
+            route = _route_template(stats.scope) if stats is not None else UNROUTED
+            self.slow_queries.append(SlowQuery(" ".join(statement.split())[:2000], seconds, route))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            lines += [
+                "# HELP http_requests_total HTTP requests by route and status.",
+                "# TYPE http_requests_total counter",
+            ]
+            for (method, route, status), count in sorted(self._requests.items()):
+                lines.append(f"http_requests_total{_labels(method=method, route=route, status=status)} {count}")
+            lines += [
+                "# HELP http_request_duration_seconds Request latency by route.",
+                "# TYPE http_request_duration_seconds histogram",
+            ]
+            for (method, route), histogram in sorted(self._latency.items()):
+                lines += _render_histogram("http_request_duration_seconds", histogram, method=method, route=route)
+            lines += [
+                "# HELP db_queries_per_request SQL statements executed per request.",
+                "# TYPE db_queries_per_request histogram",
+            ]
+            for route, histogram in sorted(self._queries.items()):
+                lines += _render_histogram("db_queries_per_request", histogram, route=route)
+            lines += [
+                "# HELP db_query_seconds_total Time spent in SQL statements by route.",
+                "# TYPE db_query_seconds_total counter",
+            ]
+            for route, seconds in sorted(self._query_seconds.items()):
+                lines.append(f"db_query_seconds_total{_labels(route=route)} {seconds:.6f}")
+        lines += _render_pool_metrics()
+        lines += _render_single_flight()
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels: object) -> str:
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _render_histogram(name: str, histogram: Histogram, **labels: object) -> List[str]:
+    lines = [
+        f"{name}_bucket{_labels(**labels, le=bound)} {count}"
+        for bound, count in zip(histogram.buckets, histogram.counts)
+    ]
+    lines.append(f"{name}_bucket{_labels(**labels, le='+Inf')} {histogram.count}")
+    lines.append(f"{name}_sum{_labels(**labels)} {histogram.total:.6f}")
+    lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+    return lines
+
+
+def _render_single_flight() -> List[str]:
+    from app.core.coalesce import single_flight
+
+    in_flight, coalesced = single_flight.stats()
+    return [
+        "# HELP singleflight_coalesced_total Requests that shared another request's in-flight read.",
+        "# TYPE singleflight_coalesced_total counter",
+        f"singleflight_coalesced_total {coalesced}",
+        "# TYPE singleflight_in_flight gauge",
+        f"singleflight_in_flight {in_flight}",
+    ]
+
+
+def _render_pool_metrics() -> List[str]:
+    from app.db.engines import pool_metrics
+
+    stats_by_database = sorted(pool_metrics().items())
+    keys = list(stats_by_database[0][1]) if stats_by_database else []
+    lines: List[str] = []
+    for key in keys:
+        # 풀 상태(size, checked_out 등)와 최대 대기 시간은 gauge, 나머지는 누적 counter
+        if key in _POOL_GAUGES:
+            name, kind = f"db_pool_{key}", "gauge"
+        else:
+            name, kind = f"db_pool_{key.removesuffix('_total')}_total", "counter"
+        lines.append(f"# TYPE {name} {kind}")
+        for database, stats in stats_by_database:
+            if key in stats:
+                lines.append(f"{name}{_labels(database=database)} {stats[key]}")
+    return lines
+
+
+metrics = MetricsRegistry(
+    slow_query_seconds=settings.METRICS_SLOW_QUERY_SECONDS,
+    slow_query_samples=settings.METRICS_SLOW_QUERY_SAMPLES,
+)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = conn.info.get("query_started")
+    if started:
+        metrics.observe_query(statement, time.perf_counter() - started.pop())
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context) -> None:
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started"):
+        connection.info["query_started"].pop()
+
+
+class SamplingProfiler:
+    """Samples the stacks of every other thread until stopped."""
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self) -> "SamplingProfiler":
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self._interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+                    frame = frame.f_back
+                # 유휴 스레드(대기 중인 워커 등)는 제외
+                if stack and not stack[0].startswith(("wait ", "select ", "_worker ", "get ")):
+                    self._stacks[";".join(reversed(stack))] += 1
+
+    def stop(self) -> str:
+        """Stop sampling and return collapsed stacks (`frame;frame;... count` per line)."""
+
+        self._stop.set()
+        self._thread.join()
+        return "\n".join(f"{stack} {count}" for stack, count in self._stacks.most_common())
+
+
+class ProfileStore:
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, profile_id: str, collapsed: str) -> None:
+        with self._lock:
+            self._entries[profile_id] = collapsed
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[str]:
+        return self._entries.get(profile_id)
+
+
+profiles = ProfileStore(settings.PROFILE_MAX_STORED)
+
+
+def _profile_requested(scope: Scope) -> bool:
+    token = settings.PROFILE_TOKEN
+    if not token:
+        return False
+    for name, value in scope.get("headers", []):
+        if name == b"x-profile":
+            return hmac.compare_digest(value.decode("latin-1"), token)
+    return False
+
+
+def _resolve_route(scope: Scope) -> Optional[BaseRoute]:
+    """Route the app's router would pick for *scope* (for requests that never reached it)."""
+
+    router = getattr(scope.get("app"), "router", None)
+    for route in getattr(router, "routes", ()):
+        match, _ = route.matches(scope)
+        if match is Match.FULL:
+            return route
+    return None
+
+
+def _route_template(scope: Scope) -> str:
+    route = scope.get("route") or _resolve_route(scope)
+    template = getattr(route, "path", None)
+    if not template:
+        return UNROUTED
+    path = scope["path"]
+    if route.path_regex.match(path):
+        return template
+    # include_router의 prefix가 route.path에 포함되지 않는 FastAPI 버전: 요청 경로에서 prefix를 복원
+    for index, char in enumerate(path):
+        if char == "/" and index and route.path_regex.match(path[index:]):
+            return path[:index] + template
+    return template
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency and per-request SQL statistics."""
+
+    def __init__(self, app: ASGIApp, *, registry: MetricsRegistry = metrics) -> None:
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope)
+        token = _current.set(stats)
+        profiler = SamplingProfiler(settings.PROFILE_INTERVAL_SECONDS).start() if _profile_requested(scope) else None
+        profile_id = uuid.uuid4().hex if profiler is not None else None
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if profile_id is not None:
+                    message = {**message, "headers": [*message.get("headers", []),
+                                                      (b"x-profile-id", profile_id.encode())]}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            _current.reset(token)
+            self.registry.observe_request(scope["method"], _route_template(scope), status, elapsed, stats)
+            if profiler is not None:
+                profiles.add(profile_id, profiler.stop())
@@ -0,0 +1,139 @@
+"""Per-user rate limiting for expensive endpoints.
+
+`rate_limit(scope, limit, window)` builds a FastAPI dependency that counts
+requests per `user_id` (from `get_current_user`) in fixed windows and rejects
+the excess with 429 and a `Retry-After` header.
+
+Counters live in a `RateLimitBackend`:
+
+- `InMemoryRateLimitBackend`: per process (default)
+- `RedisRateLimitBackend`:    shared by every worker; needs the optional
+                              `redis` package and `RATE_LIMIT_REDIS_URL`
+
+Select one with `RATE_LIMIT_BACKEND`, or call `set_rate_limit_backend()`
+to plug in another implementation.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Protocol, Tuple
+
+from fastapi import Depends, HTTPException, status
+
+from app.core.config import settings
+from app.core.dependencies import get_current_user
+from app.models import User
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    remaining: int
+    retry_after: float
+
+
+class RateLimitBackend(Protocol):
+    def hit(self, key: str, limit: int, window: float) -> RateLimitResult:
+        """Count one request for *key*; at most *limit* are allowed per *window* seconds."""
+
+
+class InMemoryRateLimitBackend:
+    """Fixed-window counters held in this process."""
+
+    def __init__(self, *, max_keys: int = 100_000) -> None:
+        self._max_keys = max_keys
+        self._windows: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, limit: int, window: float) -> RateLimitResult:
+        now = time.time()
+        bucket = int(now // window)
+        with self._lock:
+            current_bucket, count = self._windows.get(key, (bucket, 0))
+            if current_bucket != bucket:
+                count = 0
+            count += 1
+            self._windows[key] = (bucket, count)
+            if len(self._windows) > self._max_keys:
+                # 지난 창의 카운터 정리
+                self._windows = {k: v for k, v in self._windows.items() if v[0] == bucket}
+        return _result(count, limit, window, now)
+
+
+class RedisRateLimitBackend:
+    """Fixed-window counters in Redis, shared by every API worker."""
+
+    def __init__(self, url: str, *, prefix: str = "ratelimit") -> None:
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis requires the optional 'redis' package") from e
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def hit(self, key: str, limit: int, window: float) -> RateLimitResult:
+        now = time.time()
+        redis_key = f"{self._prefix}:{key}:{int(now // window)}"
+        pipe = self._client.pipeline()
+        pipe.incr(redis_key)
+        pipe.expire(redis_key, math.ceil(window) + 1)
+        count, _ = pipe.execute()
+        return _result(int(count), limit, window, now)
+
+
+def _result(count: int, limit: int, window: float, now: float) -> RateLimitResult:
+    return RateLimitResult(
+        allowed=count <= limit,
+        remaining=max(0, limit - count),
+        retry_after=window - (now % window),
+    )
+
+
+def _default_backend() -> RateLimitBackend:
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        if not settings.RATE_LIMIT_REDIS_URL:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis requires RATE_LIMIT_REDIS_URL")
+        return RedisRateLimitBackend(settings.RATE_LIMIT_REDIS_URL)
+    return InMemoryRateLimitBackend()
+
+
+_backend: Optional[RateLimitBackend] = None
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    global _backend
+    if _backend is None:
+        _backend = _default_backend()
+    return _backend
+
+
+def set_rate_limit_backend(backend: RateLimitBackend) -> None:
+    """Replace the backend used by every `rate_limit` dependency."""
+
+    global _backend
+    _backend = backend
+
+
+def rate_limit(scope: str, limit: int, window: float = 60.0) -> Callable[..., User]:
+    """Dependency allowing *limit* requests per user per *window* seconds for *scope*.
+
+    Returns the current user, so routes can use it instead of `get_current_user`.
+    """
+
+    def dependency(current_user: User = Depends(get_current_user)) -> User:
+        if not settings.RATE_LIMIT_ENABLED:
+            return current_user
+        result = get_rate_limit_backend().hit(f"{scope}:{current_user.user_id}", limit, window)
+        if not result.allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests",
+                headers={"Retry-After": str(math.ceil(result.retry_after))},
+            )
+        return current_user
+
+    return dependency
@@ -1,4 +1,8 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional, Tuple
 
 import jwt
 from fastapi.security import OAuth2PasswordBearer
@@ -6,13 +10,76 @@ from passlib.context import CryptContext
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/token")
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """비밀번호가 해시와 일치하는지 확인"""
-    return pwd_context.verify(plain_password, hashed_password)
+class PasswordHasherBusy(Exception):
+    """해시 작업 대기열이 가득 찼을 때 발생하는 예외"""
+
+
+class PasswordHasher:
+    """bcrypt 해시/검증을 전용 스레드 풀에서 실행하는 비동기 래퍼
+
+    bcrypt는 연산 중 GIL을 해제하므로 스레드 풀만으로도 여러 코어를 사용할 수 있다.
+    실행 중이거나 대기 중인 작업 수가 `max_workers + max_pending`을 넘으면
+    `PasswordHasherBusy`를 발생시켜 로그인 폭주가 다른 엔드포인트를 막지 않도록 한다.
+    """
+
+    def __init__(
+        self, context: CryptContext, *, max_workers: int, max_pending: int
+    ) -> None:
+        self._context = context
+        self._max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="pwd-hash"
+        )
+        self._slots = threading.BoundedSemaphore(self._max_workers + max(0, max_pending))
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> "asyncio.Future[Any]":
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHasherBusy()
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _f: self._slots.release())
+        return asyncio.wrap_future(future)
+
+    async def hash(self, password: str) -> str:
+        """비밀번호 해시를 생성"""
+        return await self._submit(self._context.hash, password)
+
+    async def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """비밀번호를 검증하고, 해시 설정이 바뀌었다면 새 해시를 함께 반환"""
+        return await self._submit(
+            self._context.verify_and_update, plain_password, hashed_password
+        )
+
+    async def dummy_verify(self) -> None:
+        """존재하지 않는 사용자에 대해서도 동일한 검증 비용을 소모 (타이밍 공격 방지)"""
+        await self._submit(self._context.dummy_verify)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hasher = PasswordHasher(
+    pwd_context,
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
 
 
 def get_password_hash(password: str) -> str:
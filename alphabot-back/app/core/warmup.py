@@ -0,0 +1,155 @@
+"""Startup warm-up run from the application lifespan.
+
+Steps (a failure is logged and the next step runs):
+
+1. connection pool: open `STARTUP_WARM_CONNECTIONS` connections at once
+2. response models: finish pending Pydantic schema builds and the OpenAPI schema
+3. hot caches: table versions, stock autocomplete snapshot, embedder
+
+Workers wait a random 0..`STARTUP_JITTER_SECONDS` before starting so a fleet
+restarting together does not hit the database in lockstep. `WarmupState.ready`
+flips only once the database steps (`REQUIRED_STEPS`) have succeeded; until
+then the failed steps are retried with exponential backoff and
+`/health/ready` keeps answering 503. The other steps are best-effort.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+import typing
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set
+
+import anyio
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from sqlalchemy import text
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# DB에 닿지 못하면 준비 완료로 보고하지 않는 단계
+REQUIRED_STEPS = frozenset({"pool", "table_versions"})
+
+
+@dataclass
+class WarmupState:
+    ready: bool = False
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    # 단계 이름 -> 소요 시간(초), 실패한 단계는 오류 문자열
+    steps: Dict[str, object] = field(default_factory=dict)
+    attempts: int = 0
+
+    def succeeded(self, name: str) -> bool:
+        return isinstance(self.steps.get(name), float)
+
+
+def warm_pool(connections: int = settings.STARTUP_WARM_CONNECTIONS) -> None:
+    """Hold *connections* pooled connections at once (per engine) so the pool keeps them open."""
+
+    from app.db import engine, replica_engine
+
+    for target in {engine, replica_engine}:
+        with ExitStack() as stack:
+            for _ in range(max(0, connections)):
+                conn = stack.enter_context(target.connect())
+                conn.execute(text("SELECT 1"))
+
+
+def _models_in(annotation: object, found: Set[type]) -> None:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if annotation not in found:
+            found.add(annotation)
+            for model_field in annotation.model_fields.values():
+                _models_in(model_field.annotation, found)
+        return
+    for arg in typing.get_args(annotation):
+        _models_in(arg, found)
+
+
+def warm_response_models(app: FastAPI) -> int:
+    """Complete deferred Pydantic builds for every response model; returns the model count."""
+
+    models: Set[type] = set()
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.response_model is not None:
+            _models_in(route.response_model, models)
+    for model in models:
+        if not model.__pydantic_complete__:
+            model.model_rebuild()
+    app.openapi()
+    return len(models)
+
+
+def warm_table_versions() -> None:
+    from app.db import table_versions
+
+    table_versions.refresh()
+
+
+def warm_stock_suggest() -> None:
+    from app.db import SessionLocal
+    from app.services.stock_search import stock_suggest_index
+
+    stock_suggest_index.ensure_fresh(SessionLocal)
+
+
+def warm_embedder() -> None:
+    from app.services.embeddings import get_embedder
+
+    get_embedder()
+
+
+def run_warmup(app: FastAPI, state: WarmupState) -> bool:
+    """Run the warm-up steps that have not succeeded yet.
+
+    Marks *state* ready (and returns True) once every `REQUIRED_STEPS` step
+    has succeeded.
+    """
+
+    steps: List[tuple[str, Callable[[], object]]] = [
+        ("pool", warm_pool),
+        ("response_models", lambda: warm_response_models(app)),
+        ("table_versions", warm_table_versions),
+        ("stock_suggest", warm_stock_suggest),
+        ("embedder", warm_embedder),
+    ]
+    if state.started_at is None:
+        state.started_at = time.time()
+    state.attempts += 1
+    for name, step in steps:
+        if state.succeeded(name):
+            continue
+        started = time.perf_counter()
+        try:
+            step()
+            state.steps[name] = round(time.perf_counter() - started, 4)
+        except Exception as e:
+            logger.warning("warm-up step %s failed: %r", name, e)
+            state.steps[name] = repr(e)
+    if all(state.succeeded(name) for name in REQUIRED_STEPS):
+        state.finished_at = time.time()
+        state.ready = True
+    return state.ready
+
+
+async def warmup(app: FastAPI, state: WarmupState) -> None:
+    """Jittered background warm-up; blocking steps run in a worker thread.
+
+    Retries the failed steps with exponential backoff until the database
+    steps succeed.
+    """
+
+    await asyncio.sleep(random.uniform(0, max(0.0, settings.STARTUP_JITTER_SECONDS)))
+    delay = settings.STARTUP_RETRY_SECONDS
+    while not await anyio.to_thread.run_sync(run_warmup, app, state):
+        logger.warning("warm-up not ready after attempt %d; retrying in %.1fs", state.attempts, delay)
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, settings.STARTUP_RETRY_MAX_SECONDS)
@@ -1,26 +1,50 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, List, Mapping, Optional, Sequence, Tuple, Type, TypeVar, Union
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from sqlalchemy import and_, bindparam, delete, insert, inspect, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
-from app.models import Base 
+from app.models import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
+def _as_dict(obj_in: Union[BaseModel, Dict[str, Any]], *, exclude_unset: bool = False) -> Dict[str, Any]:
+    """스키마 또는 dict를 컬럼 값 dict로 변환 (datetime 등은 원래 타입 유지)"""
+    if isinstance(obj_in, dict):
+        return dict(obj_in)
+    return obj_in.model_dump(exclude_unset=exclude_unset)
+
+
+def _commit_keep_loaded(db: Session) -> None:
+    """커밋 후 객체를 만료시키지 않아 객체별 재조회(refresh) 쿼리를 피한다"""
+    expire_on_commit = db.expire_on_commit
+    db.expire_on_commit = False
+    try:
+        db.commit()
+    finally:
+        db.expire_on_commit = expire_on_commit
+
+
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """기본 CRUD 연산 클래스"""
 
     def __init__(self, model: Type[ModelType]):
         """
         CRUD object with default methods to Create, Read, Update, Delete (CRUD).
-        
+
         **Parameters**
         * `model`: A SQLAlchemy model class
         * `schema`: A Pydantic model (schema) class
         """
         self.model = model
+        mapper = inspect(model)
+        self._columns = frozenset(attr.key for attr in mapper.column_attrs)
+        self._column_names = {attr.key: attr.columns[0].name for attr in mapper.column_attrs}
+        self._pk_column = mapper.primary_key[0]
+        self._pk = mapper.get_property_by_column(self._pk_column).key
 
     def get(self, db: Session, id: Any) -> Optional[ModelType]:
         """ID로 단일 객체 조회"""
@@ -53,16 +77,12 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         obj_in: Union[UpdateSchemaType, Dict[str, Any]]
     ) -> ModelType:
         """객체 업데이트"""
-        obj_data = jsonable_encoder(db_obj)
-        if isinstance(obj_in, dict):
-            update_data = obj_in
-        else:
-            update_data = obj_in.dict(exclude_unset=True)
-        
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
-        
+        update_data = _as_dict(obj_in, exclude_unset=True)
+
+        for field, value in update_data.items():
+            if field in self._columns:
+                setattr(db_obj, field, value)
+
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
@@ -73,4 +93,154 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         obj = db.query(self.model).get(id)
         db.delete(obj)
         db.commit()
-        return obj
\ No newline at end of file
+        return obj
+
+    # --------- 대량(bulk) 연산: 한 문장 실행 + 한 번의 커밋 ---------
+
+    def create_many(
+        self, db: Session, *, objs_in: Sequence[CreateSchemaType]
+    ) -> List[ModelType]:
+        """여러 객체를 INSERT ... RETURNING 한 번으로 생성
+
+        반환 순서는 입력 순서와 다를 수 있다.
+        """
+        rows = [self._column_values(_as_dict(obj_in)) for obj_in in objs_in]
+        if not rows:
+            return []
+        db_objs = list(db.scalars(insert(self.model).returning(self.model), rows))
+        _commit_keep_loaded(db)
+        return db_objs
+
+    def update_many(
+        self,
+        db: Session,
+        *,
+        objs_in: Mapping[Any, Union[UpdateSchemaType, Dict[str, Any]]]
+    ) -> int:
+        """기본 키 -> 변경 내용 매핑을 받아 executemany UPDATE로 수정
+
+        변경할 컬럼 조합마다 UPDATE 한 문장을 실행하며, 실제로 일치한 행 수를 반환한다
+        (존재하지 않는 기본 키는 건너뛴다).
+        """
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for pk, obj_in in objs_in.items():
+            values = self._column_values(_as_dict(obj_in, exclude_unset=True))
+            values.pop(self._pk, None)
+            if values:
+                params = {f"b_{key}": value for key, value in values.items()}
+                groups.setdefault(tuple(sorted(values)), []).append({"b_pk": pk, **params})
+        if not groups:
+            return 0
+
+        table = self.model.__table__
+        updated = 0
+        for keys, params in groups.items():
+            stmt = (
+                update(table)
+                .where(self._pk_column == bindparam("b_pk"))
+                .values({table.c[self._column_names[key]]: bindparam(f"b_{key}") for key in keys})
+            )
+            updated += db.execute(stmt, params).rowcount
+        db.commit()
+        return updated
+
+    def delete_many(self, db: Session, *, ids: Sequence[Any]) -> int:
+        """기본 키 목록에 해당하는 객체를 DELETE 한 번으로 삭제
+
+        삭제된 행 수를 반환한다. ORM cascade 대신 DB의 ON DELETE 제약을 따른다.
+        """
+        if not ids:
+            return 0
+        result = db.execute(
+            delete(self.model)
+            .where(self._pk_column.in_(list(ids)))
+            .execution_options(synchronize_session="fetch")
+        )
+        db.commit()
+        return result.rowcount
+
+    def upsert_many(
+        self,
+        db: Session,
+        *,
+        objs_in: Sequence[CreateSchemaType],
+        index_elements: Sequence[str]
+    ) -> List[ModelType]:
+        """INSERT ... ON CONFLICT DO UPDATE ... RETURNING 한 번으로 생성 또는 수정
+
+        `index_elements`는 충돌 판정에 사용할 유니크 컬럼 목록이다. ON CONFLICT가 없는 DB에서는
+        기존 행 조회 후 수정/추가로 대신한다.
+        """
+        rows = [self._column_values(_as_dict(obj_in)) for obj_in in objs_in]
+        if not rows:
+            return []
+
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            stmt = postgresql.insert(self.model)
+        elif dialect == "sqlite":
+            stmt = sqlite.insert(self.model)
+        else:
+            db_objs = self._upsert_by_select(db, rows, index_elements)
+            _commit_keep_loaded(db)
+            return db_objs
+
+        stmt = stmt.values(rows)
+        update_columns = {
+            key: stmt.excluded[key]
+            for key in rows[0]
+            if key not in index_elements and key != self._pk
+        }
+        if update_columns:
+            stmt = stmt.on_conflict_do_update(index_elements=list(index_elements), set_=update_columns)
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=list(index_elements))
+
+        db_objs = list(
+            db.scalars(
+                stmt.returning(self.model),
+                execution_options={"populate_existing": True},
+            )
+        )
+        _commit_keep_loaded(db)
+        return db_objs
+
+    def _upsert_by_select(
+        self, db: Session, rows: List[Dict[str, Any]], index_elements: Sequence[str]
+    ) -> List[ModelType]:
+        """ON CONFLICT가 없는 DB용: 기존 행을 한 번에 조회한 뒤 수정하거나 새로 추가
+
+        조회와 INSERT 사이에 다른 트랜잭션이 같은 키를 넣으면 유니크 제약 오류가 난다.
+        """
+        def key_of(values: Mapping[str, Any]) -> Tuple[Any, ...]:
+            return tuple(values[key] for key in index_elements)
+
+        columns = [getattr(self.model, key) for key in index_elements]
+        keys = {key_of(row) for row in rows}
+        if len(columns) == 1:
+            condition = columns[0].in_([key[0] for key in keys])
+        else:
+            condition = or_(*(and_(*(c == v for c, v in zip(columns, key))) for key in keys))
+        existing = {
+            tuple(getattr(obj, key) for key in index_elements): obj
+            for obj in db.scalars(select(self.model).where(condition))
+        }
+
+        db_objs = []
+        for row in rows:
+            obj = existing.get(key_of(row))
+            if obj is None:
+                obj = existing[key_of(row)] = self.model(**row)
+                db.add(obj)
+            else:
+                for key, value in row.items():
+                    if key not in index_elements and key != self._pk:
+                        setattr(obj, key, value)
+            db_objs.append(obj)
+        db.flush()
+        # 같은 키가 입력에 여러 번 있으면 마지막 값이 반영된 객체 하나만 반환
+        return list({id(obj): obj for obj in db_objs}.values())
+
+    def _column_values(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """모델 컬럼에 해당하는 값만 남긴다"""
+        return {key: value for key, value in data.items() if key in self._columns}
@@ -1,7 +1,8 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from app.crud.crud_base import CRUDBase
-from app.models.category import Category
+from app.models import Category
 from app.schemas.category import CategoryCreate, CategoryUpdate
 
 
@@ -74,9 +75,43 @@ class CRUDCategory(CRUDBase[Category, CategoryCreate, CategoryUpdate]):
     ) -> List[Category]:
         """카테고리 검색"""
         return db.query(Category).filter(
-            Category.title.contains(search_term)
+            self._title_filter(search_term)
         ).offset(skip).limit(limit).all()
 
+    def search_categories_with_total(
+        self,
+        db: Session,
+        *,
+        search_term: str,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[Category], int]:
+        """카테고리 검색 결과 페이지와 전체 검색 결과 수를 함께 조회
+
+        `COUNT(*) OVER()`로 페이지 조회와 동시에 전체 개수를 계산한다.
+        요청한 페이지가 결과 범위를 벗어나 행이 없을 때만 별도의 count 쿼리를 실행한다.
+        """
+        title_filter = self._title_filter(search_term)
+        rows = (
+            db.query(Category, func.count().over().label("total"))
+            .filter(title_filter)
+            .order_by(Category.category_id)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        if skip == 0:
+            return [], 0
+        total = db.query(func.count(Category.category_id)).filter(title_filter).scalar()
+        return [], total or 0
+
+    @staticmethod
+    def _title_filter(search_term: str):
+        """제목 부분 일치 조건 (PostgreSQL에서는 pg_trgm GIN 인덱스를 사용)"""
+        return Category.title.contains(search_term, autoescape=True)
+
 
 # 카테고리 CRUD 인스턴스
 category_crud = CRUDCategory(Category)
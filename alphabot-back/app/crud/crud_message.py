@@ -0,0 +1,155 @@
+import html
+import re
+from datetime import datetime
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.orm import Session
+
+from app.crud.crud_base import CRUDBase
+from app.models import Bookmark, Chat, DeletedMessage, Message
+from app.schemas.chats import MessageCreate
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+# DB는 일치 구간을 사용자 입력에 나올 일이 없는 사용 영역(private use) 문자로 감싸고,
+# 본문을 HTML 이스케이프한 뒤에 이 문자만 <mark> 태그로 바꾼다 (저장형 XSS 방지)
+_SENTINEL_START = "\ue000"
+_SENTINEL_STOP = "\ue001"
+_HEADLINE_OPTIONS = (
+    f"StartSel={_SENTINEL_START}, StopSel={_SENTINEL_STOP}, MaxFragments=2, MaxWords=20, MinWords=5"
+)
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# score는 클수록 관련도가 높으며, (score, messages_id) 내림차순으로 키셋 페이지네이션한다
+_POSTGRES_SEARCH = """
+SELECT m.messages_id, m.chat_id, m.created_at,
+       ts_rank_cd(m.content_tsv, q)::float8 AS score,
+       ts_headline('simple', m.content, q, :headline_options) AS snippet
+FROM messages AS m, websearch_to_tsquery('simple', :query) AS q
+WHERE m.user_id = :user_id
+  AND m.content_tsv @@ q
+  {keyset}
+ORDER BY score DESC, m.messages_id DESC
+LIMIT :limit
+"""
+
+_POSTGRES_KEYSET = (
+    "AND (ts_rank_cd(m.content_tsv, q)::float8 < :before_score "
+    "OR (ts_rank_cd(m.content_tsv, q)::float8 = :before_score AND m.messages_id < :before_id))"
+)
+
+_SQLITE_SEARCH = """
+SELECT m.messages_id, m.chat_id, m.created_at,
+       -bm25(messages_fts) AS score,
+       snippet(messages_fts, 0, :start_sel, :stop_sel, '…', 16) AS snippet
+FROM messages_fts JOIN messages AS m ON m.messages_id = messages_fts.rowid
+WHERE messages_fts MATCH :query
+  AND m.user_id = :user_id
+  {keyset}
+ORDER BY score DESC, m.messages_id DESC
+LIMIT :limit
+"""
+
+_SQLITE_KEYSET = (
+    "AND (-bm25(messages_fts) < :before_score "
+    "OR (-bm25(messages_fts) = :before_score AND m.messages_id < :before_id))"
+)
+
+
+class MessageSearchRow(NamedTuple):
+    messages_id: int
+    chat_id: int
+    created_at: datetime
+    score: float
+    snippet: str
+
+
+def highlight_html(snippet: str) -> str:
+    """DB가 만든 스니펫을 HTML 이스케이프하고 일치 구간만 <mark>로 감싼다"""
+    return (
+        html.escape(snippet)
+        .replace(_SENTINEL_START, HIGHLIGHT_START)
+        .replace(_SENTINEL_STOP, HIGHLIGHT_STOP)
+    )
+
+
+def _fts5_query(query: str) -> str:
+    """사용자 입력을 FTS5 문법 오류가 나지 않는 AND 검색식으로 변환"""
+    return " ".join(f'"{word}"' for word in _WORD_RE.findall(query))
+
+
+class CRUDMessage(CRUDBase[Message, MessageCreate, MessageCreate]):
+    """메시지 CRUD 연산"""
+
+    def search_messages(
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        query: str,
+        limit: int = 20,
+        before_score: Optional[float] = None,
+        before_id: Optional[int] = None
+    ) -> Tuple[List[MessageSearchRow], bool]:
+        """사용자의 메시지를 전문 검색하여 (관련도순 결과, 다음 페이지 존재 여부)를 반환
+
+        snippet은 HTML 이스케이프된 본문이며, 일치 구간만 <mark>...</mark>로 감싸져 있다.
+        """
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            sql, keyset, search_query = _POSTGRES_SEARCH, _POSTGRES_KEYSET, query
+            highlight = {"headline_options": _HEADLINE_OPTIONS}
+        elif dialect == "sqlite":
+            sql, keyset, search_query = _SQLITE_SEARCH, _SQLITE_KEYSET, _fts5_query(query)
+            highlight = {"start_sel": _SENTINEL_START, "stop_sel": _SENTINEL_STOP}
+        else:
+            raise NotImplementedError(f"message search is not supported for dialect {dialect!r}")
+
+        if not search_query.strip():
+            return [], False
+
+        params = {"query": search_query, "user_id": user_id, "limit": limit + 1, **highlight}
+        if before_score is not None and before_id is not None:
+            params.update(before_score=before_score, before_id=before_id)
+        else:
+            keyset = ""
+
+        rows = [
+            MessageSearchRow(row.messages_id, row.chat_id, row.created_at, row.score, highlight_html(row.snippet))
+            for row in db.execute(text(sql.format(keyset=keyset)), params)
+        ]
+        return rows[:limit], len(rows) > limit
+
+    def purge_chats(self, db: Session, *, chat_ids: Sequence[int]) -> int:
+        """채팅과 그 메시지·북마크를 테이블별 DELETE 한 번씩으로 삭제 (커밋은 호출자가 함)
+
+        ORM cascade처럼 행마다 DELETE를 보내지 않는다. 지운 메시지 id는 deleted_messages에
+        남겨 API의 벡터 인덱스 동기화가 인덱스에서도 제거하게 한다. 삭제된 메시지 수를 반환한다.
+        """
+        if not chat_ids:
+            return 0
+        chat_ids = list(chat_ids)
+        message_ids = select(Message.messages_id).where(Message.chat_id.in_(chat_ids))
+        db.execute(insert(DeletedMessage).from_select(["messages_id"], message_ids))
+        db.execute(
+            delete(Bookmark)
+            .where(Bookmark.messages_id.in_(message_ids))
+            .execution_options(synchronize_session=False)
+        )
+        result = db.execute(
+            delete(Message)
+            .where(Message.chat_id.in_(chat_ids))
+            .execution_options(synchronize_session=False)
+        )
+        db.execute(
+            delete(Chat)
+            .where(Chat.chat_id.in_(chat_ids))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+
+# 메시지 CRUD 인스턴스
+message_crud = CRUDMessage(Message)
@@ -2,6 +2,16 @@
 
 from app.models import Base
 
-from .session import SessionLocal, engine, get_db
+from . import fulltext  # noqa: F401  (messages 전문 검색 DDL 등록)
+from .session import (
+    ReadYourWritesMiddleware, ReplicaSessionLocal, SessionLocal, engine, get_db, read_from_primary,
+    replica_engine, requires_primary,
+)
+from .versioning import table_versions
 
-__all__ = ("engine", "SessionLocal", "get_db", "Base")
+table_versions.bind(engine)
+
+__all__ = (
+    "engine", "replica_engine", "SessionLocal", "ReplicaSessionLocal", "get_db", "requires_primary",
+    "read_from_primary", "ReadYourWritesMiddleware", "Base", "table_versions",
+)
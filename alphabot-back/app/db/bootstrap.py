@@ -0,0 +1,103 @@
+"""Explicit schema bootstrap, run once per deploy instead of on every app import.
+
+Creates missing tables of both model sets:
+
+- `app.models` (API tables, `table_versions`, message full-text search DDL;
+  on PostgreSQL `messages` is created partitioned by month, see
+  `app.db.partitions`)
+- `app.models.models` (collector tables in the `public` schema; PostgreSQL only,
+  SQLite has no `public` schema)
+
+Existing tables are left untouched (`CREATE TABLE` only for missing ones).
+
+Usage (from `alphabot-back/`):
+    python -m app.db.bootstrap            # create missing tables
+    python -m app.db.bootstrap --check    # list missing tables, exit 1 if any
+    python -m app.db.bootstrap --partition-messages
+                                          # also convert an existing unpartitioned
+                                          # messages table (PostgreSQL)
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import List
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+
+from app.db import engine
+from app.db.fulltext import ensure_message_search
+from app.db.partitions import create_partitioned_messages, ensure_message_partitions, partition_messages
+from app.models import Base as ApiBase
+from app.models import Message
+from app.models.models import Base as CollectorBase
+
+
+def _collector_supported(bind: Engine) -> bool:
+    return bind.dialect.name == "postgresql"
+
+
+def missing_tables(bind: Engine) -> List[str]:
+    inspector = inspect(bind)
+    missing = [
+        table.name for table in ApiBase.metadata.sorted_tables
+        if not inspector.has_table(table.name, schema=table.schema)
+    ]
+    if _collector_supported(bind):
+        missing += [
+            f"{table.schema}.{table.name}" for table in CollectorBase.metadata.sorted_tables
+            if not inspector.has_table(table.name, schema=table.schema)
+        ]
+    return missing
+
+
+def create_schema(bind: Engine, *, partition_existing: bool = False) -> List[str]:
+    """Create missing tables and search DDL; returns the tables that were missing.
+
+    With *partition_existing*, an existing unpartitioned `messages` table is
+    converted as well (PostgreSQL only).
+    """
+
+    missing = missing_tables(bind)
+    with bind.begin() as connection:
+        if bind.dialect.name == "postgresql":
+            ApiBase.metadata.create_all(
+                connection, tables=[t for t in ApiBase.metadata.sorted_tables if t is not Message.__table__]
+            )
+            if Message.__tablename__ in missing:
+                create_partitioned_messages(connection)
+            elif partition_existing and partition_messages(connection):
+                print("[bootstrap] converted messages to a partitioned table")
+            ensure_message_partitions(connection)
+        else:
+            ApiBase.metadata.create_all(connection)
+        # 이미 존재하던 messages 테이블에도 전문 검색 컬럼/인덱스를 적용
+        ensure_message_search(connection, rebuild=True)
+        if _collector_supported(bind):
+            CollectorBase.metadata.create_all(connection)
+        else:
+            print(f"[bootstrap] skipping collector tables: dialect {bind.dialect.name!r} has no 'public' schema")
+    return missing
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Create missing database tables")
+    parser.add_argument("--check", action="store_true", help="Only report missing tables (exit 1 if any)")
+    parser.add_argument("--partition-messages", action="store_true",
+                        help="Convert an existing unpartitioned messages table (PostgreSQL)")
+    args = parser.parse_args(argv or sys.argv[1:])
+
+    if args.check:
+        missing = missing_tables(engine)
+        for name in missing:
+            print(f"missing: {name}")
+        sys.exit(1 if missing else 0)
+
+    created = create_schema(engine, partition_existing=args.partition_messages)
+    print(f"[bootstrap] created {len(created)} table(s): {', '.join(created) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,41 +1,66 @@
-from sqlalchemy import create_engine
+from functools import lru_cache
+
+from sqlalchemy.engine import URL, Engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.ext.declarative import declarative_base
 
-from dotenv import load_dotenv
-import os
-
-#.env 파일 로드
-load_dotenv()
-
-user = os.getenv("DB_USER")
-passwd = os.getenv("DB_PASSWORD")
-host = os.getenv("DB_HOST")
-port = os.getenv("DB_PORT")
-db = os.getenv("DB_NAME")
-
-#instance_connection_name = os.environ.get("INSTANCE_CONNECTION_NAME")
+from app.core.config import settings
+from app.db.engines import get_engine as _shared_engine
 
 #--------------------------배포용--------------------------------
-# Unix 소켓 경로 
-#unix_socket_path = f"/cloudsql/{instance_connection_name}"
-
-#DB_URL = f"mysql+pymysql://{user}:{passwd}@/{db}?unix_socket={unix_socket_path}&charset=utf8mb4"
+# Cloud SQL 등 URL을 직접 지정할 때는 COLLECTOR_DATABASE_URL 사용
+#COLLECTOR_DATABASE_URL=mysql+pymysql://{user}:{passwd}@/{db}?unix_socket=/cloudsql/{instance_connection_name}&charset=utf8mb4
 #--------------------------배포용--------------------------------
 
 #--------------------------로컬 환경에서 사용--------------------------------
+# DB_USER / DB_PASSWORD / DB_HOST / DB_PORT / DB_NAME (.env)
+#----------------------------------------------------------------------------
 
-DB_URL = f"postgresql+psycopg://{user}:{passwd}@{host}:{port}/{db}"
 
-#----------------------------------------------------------------------------
+def collector_database_url() -> str:
+    """수집기 DB URL (Settings 기준)"""
+    if settings.collector_database_url:
+        return settings.collector_database_url
+    return URL.create(
+        "postgresql+psycopg",
+        username=settings.DB_USER,
+        password=settings.DB_PASSWORD,
+        host=settings.DB_HOST,
+        port=settings.DB_PORT,
+        database=settings.DB_NAME,
+    ).render_as_string(hide_password=False)
+
+
+DB_URL = collector_database_url()
 
-engine = create_engine(DB_URL, echo=False, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False,autoflush=False,bind=engine)
 Base = declarative_base()
 
+
+# 엔진은 처음 세션을 만들 때 생성 (import만으로는 DB 드라이버 로딩/연결 설정을 하지 않음)
+# API와 같은 팩토리(app.db.engines)를 사용하므로 같은 DB를 가리키면 커넥션 풀도 공유
+def get_engine() -> Engine:
+    return _shared_engine(DB_URL)
+
+
+@lru_cache(maxsize=1)
+def _session_factory() -> sessionmaker:
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+
+
+def SessionLocal(**kwargs) -> Session:
+    return _session_factory()(**kwargs)
+
+
+def __getattr__(name: str):
+    # 기존 `from app.db.database import engine` 호환
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_db():
     db: Session = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
@@ -0,0 +1,165 @@
+"""Engine factory shared by the API (`app.db.session`) and the collector (`app.db.database`).
+
+Pool and driver options come from `Settings` (`DB_POOL_*`, `DB_PGBOUNCER`,
+`DB_PREPARE_THRESHOLD`). `get_engine(url)` returns one engine per URL per
+process, so code paths that reach the same database share a single pool.
+
+Every engine gets a `PoolMetrics` collector (checkouts, new connections,
+invalidations, checkout timeouts, time spent waiting for a free connection)
+readable through `pool_metrics()`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict
+
+from sqlalchemy import create_engine, event
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import Settings, settings as default_settings
+
+
+@dataclass
+class PoolMetrics:
+    checkouts: int = 0
+    checkins: int = 0
+    connects: int = 0
+    invalidations: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def add(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def observe_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.wait_seconds_total += seconds
+            if seconds > self.wait_seconds_max:
+                self.wait_seconds_max = seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return asdict(self)
+
+
+class MeasuredQueuePool(QueuePool):
+    """QueuePool that records how long checkouts wait for (or open) a connection."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except sa_exc.TimeoutError:
+            self.metrics.add("timeouts")
+            raise
+        finally:
+            self.metrics.observe_wait(time.perf_counter() - started)
+
+    def recreate(self) -> "MeasuredQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+_engines: Dict[str, Engine] = {}
+_metrics: Dict[str, PoolMetrics] = {}
+_lock = threading.Lock()
+
+
+def engine_options(database_url: str, config: Settings = default_settings) -> Dict[str, Any]:
+    """Return `create_engine` keyword arguments for *database_url*."""
+
+    url = make_url(database_url)
+    kwargs: Dict[str, Any] = {"echo": False, "pool_pre_ping": config.DB_POOL_PRE_PING}
+    if url.get_backend_name() == "sqlite":
+        # SQLite는 단일 스레드 접근만 허용하므로 FastAPI 개발 서버용 예외 처리.
+        # 풀 크기 설정은 SQLite 기본 풀(파일: QueuePool, 메모리: SingletonThreadPool)에 맡김
+        kwargs["connect_args"] = {"check_same_thread": False}
+        return kwargs
+
+    kwargs.update(
+        poolclass=MeasuredQueuePool,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_recycle=config.DB_POOL_RECYCLE,
+        pool_timeout=config.DB_POOL_TIMEOUT,
+        pool_use_lifo=True,
+    )
+    if url.get_backend_name() == "postgresql" and url.get_driver_name() == "psycopg":
+        # pgbouncer(transaction 모드)는 서버 측 prepared statement를 커넥션 간에 공유하지 못함
+        prepare_threshold = None if config.DB_PGBOUNCER else config.DB_PREPARE_THRESHOLD
+        kwargs["connect_args"] = {"prepare_threshold": prepare_threshold}
+    return kwargs
+
+
+def instrument_engine(engine: Engine) -> PoolMetrics:
+    """Attach pool event counters to *engine* and return them."""
+
+    pool = engine.pool
+    metrics = pool.metrics if isinstance(pool, MeasuredQueuePool) else PoolMetrics()
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        metrics.add("checkouts")
+
+    @event.listens_for(engine, "checkin")
+    def _checkin(dbapi_connection, connection_record) -> None:
+        metrics.add("checkins")
+
+    @event.listens_for(engine, "connect")
+    def _connect(dbapi_connection, connection_record) -> None:
+        metrics.add("connects")
+
+    @event.listens_for(engine, "invalidate")
+    def _invalidate(dbapi_connection, connection_record, exception) -> None:
+        metrics.add("invalidations")
+
+    return metrics
+
+
+def create_app_engine(database_url: str, config: Settings = default_settings) -> Engine:
+    """Create a new engine without registering it (prefer `get_engine` to share pools)."""
+
+    return create_engine(database_url, **engine_options(database_url, config))
+
+
+def get_engine(database_url: str) -> Engine:
+    """Return the process-wide engine for *database_url*, creating it on first use."""
+
+    engine = _engines.get(database_url)
+    if engine is not None:
+        return engine
+    with _lock:
+        engine = _engines.get(database_url)
+        if engine is None:
+            engine = create_app_engine(database_url)
+            _metrics[database_url] = instrument_engine(engine)
+            _engines[database_url] = engine
+    return engine
+
+
+def pool_metrics() -> Dict[str, Dict[str, Any]]:
+    """Pool counters and current pool state for every engine created by `get_engine`."""
+
+    result: Dict[str, Dict[str, Any]] = {}
+    for database_url, engine in list(_engines.items()):
+        pool = engine.pool
+        stats = _metrics[database_url].snapshot()
+        if isinstance(pool, QueuePool):
+            stats.update(size=pool.size(), checked_out=pool.checkedout(), overflow=pool.overflow())
+        result[engine.url.render_as_string(hide_password=True)] = stats
+    return result
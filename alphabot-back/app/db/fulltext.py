@@ -0,0 +1,59 @@
+"""Full-text search DDL for the `messages` table.
+
+PostgreSQL: a generated `content_tsv tsvector` column (the `simple`
+configuration, so Korean and English text are both split on whitespace and
+punctuation) with a GIN index.
+
+SQLite: an external-content FTS5 table `messages_fts` kept in sync by
+triggers, used for local development and tests.
+
+The DDL runs right after `messages` is created; `ensure_message_search()` applies
+it idempotently to existing databases.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+
+from app.models import Message
+
+_POSTGRES_DDL = (
+    "ALTER TABLE messages ADD COLUMN IF NOT EXISTS content_tsv tsvector "
+    "GENERATED ALWAYS AS (to_tsvector('simple', content)) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_messages_content_tsv ON messages USING gin (content_tsv)",
+)
+
+_SQLITE_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5("
+    "content, content='messages', content_rowid='messages_id', tokenize='unicode61')",
+    "CREATE TRIGGER IF NOT EXISTS messages_fts_ai AFTER INSERT ON messages BEGIN "
+    "INSERT INTO messages_fts(rowid, content) VALUES (new.messages_id, new.content); END",
+    "CREATE TRIGGER IF NOT EXISTS messages_fts_ad AFTER DELETE ON messages BEGIN "
+    "INSERT INTO messages_fts(messages_fts, rowid, content) "
+    "VALUES ('delete', old.messages_id, old.content); END",
+    "CREATE TRIGGER IF NOT EXISTS messages_fts_au AFTER UPDATE OF content ON messages BEGIN "
+    "INSERT INTO messages_fts(messages_fts, rowid, content) "
+    "VALUES ('delete', old.messages_id, old.content); "
+    "INSERT INTO messages_fts(rowid, content) VALUES (new.messages_id, new.content); END",
+)
+
+
+def ensure_message_search(connection: Connection, *, rebuild: bool = False) -> None:
+    """Create the full-text column/index (PostgreSQL) or FTS5 table (SQLite)."""
+
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        for statement in _POSTGRES_DDL:
+            connection.exec_driver_sql(statement)
+    elif dialect == "sqlite":
+        for statement in _SQLITE_DDL:
+            connection.exec_driver_sql(statement)
+        if rebuild:
+            # 트리거 생성 이전에 저장된 메시지까지 색인
+            connection.exec_driver_sql("INSERT INTO messages_fts(messages_fts) VALUES ('rebuild')")
+
+
+@event.listens_for(Message.__table__, "after_create")
+def _create_message_search(target, connection: Connection, **kw) -> None:
+    ensure_message_search(connection)
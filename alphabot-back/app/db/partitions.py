@@ -0,0 +1,170 @@
+"""Monthly range partitioning of the `messages` table by `created_at`.
+
+PostgreSQL: `messages` is a partitioned table (`PARTITION BY RANGE
+(created_at)`, primary key `(messages_id, created_at)`) with one partition per
+month named `messages_pYYYY_MM` and a `messages_default` partition for rows
+outside the created ranges. `ensure_message_partitions()` creates the
+partitions up to `MESSAGE_PARTITION_MONTHS_AHEAD` months ahead and drops
+past months the archiver has emptied, so autovacuum only ever works on the
+recent partitions. `partition_messages()` converts an existing unpartitioned
+table in one transaction.
+
+SQLite: no partitioning; `messages` stays a single table and its size is
+bounded by the archiver alone. Every function here is a no-op.
+"""
+
+from __future__ import annotations
+
+import warnings
+from datetime import date, datetime
+from typing import List, Optional
+
+from sqlalchemy import MetaData, PrimaryKeyConstraint, Table, inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import SAWarning
+
+from app.core.config import settings
+from app.db.fulltext import ensure_message_search
+from app.models import Chat, Message, User
+
+PARENT = Message.__tablename__
+DEFAULT_PARTITION = f"{PARENT}_default"
+_LEGACY = f"{PARENT}_legacy"
+
+
+def _supported(connection: Connection) -> bool:
+    return connection.dialect.name == "postgresql"
+
+
+def _month(value: date, offset: int = 0) -> date:
+    index = value.year * 12 + value.month - 1 + offset
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT}_p{month.year:04d}_{month.month:02d}"
+
+
+def is_partitioned(connection: Connection) -> bool:
+    if not _supported(connection):
+        return False
+    return connection.exec_driver_sql(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%(name)s))",
+        {"name": PARENT},
+    ).scalar()
+
+
+def _partitioned_table() -> Table:
+    """A copy of `Message.__table__` with the partition key in its primary key."""
+
+    metadata = MetaData()
+    # FK 대상 테이블도 같은 MetaData에 있어야 DDL을 컴파일할 수 있다
+    User.__table__.to_metadata(metadata)
+    Chat.__table__.to_metadata(metadata)
+    table = Message.__table__.to_metadata(metadata)
+    with warnings.catch_warnings():
+        # 모델의 단일 기본 키를 의도적으로 교체하므로 불일치 경고는 무시
+        warnings.simplefilter("ignore", SAWarning)
+        table.append_constraint(PrimaryKeyConstraint("messages_id", "created_at", name=f"{PARENT}_pkey"))
+    table.dialect_options["postgresql"]["partition_by"] = "RANGE (created_at)"
+    return table
+
+
+def _existing_partitions(connection: Connection) -> List[str]:
+    return list(connection.exec_driver_sql(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = to_regclass(%(name)s) ORDER BY c.relname",
+        {"name": PARENT},
+    ).scalars())
+
+
+def _create_partition(connection: Connection, month: date) -> None:
+    connection.exec_driver_sql(
+        f"CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF {PARENT} "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_month(month, 1).isoformat()}')"
+    )
+
+
+def create_partitioned_messages(connection: Connection, *, first_month: Optional[date] = None) -> None:
+    """Create `messages` as a partitioned table with its partitions and search DDL."""
+
+    table = _partitioned_table()
+    table.create(connection, checkfirst=True)
+    connection.exec_driver_sql(f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF {PARENT} DEFAULT")
+    ensure_message_partitions(connection, first_month=first_month)
+    ensure_message_search(connection)
+
+
+def ensure_message_partitions(
+    connection: Connection,
+    *,
+    months_ahead: int = settings.MESSAGE_PARTITION_MONTHS_AHEAD,
+    first_month: Optional[date] = None,
+) -> List[str]:
+    """Create monthly partitions from *first_month* (default: this month) up to
+    *months_ahead* months ahead; returns the names of the new partitions."""
+
+    if not is_partitioned(connection):
+        return []
+    existing = set(_existing_partitions(connection))
+    current = _month(datetime.now().date())
+    month = _month(first_month) if first_month is not None else current
+    created = []
+    while month <= _month(current, months_ahead):
+        name = partition_name(month)
+        if name not in existing:
+            # DEFAULT 파티션에 이미 해당 월의 행이 있으면 PostgreSQL이 생성을 거부하므로
+            # 미리 만들어 두는 것이 원칙 (월말 전 실행되는 archiver가 담당)
+            _create_partition(connection, month)
+            created.append(name)
+        month = _month(month, 1)
+    return created
+
+
+def drop_empty_partitions(connection: Connection, *, before: Optional[date] = None) -> List[str]:
+    """Drop monthly partitions older than *before* (default: this month) that hold no rows."""
+
+    if not is_partitioned(connection):
+        return []
+    cutoff = partition_name(_month(before or datetime.now().date()))
+    dropped = []
+    for name in _existing_partitions(connection):
+        if name == DEFAULT_PARTITION or name >= cutoff:
+            continue
+        if connection.exec_driver_sql(f"SELECT EXISTS (SELECT 1 FROM {name})").scalar():
+            continue
+        connection.exec_driver_sql(f"DROP TABLE {name}")
+        dropped.append(name)
+    return dropped
+
+
+def partition_messages(connection: Connection) -> bool:
+    """Convert an unpartitioned `messages` table (or create it); returns True if it changed.
+
+    Rows are copied with one `INSERT ... SELECT` inside the caller's
+    transaction, so run it during a maintenance window.
+    """
+
+    if not _supported(connection) or is_partitioned(connection):
+        return False
+    if not inspect(connection).has_table(PARENT):
+        create_partitioned_messages(connection)
+        return True
+
+    # 파티션 테이블에는 messages_id 단독 FK를 걸 수 없으므로 북마크 FK를 먼저 제거
+    connection.exec_driver_sql("ALTER TABLE bookmark DROP CONSTRAINT IF EXISTS bookmark_messages_id_fkey")
+    connection.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_bookmark_messages_id ON bookmark (messages_id)"
+    )
+    connection.exec_driver_sql(f"ALTER TABLE {PARENT} RENAME TO {_LEGACY}")
+    connection.exec_driver_sql(f"ALTER TABLE {_LEGACY} RENAME CONSTRAINT {PARENT}_pkey TO {_LEGACY}_pkey")
+    for index in Message.__table__.indexes:
+        connection.exec_driver_sql(f"ALTER INDEX IF EXISTS {index.name} RENAME TO {index.name}_legacy")
+    connection.exec_driver_sql("ALTER INDEX IF EXISTS ix_messages_content_tsv RENAME TO ix_messages_content_tsv_legacy")
+
+    oldest = connection.exec_driver_sql(f"SELECT min(created_at) FROM {_LEGACY}").scalar()
+    create_partitioned_messages(connection, first_month=oldest.date() if oldest else None)
+    columns = ", ".join(column.name for column in Message.__table__.columns)
+    connection.exec_driver_sql(f"INSERT INTO {PARENT} ({columns}) SELECT {columns} FROM {_LEGACY}")
+    connection.exec_driver_sql(f"DROP TABLE {_LEGACY}")
+    return True
@@ -1,34 +1,134 @@
-"""SQLAlchemy session and engine configuration."""
+"""SQLAlchemy session and engine configuration.
+
+With `DATABASE_REPLICA_URL` set, `get_db` routes requests between two engines:
+
+- GET/HEAD/OPTIONS requests get a session bound to the read replica
+- other methods, routes decorated with `@requires_primary`, requests marked
+  with `read_from_primary` (e.g. response-cache fills, whose body is stored
+  under an ETag built from primary-side table versions) and requests from a
+  client that committed a write within `READ_YOUR_WRITES_SECONDS` get the primary
+
+The recent-write marker travels with the client, not the worker process:
+`ReadYourWritesMiddleware` sets a short-lived `rw_until` cookie on responses
+to requests that committed, so whichever worker serves the next read sees it
+and a client reads its own writes even while the replica lags.
+"""
 
 from __future__ import annotations
 
-from typing import Any, Dict
+import math
+import time
+from typing import Any, Callable, MutableMapping, TypeVar
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core import settings
+from app.db.engines import get_engine
 
+# 풀 크기·재활용·prepared statement 설정은 app.db.engines에서 Settings 기반으로 적용
+engine = get_engine(settings.database_url)
+SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
 
-def _engine_kwargs(database_url: str) -> Dict[str, Any]:
-    """Return engine configuration tuned for the selected backend."""
+replica_engine = get_engine(settings.database_replica_url) if settings.database_replica_url else engine
+ReplicaSessionLocal = (
+    sessionmaker(bind=replica_engine, autocommit=False, autoflush=False, future=True)
+    if replica_engine is not engine else SessionLocal
+)
 
-    kwargs: Dict[str, Any] = {"future": True, "echo": False, "pool_pre_ping": True}
-    if database_url.startswith("sqlite"):
-        # SQLite는 단일 스레드 접근만 허용하므로 FastAPI 개발 서버용 예외 처리.
-        kwargs["connect_args"] = {"check_same_thread": False}
-    return kwargs
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_READ_PRIMARY = "db_read_primary"
+_COMMITTED = "db_committed"
+READ_YOUR_WRITES_COOKIE = "rw_until"
+_F = TypeVar("_F", bound=Callable)
 
 
-engine = create_engine(settings.database_url, **_engine_kwargs(settings.database_url))
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+def read_from_primary(scope: MutableMapping[str, Any]) -> None:
+    """Mark an ASGI request so `get_db` hands it a primary session (for middleware)."""
+
+    scope.setdefault("state", {})[_READ_PRIMARY] = True
+
+
+def requires_primary(endpoint: _F) -> _F:
+    """Mark a GET endpoint so `get_db` never hands it a replica session.
+
+    For endpoints that write, or that fill a cache keyed by primary-side
+    table versions (a lagging replica would store stale data under a new key).
+    """
+
+    endpoint.__requires_primary__ = True  # type: ignore[attr-defined]
+    return endpoint
+
+
+@event.listens_for(Session, "after_commit")
+def _remember_commit(session: Session) -> None:
+    # get_db가 primary 세션에 요청의 scope["state"]를 연결해 둔다
+    state = session.info.get("request_state")
+    if state is not None:
+        state[_COMMITTED] = True
 
 
-def get_db():
-    """FastAPI dependency that yields a database session."""
+def _wrote_recently(request: Request) -> bool:
+    try:
+        until = float(request.cookies.get(READ_YOUR_WRITES_COOKIE, ""))
+    except ValueError:
+        return False
+    now = time.time()
+    # 클라이언트가 임의로 늘린 값은 무시
+    return now < until <= now + settings.READ_YOUR_WRITES_SECONDS
+
+
+def _use_replica(request: Request) -> bool:
+    if ReplicaSessionLocal is SessionLocal or request.method not in _SAFE_METHODS:
+        return False
+    route = request.scope.get("route")
+    if getattr(getattr(route, "endpoint", None), "__requires_primary__", False):
+        return False
+    if request.scope.get("state", {}).get(_READ_PRIMARY):
+        return False
+    return not _wrote_recently(request)
+
+
+def get_db(request: Request):
+    """FastAPI dependency that yields a database session (replica for safe reads)."""
+
+    if _use_replica(request):
+        db = ReplicaSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+        return
 
     db = SessionLocal()
+    db.info["request_state"] = request.scope.setdefault("state", {})
     try:
         yield db
     finally:
         db.close()
+
+
+class ReadYourWritesMiddleware:
+    """ASGI middleware setting the `rw_until` cookie on responses to requests that committed."""
+
+    def __init__(self, app: ASGIApp, *, window: float = settings.READ_YOUR_WRITES_SECONDS) -> None:
+        self.app = app
+        self.window = window
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or ReplicaSessionLocal is SessionLocal:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and scope.get("state", {}).get(_COMMITTED):
+                cookie = (
+                    f"{READ_YOUR_WRITES_COOKIE}={time.time() + self.window:.3f}; "
+                    f"Max-Age={math.ceil(self.window)}; Path=/; HttpOnly; SameSite=Lax"
+                )
+                message = {**message, "headers": [*message.get("headers", []), (b"set-cookie", cookie.encode())]}
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
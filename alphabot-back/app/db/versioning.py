@@ -0,0 +1,176 @@
+"""Per-table version counters used to invalidate cached read responses.
+
+Every session commit that touches a versioned table (ORM flushes as well as
+bulk INSERT/UPDATE/DELETE statements) increments that table's row in
+`table_versions` inside the same transaction. The API process keeps the
+counters in memory and re-reads them at most once per refresh interval, so
+writes from other processes (e.g. the stock collector) become visible without
+a database round trip per request.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+import time
+from typing import Dict, Iterable, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import event, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.core import settings
+from app.models import TableVersion
+
+logger = logging.getLogger(__name__)
+
+# 응답 캐시 대상이 되는 읽기 위주 테이블 + 알림 규칙/보유 종목 (변경 시 알림 엔진·평가 캐시 무효화)
+VERSIONED_TABLES = frozenset({"category", "stocks", "financial_statements", "price_alerts", "holdings"})
+
+_CHANGED_KEY = "versioning.changed_tables"
+_PENDING_KEY = "versioning.pending_versions"
+
+
+class TableVersionRegistry:
+    """In-memory view of the `table_versions` counters."""
+
+    def __init__(self, *, refresh_interval: float) -> None:
+        self._refresh_interval = refresh_interval
+        self._versions: Dict[str, int] = {}
+        self._loaded_at = float("-inf")
+        self._lock = threading.Lock()
+        self._engine: Optional[Engine] = None
+
+    def bind(self, engine: Engine) -> None:
+        """Set the engine used to reload counters written by other processes."""
+
+        self._engine = engine
+
+    def is_stale(self) -> bool:
+        """Whether the in-memory counters are due for a reload."""
+
+        return self._engine is not None and (
+            time.monotonic() - self._loaded_at >= self._refresh_interval
+        )
+
+    def current(self, tables: Sequence[str]) -> Tuple[int, ...]:
+        """Return the versions of *tables*, reloading them if the view is stale."""
+
+        if self.is_stale():
+            self.refresh()
+        return tuple(self._versions.get(table, 0) for table in tables)
+
+    def refresh(self) -> None:
+        """Reload all counters from the database."""
+
+        if self._engine is None:
+            return
+        with self._lock:
+            if time.monotonic() - self._loaded_at < self._refresh_interval:
+                return
+            try:
+                with self._engine.connect() as conn:
+                    rows = conn.execute(select(TableVersion.table_name, TableVersion.version)).all()
+            except Exception as e:
+                logger.warning("table version refresh failed: %r", e)
+                rows = []
+            for table_name, version in rows:
+                self._apply(table_name, version)
+            self._loaded_at = time.monotonic()
+
+    def bump(self, connection: Connection, tables: Iterable[str]) -> Dict[str, int]:
+        """Increment the counters for *tables* on *connection* and return the new values."""
+
+        new_versions: Dict[str, int] = {}
+        for table_name in sorted(set(tables)):
+            new_versions[table_name] = _increment(connection, table_name)
+        return new_versions
+
+    def apply(self, versions: Dict[str, int]) -> None:
+        """Record committed versions so this process sees its own writes immediately."""
+
+        with self._lock:
+            for table_name, version in versions.items():
+                self._apply(table_name, version)
+
+    def _apply(self, table_name: str, version: int) -> None:
+        if version > self._versions.get(table_name, 0):
+            self._versions[table_name] = version
+
+
+def _increment(connection: Connection, table_name: str) -> int:
+    table = TableVersion.__table__
+    dialect = connection.dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        stmt_insert = postgresql.insert(table) if dialect == "postgresql" else sqlite.insert(table)
+        stmt = (
+            stmt_insert.values(table_name=table_name, version=1)
+            .on_conflict_do_update(
+                index_elements=[table.c.table_name],
+                set_={"version": table.c.version + 1, "updated_at": func.now()},
+            )
+            .returning(table.c.version)
+        )
+        return connection.execute(stmt).scalar_one()
+
+    result = connection.execute(
+        update(table)
+        .where(table.c.table_name == table_name)
+        .values(version=table.c.version + 1, updated_at=func.now())
+    )
+    if result.rowcount == 0:
+        connection.execute(insert(table).values(table_name=table_name, version=1))
+    return connection.execute(
+        select(table.c.version).where(table.c.table_name == table_name)
+    ).scalar_one()
+
+
+table_versions = TableVersionRegistry(refresh_interval=settings.TABLE_VERSION_REFRESH_SECONDS)
+
+
+# --------- Session hooks: collect touched tables and bump on commit ---------
+
+def _changed_tables(session: Session) -> Set[str]:
+    return session.info.setdefault(_CHANGED_KEY, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tables(session: Session, flush_context) -> None:
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        table_name = getattr(obj, "__tablename__", None)
+        if table_name in VERSIONED_TABLES:
+            _changed_tables(session).add(table_name)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_tables(state: ORMExecuteState) -> None:
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    table_name = getattr(getattr(state.statement, "table", None), "name", None)
+    if table_name in VERSIONED_TABLES:
+        _changed_tables(state.session).add(table_name)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_changed_tables(session: Session) -> None:
+    # commit 과정의 flush는 before_commit 이후에 실행되므로 먼저 flush해 변경 테이블을 수집
+    session.flush()
+    changed = session.info.pop(_CHANGED_KEY, None)
+    if changed:
+        pending = session.info.setdefault(_PENDING_KEY, {})
+        pending.update(table_versions.bump(session.connection(), changed))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_versions(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        table_versions.apply(pending)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_versions(session: Session, previous_transaction) -> None:
+    session.info.pop(_CHANGED_KEY, None)
+    session.info.pop(_PENDING_KEY, None)
@@ -1,10 +1,41 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 import logging
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-app = FastAPI()
+from app.core.cache import CacheRule, ResponseCacheMiddleware
+from app.core.compression import CompressionMiddleware
+from app.core.config import settings
+from app.core.metrics import MetricsMiddleware
+from app.core.warmup import WarmupState, warmup
+from app.db import ReadYourWritesMiddleware, SessionLocal
+from app.services import retrieval
+from app.routers import alert, auth, category, chat, health, metrics, news, portfolio, rag, stock_info, watchlist
+
+
+# 테이블 생성은 배포 시 `python -m app.db.bootstrap`으로 별도 실행
+# 시작 시에는 커넥션 풀·응답 모델·캐시를 백그라운드로 워밍업하고, 끝나면 /health/ready가 200을 반환
+# 메시지 벡터 인덱스 동기화도 요청 처리 경로 밖의 백그라운드 작업으로 실행
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.warmup = WarmupState()
+    tasks = [asyncio.create_task(warmup(app, app.state.warmup))]
+    if settings.VECTOR_SYNC_SECONDS > 0:
+        tasks.append(
+            asyncio.create_task(retrieval.run_message_sync(SessionLocal, settings.VECTOR_SYNC_SECONDS))
+        )
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # 기본 로깅 레벨 WARNING으로 설정
 logging.getLogger().setLevel(logging.WARNING)
@@ -22,12 +53,37 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 쓰기를 커밋한 요청의 응답에 rw_until 쿠키를 붙여, 이후 읽기를 어느 워커에서든 primary로 보냄
+app.add_middleware(ReadYourWritesMiddleware)
+
+# gzip/brotli 응답 압축 (응답 캐시 안쪽에 두어 압축된 본문을 그대로 캐시)
+app.add_middleware(CompressionMiddleware)
+
+# 읽기 위주 엔드포인트 응답 캐시 (테이블 버전 기반 ETag, If-None-Match 시 304)
+app.add_middleware(
+    ResponseCacheMiddleware,
+    rules=[
+        # 캐시 응답은 라우트를 거치지 않으므로 종목 조회 기록은 on_hit에서 처리
+        CacheRule("/stocks", ("stocks", "financial_statements"), ttl=300, on_hit=stock_info.record_cached_view),
+        CacheRule("/categories", ("category",), ttl=60),
+    ],
+)
+
+# 라우트별 지연 시간·요청당 SQL 쿼리 수 기록 (캐시 응답까지 포함하도록 가장 바깥에 추가)
+app.add_middleware(MetricsMiddleware)
+
 #router폴더 생성해서 기능별 API 관리
 app.include_router(auth.router, prefix="/auth",tags=["Auth 관련"])
 app.include_router(stock_info.router, prefix="/stocks",tags=["종목 관련"])
 app.include_router(chat.router, prefix="/chats", tags=["채팅 관련"])
+app.include_router(category.router, prefix="/categories", tags=["카테고리 관련"])
 app.include_router(rag.router, prefix="/reports", tags=["보고서 관련"])
 app.include_router(news.router, prefix="/news", tags=["뉴스 관련"])
+app.include_router(alert.router, prefix="/alerts", tags=["알림 관련"])
+app.include_router(portfolio.router, prefix="/portfolio", tags=["포트폴리오 관련"])
+app.include_router(watchlist.router, prefix="/watchlist", tags=["관심 종목 관련"])
+app.include_router(health.router, prefix="/health", tags=["상태 확인"])
+app.include_router(metrics.router, prefix="/metrics", tags=["지표"])
 #--------------------------배포용--------------------------------
 # React 정적 파일 제공
 #app.mount("/static", StaticFiles(directory="frontend/static"), name="static")
@@ -37,7 +93,3 @@ app.include_router(news.router, prefix="/news", tags=["뉴스 관련"])
 def serve_react_app_catch_all(full_path: str):
     return FileResponse("frontend/index.html")
 #----------------------------------------------------------
-
-
-#서버 실행 시 DB에 테이블이 없다면 models.py에 있는 정보 토대로 자동생성
-models.Base.metadata.create_all(bind=engine)
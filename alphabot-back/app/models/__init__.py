@@ -4,7 +4,10 @@ import enum
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, Sequence, String, Text, func
+from sqlalchemy import (
+    DDL, BigInteger, DateTime, Enum, ForeignKey, ForeignKeyConstraint, Index, Integer, Sequence, String, Text, event,
+    func,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -54,22 +57,46 @@ class User(Base):
 
 class Category(Base):
     __tablename__ = "category"
+    __table_args__ = (
+        # 제목 부분 일치 검색(LIKE '%x%')용 트라이그램 인덱스 (PostgreSQL 전용)
+        Index(
+            "ix_category_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     category_id: Mapped[int] = mapped_column(
         Integer,
         Sequence("category_category_id_seq", start=1, increment=1),
         primary_key=True,
     )
-    title: Mapped[str] = mapped_column(String(50), nullable=False)
+    title: Mapped[str] = mapped_column(String(50), nullable=False, unique=True)
+    description: Mapped[str] = mapped_column(String(200), nullable=False, server_default="")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=False), server_default=func.now(), nullable=False
     )
 
     bookmarks: Mapped[List["Bookmark"]] = relationship(back_populates="category")
 
+    def __repr__(self):
+        return f"<Category(id={self.category_id}, title='{self.title}')>"
+
+
+# 트라이그램 인덱스 생성 전에 pg_trgm 확장을 활성화
+event.listen(
+    Category.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
 
 class Chat(Base):
     __tablename__ = "chat"
+    __table_args__ = (
+        Index("ix_chat_user_id_trash_can_lastchat_at", "user_id", "trash_can", "lastchat_at"),
+    )
 
     chat_id: Mapped[int] = mapped_column(
         Integer,
@@ -89,13 +116,24 @@ class Chat(Base):
     )
 
     owner: Mapped[User] = relationship(back_populates="chats")
+    # ORM으로 채팅을 지우면 메시지와 그 북마크까지 cascade로 지운다 (PostgreSQL 파티션
+    # 테이블에는 북마크 FK가 없으므로 DB cascade에 맡기지 않음). 대량 삭제는
+    # message_crud.purge_chats 사용
     messages: Mapped[List["Message"]] = relationship(
         back_populates="chat", cascade="all, delete-orphan"
     )
 
 
 class Message(Base):
+    """채팅 메시지
+
+    PostgreSQL에서는 `created_at` 기준 월별 RANGE 파티션 테이블로 생성된다
+    (`app.db.partitions`, 기본 키는 (messages_id, created_at)). SQLite에서는
+    단일 테이블 그대로 사용한다.
+    """
+
     __tablename__ = "messages"
+    __table_args__ = (Index("ix_messages_chat_id_messages_id", "chat_id", "messages_id"),)
 
     messages_id: Mapped[int] = mapped_column(
         Integer,
@@ -125,6 +163,15 @@ class Message(Base):
 
 class Bookmark(Base):
     __tablename__ = "bookmark"
+    __table_args__ = (
+        # 파티션 테이블의 고유 키에는 파티션 키가 포함되어야 하므로 PostgreSQL에서는
+        # messages_id만으로 FK를 걸 수 없다. FK는 SQLite에서만 생성하고, PostgreSQL에서는
+        # ORM cascade와 message_crud.purge_chats가 북마크를 함께 지운다.
+        ForeignKeyConstraint(
+            ["messages_id"], ["messages.messages_id"],
+            name="bookmark_messages_id_fkey", ondelete="CASCADE",
+        ).ddl_if(dialect="sqlite"),
+    )
 
     bookmark_id: Mapped[int] = mapped_column(
         Integer,
@@ -134,9 +181,7 @@ class Bookmark(Base):
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False
     )
-    messages_id: Mapped[int] = mapped_column(
-        ForeignKey("messages.messages_id", ondelete="CASCADE"), nullable=False
-    )
+    messages_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
     category_id: Mapped[Optional[int]] = mapped_column(
         ForeignKey("category.category_id"), nullable=True
     )
@@ -147,3 +192,44 @@ class Bookmark(Base):
     user: Mapped[User] = relationship(back_populates="bookmarks")
     message: Mapped[Message] = relationship(back_populates="bookmarks")
     category: Mapped[Optional[Category]] = relationship(back_populates="bookmarks")
+
+
+class TableVersion(Base):
+    """테이블별 변경 버전 카운터 (응답 캐시 ETag 계산용)"""
+
+    __tablename__ = "table_versions"
+
+    table_name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=False), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+
+class ArchivedChat(Base):
+    """콜드 스토리지로 옮긴 채팅 목록 (`app.pipelines.message_archiver`)"""
+
+    __tablename__ = "archived_chats"
+
+    chat_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    user_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    title: Mapped[str] = mapped_column(String(100), nullable=False)
+    trash_can: Mapped[TrashEnum] = mapped_column(trash_enum, nullable=False)
+    message_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    archive_path: Mapped[str] = mapped_column(String(500), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=False), nullable=False)
+    lastchat_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=False))
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=False), server_default=func.now(), nullable=False
+    )
+
+
+class DeletedMessage(Base):
+    """대량 삭제(purge_chats)된 메시지 id (API의 벡터 인덱스 동기화가 소비 후 삭제)"""
+
+    __tablename__ = "deleted_messages"
+
+    messages_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=False), server_default=func.now(), nullable=False
+    )
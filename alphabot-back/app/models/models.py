@@ -1,7 +1,7 @@
 import enum
 from sqlalchemy import (
     create_engine, Column, Integer, String, Text, TIMESTAMP, 
-    ForeignKey, Enum, BigInteger, Numeric, Date, UniqueConstraint
+    ForeignKey, Enum, BigInteger, Numeric, Date, UniqueConstraint, LargeBinary, Boolean, Index
 )
 from sqlalchemy.orm import relationship, declarative_base
 from sqlalchemy.sql import func # func.now()를 위해 임포트
@@ -24,6 +24,10 @@ class ReportTypeEnum(str, enum.Enum):
     annual = 'Annual'
     quarterly = 'Quarterly'
 
+class AlertConditionEnum(str, enum.Enum):
+    above = 'above'  # 값 >= 기준값
+    below = 'below'  # 값 <= 기준값
+
 class User(Base):
     __tablename__ = 'users'
     __table_args__ = {'schema': 'public'}
@@ -215,7 +219,8 @@ class FinancialStatement(Base):
         {'schema': 'public'}
     )
 
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    # SQLite(벤치마크, 로컬 테스트)에서는 INTEGER PRIMARY KEY여야 자동 증가됨
+    id = Column(BigInteger().with_variant(Integer, 'sqlite'), primary_key=True, autoincrement=True)
     
     # --- [수정] 'Stock' 모델을 명시적으로 참조 ---
     stock_code = Column(String(20), ForeignKey('public.stocks.code', ondelete="CASCADE"), nullable=False, index=True)
@@ -250,4 +255,177 @@ class FinancialStatement(Base):
     stock = relationship("Stock", back_populates="financial_statements")
 
     def __repr__(self):
-        return f"<FinancialStatement(stock_code='{self.stock_code}', period='{self.report_period}')>"
\ No newline at end of file
+        return f"<FinancialStatement(stock_code='{self.stock_code}', period='{self.report_period}')>"
+
+
+class StockDocument(Base):
+    __tablename__ = 'stock_documents'
+    __table_args__ = {'schema': 'public'}
+
+    # 종목 상세 패널용으로 미리 만들어 둔 JSON 문서 (gzip 압축)
+    stock_code = Column(String(20), ForeignKey('public.stocks.code', ondelete="CASCADE"), primary_key=True)
+    payload = Column(LargeBinary, nullable=False)
+    content_hash = Column(String(64), nullable=False)  # 압축 전 JSON의 sha256 (변경 감지용)
+    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<StockDocument(stock_code='{self.stock_code}')>"
+
+
+class NewsItem(Base):
+    __tablename__ = 'news_items'
+    __table_args__ = (
+        # 종목별로 URL과 본문 해시 양쪽으로 중복 기사를 차단
+        # (여러 종목을 다루는 같은 기사는 종목마다 한 행씩 저장)
+        UniqueConstraint('stock_code', 'url_hash', name='unique_news_stock_url_hash'),
+        UniqueConstraint('stock_code', 'content_hash', name='unique_news_stock_content_hash'),
+        {'schema': 'public'}
+    )
+
+    # SQLite(로컬 fixture 테스트)에서는 INTEGER PRIMARY KEY여야 자동 증가됨
+    id = Column(BigInteger().with_variant(Integer, 'sqlite'), primary_key=True, autoincrement=True)
+    stock_code = Column(String(20), ForeignKey('public.stocks.code', ondelete="CASCADE"), nullable=False, index=True)
+    url = Column(Text, nullable=False)
+    url_hash = Column(String(64), nullable=False)  # 정규화한 URL의 sha256
+    content_hash = Column(String(64), nullable=False)  # 정규화한 제목+요약의 sha256
+    title = Column(Text, nullable=False)
+    publisher = Column(String(255), nullable=True)
+    summary = Column(Text, nullable=True)
+    published_at = Column(TIMESTAMP(timezone=True), nullable=True, index=True)
+    source = Column(String(50), nullable=False)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<NewsItem(stock_code='{self.stock_code}', title='{self.title[:30]}')>"
+
+
+class NewsCursor(Base):
+    __tablename__ = 'news_cursors'
+    __table_args__ = {'schema': 'public'}
+
+    # 종목별로 마지막으로 저장한 기사의 게시 시각 (다음 실행 시 이후 기사만 처리)
+    stock_code = Column(String(20), ForeignKey('public.stocks.code', ondelete="CASCADE"), primary_key=True)
+    last_published_at = Column(TIMESTAMP(timezone=True), nullable=True)
+    last_run_at = Column(TIMESTAMP(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<NewsCursor(stock_code='{self.stock_code}', last_published_at='{self.last_published_at}')>"
+
+
+class PriceAlert(Base):
+    __tablename__ = 'price_alerts'
+    __table_args__ = (
+        Index('ix_price_alerts_user_id', 'user_id'),
+        Index('ix_price_alerts_is_active', 'is_active'),
+        {'schema': 'public'}
+    )
+
+    alert_id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey('public.users.user_id', ondelete="CASCADE"), nullable=False)
+    stock_code = Column(String(20), ForeignKey('public.stocks.code', ondelete="CASCADE"), nullable=False)
+    field = Column(String(50), nullable=False)  # 비교 대상 (current_price, change_percent 등)
+    condition = Column(Enum(AlertConditionEnum, name='alert_condition_enum'), nullable=False)
+    threshold = Column(Numeric(18, 4), nullable=False)
+    is_active = Column(Boolean, nullable=False, server_default='true')  # 발동되면 비활성화 (1회성)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    triggered_at = Column(TIMESTAMP(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return (f"<PriceAlert(alert_id={self.alert_id}, stock_code='{self.stock_code}', "
+                f"{self.field} {self.condition} {self.threshold})>")
+
+
+class AlertEvent(Base):
+    __tablename__ = 'alert_events'
+    __table_args__ = (
+        # 사용자별 미전달 알림 조회용
+        Index('ix_alert_events_user_id_delivered_at', 'user_id', 'delivered_at'),
+        {'schema': 'public'}
+    )
+
+    # 발동된 알림의 전달 대기열 (delivered_at이 NULL이면 미전달)
+    event_id = Column(BigInteger().with_variant(Integer, 'sqlite'), primary_key=True, autoincrement=True)
+    alert_id = Column(Integer, ForeignKey('public.price_alerts.alert_id', ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey('public.users.user_id', ondelete="CASCADE"), nullable=False)
+    stock_code = Column(String(20), nullable=False)
+    field = Column(String(50), nullable=False)
+    condition = Column(Enum(AlertConditionEnum, name='alert_condition_enum'), nullable=False)
+    threshold = Column(Numeric(18, 4), nullable=False)
+    value = Column(Numeric(18, 4), nullable=False)  # 발동 시점의 값
+    triggered_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    delivered_at = Column(TIMESTAMP(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<AlertEvent(event_id={self.event_id}, alert_id={self.alert_id}, value={self.value})>"
+
+
+class Holding(Base):
+    __tablename__ = 'holdings'
+    __table_args__ = (
+        # 사용자당 종목별 하나의 포지션
+        UniqueConstraint('user_id', 'stock_code', name='unique_holding_user_stock'),
+        {'schema': 'public'}
+    )
+
+    holding_id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey('public.users.user_id', ondelete="CASCADE"), nullable=False)
+    stock_code = Column(String(20), ForeignKey('public.stocks.code', ondelete="CASCADE"), nullable=False)
+    quantity = Column(Numeric(20, 6), nullable=False)
+    average_cost = Column(Numeric(18, 4), nullable=False)  # 주당 평균 매입가
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<Holding(user_id={self.user_id}, stock_code='{self.stock_code}', quantity={self.quantity})>"
+
+
+class WatchlistItem(Base):
+    __tablename__ = 'watchlist'
+    __table_args__ = (
+        UniqueConstraint('user_id', 'stock_code', name='unique_watchlist_user_stock'),
+        {'schema': 'public'}
+    )
+
+    watchlist_id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey('public.users.user_id', ondelete="CASCADE"), nullable=False)
+    stock_code = Column(String(20), ForeignKey('public.stocks.code', ondelete="CASCADE"), nullable=False, index=True)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<WatchlistItem(user_id={self.user_id}, stock_code='{self.stock_code}')>"
+
+
+class CollectionJob(Base):
+    __tablename__ = 'collection_jobs'
+    __table_args__ = (
+        # 종목별 작업 종류(quote, statements)당 하나의 예약 작업
+        UniqueConstraint('stock_code', 'kind', name='unique_collection_job_stock_kind'),
+        Index('ix_collection_jobs_next_run_at', 'next_run_at'),
+        {'schema': 'public'}
+    )
+
+    job_id = Column(Integer, primary_key=True, autoincrement=True)
+    stock_code = Column(String(20), ForeignKey('public.stocks.code', ondelete="CASCADE"), nullable=False)
+    kind = Column(String(20), nullable=False)
+    priority = Column(Integer, nullable=False, server_default='0')  # 클수록 먼저 실행
+    interval_seconds = Column(Integer, nullable=False)
+    next_run_at = Column(TIMESTAMP(timezone=True), nullable=False)
+    locked_until = Column(TIMESTAMP(timezone=True), nullable=True)  # 실행 중인 작업의 임대 만료 시각
+    last_run_at = Column(TIMESTAMP(timezone=True), nullable=True)
+    failures = Column(Integer, nullable=False, server_default='0')
+    last_error = Column(Text, nullable=True)
+
+    def __repr__(self):
+        return f"<CollectionJob(stock_code='{self.stock_code}', kind='{self.kind}', next_run_at='{self.next_run_at}')>"
+
+
+class StockInterest(Base):
+    __tablename__ = 'stock_interest'
+    __table_args__ = {'schema': 'public'}
+
+    # API에서 최근 조회된 종목 (수집 스케줄러가 우선 갱신 대상 선정에 사용)
+    stock_code = Column(String(20), ForeignKey('public.stocks.code', ondelete="CASCADE"), primary_key=True)
+    last_requested_at = Column(TIMESTAMP(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<StockInterest(stock_code='{self.stock_code}', last_requested_at='{self.last_requested_at}')>"
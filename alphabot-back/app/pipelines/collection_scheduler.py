@@ -0,0 +1,321 @@
+"""Long-running collection scheduler with priority tiers.
+
+Replaces periodic one-shot `stock_collector --sp500` runs. Each stock has two
+rows in the persistent `collection_jobs` queue:
+
+- `quote`:      `ingest_quote` (price, valuation, profile). Hot stocks (top
+                volume, watchlisted, recently viewed via the API) are refreshed
+                every `SCHEDULER_HOT_QUOTE_SECONDS`, the rest every
+                `SCHEDULER_QUOTE_SECONDS`.
+- `statements`: `ingest_statements` every `SCHEDULER_STATEMENT_SECONDS`.
+
+Due jobs are claimed highest priority first under a lease (`locked_until`,
+`FOR UPDATE SKIP LOCKED` on PostgreSQL) so several scheduler processes can
+share the queue. `SCHEDULER_MAX_CONCURRENCY` caps the jobs running at once
+across all of them: a claim counts the unexpired leases in `collection_jobs`
+and only takes the remaining slots. On PostgreSQL claims are serialized by a
+transaction-level advisory lock; SQLite serializes writers itself, and is only
+meant for a single scheduler. A crashed worker's job keeps its slot until its
+lease expires. Each job still goes through the collector's request throttle,
+and next run times are jittered so refreshes do not bunch up.
+
+Run with `python -m app.pipelines.collection_scheduler`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import func, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.models import CollectionJob, Stock, StockInterest, WatchlistItem
+from app.pipelines.stock_collector import ingest_quote, ingest_statements
+from app.pipelines.stock_documents import refresh_stock_documents
+from app.services.alerts import evaluate_alerts
+
+QUOTE_JOB = "quote"
+STATEMENTS_JOB = "statements"
+
+HOT_PRIORITY = 100
+QUOTE_PRIORITY = 50
+STATEMENTS_PRIORITY = 10
+
+LEASE_SECONDS = 15 * 60
+MAX_BACKOFF_SECONDS = 6 * 3600
+SYNC_INTERVAL_SECONDS = 300
+POLL_INTERVAL_SECONDS = 5.0
+# claim_due_jobs를 프로세스 간 직렬화하는 pg_advisory_xact_lock 키
+CLAIM_LOCK_KEY = 0x636F6C6C  # "coll"
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _jittered(seconds: float) -> timedelta:
+    jitter = settings.SCHEDULER_JITTER
+    return timedelta(seconds=seconds * random.uniform(1.0 - jitter, 1.0 + jitter))
+
+
+def hot_stock_codes(session: Session) -> Set[str]:
+    """Top-volume, watchlisted and recently viewed stocks."""
+
+    top_volume = session.execute(
+        select(Stock.code)
+        .where(Stock.volume.is_not(None))
+        .order_by(Stock.volume.desc())
+        .limit(settings.SCHEDULER_HOT_VOLUME_TOP)
+    ).scalars()
+    watched = session.execute(select(WatchlistItem.stock_code).distinct()).scalars()
+    since = _now() - timedelta(seconds=settings.SCHEDULER_RECENT_QUERY_SECONDS)
+    viewed = session.execute(
+        select(StockInterest.stock_code).where(StockInterest.last_requested_at >= since)
+    ).scalars()
+    return set(top_volume) | set(watched) | set(viewed)
+
+
+def sync_jobs(session: Session) -> Tuple[int, int]:
+    """Create missing jobs and move quote jobs between tiers; returns (created, retiered).
+
+    Caller commits.
+    """
+
+    now = _now()
+    existing: Dict[Tuple[str, str], Tuple[int, int]] = {
+        (row.stock_code, row.kind): (row.job_id, row.priority)
+        for row in session.execute(
+            select(CollectionJob.job_id, CollectionJob.stock_code, CollectionJob.kind, CollectionJob.priority)
+        )
+    }
+    codes = session.execute(select(Stock.code)).scalars().all()
+    hot = hot_stock_codes(session)
+
+    def _quote_tier(code: str) -> Tuple[int, int]:
+        if code in hot:
+            return HOT_PRIORITY, settings.SCHEDULER_HOT_QUOTE_SECONDS
+        return QUOTE_PRIORITY, settings.SCHEDULER_QUOTE_SECONDS
+
+    new_jobs = []
+    for code in codes:
+        if (code, QUOTE_JOB) not in existing:
+            priority, interval = _quote_tier(code)
+            new_jobs.append({
+                "stock_code": code, "kind": QUOTE_JOB, "priority": priority,
+                "interval_seconds": interval, "next_run_at": now + _jittered(min(interval, 60)),
+            })
+        if (code, STATEMENTS_JOB) not in existing:
+            # 신규 종목의 재무제표 작업은 주기 전체에 분산해 한꺼번에 몰리지 않도록 함
+            new_jobs.append({
+                "stock_code": code, "kind": STATEMENTS_JOB, "priority": STATEMENTS_PRIORITY,
+                "interval_seconds": settings.SCHEDULER_STATEMENT_SECONDS,
+                "next_run_at": now + timedelta(seconds=random.uniform(0, settings.SCHEDULER_STATEMENT_SECONDS)),
+            })
+    if new_jobs:
+        session.execute(insert(CollectionJob), new_jobs)
+
+    retier = []
+    for (code, kind), (job_id, priority) in existing.items():
+        if kind != QUOTE_JOB:
+            continue
+        new_priority, interval = _quote_tier(code)
+        if new_priority != priority:
+            retier.append({"job_id": job_id, "priority": new_priority, "interval_seconds": interval})
+    if retier:
+        session.execute(update(CollectionJob), retier)
+        # 새로 핫 티어가 된 종목은 다음 주기를 기다리지 않고 곧바로 갱신
+        promoted = [row["job_id"] for row in retier if row["priority"] == HOT_PRIORITY]
+        if promoted:
+            session.execute(
+                update(CollectionJob)
+                .where(CollectionJob.job_id.in_(promoted), CollectionJob.next_run_at > now)
+                .values(next_run_at=now)
+                .execution_options(synchronize_session=False)
+            )
+
+    print(f"[collection_scheduler] sync_jobs: stocks={len(codes)}, hot={len(hot)}, "
+          f"created={len(new_jobs)}, retiered={len(retier)}")
+    return len(new_jobs), len(retier)
+
+
+def claim_due_jobs(
+    session: Session, limit: int, *, max_running: int = settings.SCHEDULER_MAX_CONCURRENCY
+) -> List[Tuple[int, str, str]]:
+    """Lease up to *limit* due jobs (highest priority first) and commit the lease.
+
+    Fewer are leased when that would put more than *max_running* unexpired
+    leases in the table, counting every scheduler process.
+    """
+
+    if limit <= 0:
+        return []
+    now = _now()
+    if session.get_bind().dialect.name == "postgresql":
+        # 실행 중 작업 수 확인과 임대를 한 프로세스씩 하도록 트랜잭션 범위 잠금
+        session.execute(select(func.pg_advisory_xact_lock(CLAIM_LOCK_KEY)))
+    running = session.execute(
+        select(func.count()).select_from(CollectionJob).where(CollectionJob.locked_until >= now)
+    ).scalar_one()
+    limit = min(limit, max_running - running)
+    if limit <= 0:
+        session.commit()
+        return []
+
+    stmt = (
+        select(CollectionJob.job_id, CollectionJob.stock_code, CollectionJob.kind)
+        .where(
+            CollectionJob.next_run_at <= now,
+            or_(CollectionJob.locked_until.is_(None), CollectionJob.locked_until < now),
+        )
+        .order_by(CollectionJob.priority.desc(), CollectionJob.next_run_at)
+        .limit(limit)
+    )
+    if session.get_bind().dialect.name == "postgresql":
+        stmt = stmt.with_for_update(skip_locked=True)
+    jobs = [(row.job_id, row.stock_code, row.kind) for row in session.execute(stmt)]
+    if jobs:
+        session.execute(
+            update(CollectionJob)
+            .where(CollectionJob.job_id.in_([job_id for job_id, _, _ in jobs]))
+            .values(locked_until=now + timedelta(seconds=LEASE_SECONDS))
+            .execution_options(synchronize_session=False)
+        )
+    session.commit()
+    return jobs
+
+
+def run_job(session_factory: Callable[[], Session], job_id: int, stock_code: str, kind: str) -> bool:
+    """Execute one job in its own session and reschedule it; returns success."""
+
+    db = session_factory()
+    error: Optional[str] = None
+    try:
+        if kind == QUOTE_JOB:
+            ingest_quote(db, stock_code)
+            db.flush()
+            refresh_stock_documents(db, [stock_code])
+            evaluate_alerts(db, [stock_code])
+        elif kind == STATEMENTS_JOB:
+            ingest_statements(db, stock_code)
+            db.flush()
+            refresh_stock_documents(db, [stock_code])
+        else:
+            raise ValueError(f"unknown job kind {kind!r}")
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        error = repr(e)
+        print(f"[collection_scheduler] job failed: stock_code={stock_code}, kind={kind}, error={error}")
+
+    try:
+        job = db.get(CollectionJob, job_id)
+        if job is not None:
+            now = _now()
+            if error is None:
+                job.failures = 0
+                job.last_error = None
+                job.next_run_at = now + _jittered(job.interval_seconds)
+            else:
+                # 실패 시 지수 백오프 (주기보다 길게는 기다리지 않음)
+                job.failures += 1
+                backoff = min(60 * 2 ** job.failures, MAX_BACKOFF_SECONDS, job.interval_seconds)
+                job.last_error = error[:1000]
+                job.next_run_at = now + _jittered(backoff)
+            job.last_run_at = now
+            job.locked_until = None
+            db.commit()
+    finally:
+        db.close()
+    return error is None
+
+
+class CollectionScheduler:
+    """Claims due jobs and runs them on a bounded worker pool.
+
+    *max_concurrency* sizes this process's pool; *max_running* is the cap
+    shared with every other scheduler process through `collection_jobs`.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        *,
+        max_concurrency: int = settings.SCHEDULER_MAX_CONCURRENCY,
+        max_running: int = settings.SCHEDULER_MAX_CONCURRENCY,
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+        sync_interval: float = SYNC_INTERVAL_SECONDS,
+    ) -> None:
+        self._session_factory = session_factory
+        self._max_concurrency = max(1, max_concurrency)
+        self._max_running = max(1, max_running)
+        self._poll_interval = poll_interval
+        self._sync_interval = sync_interval
+        self._synced_at = float("-inf")
+
+    def sync(self) -> None:
+        db = self._session_factory()
+        try:
+            sync_jobs(db)
+            db.commit()
+        finally:
+            db.close()
+        self._synced_at = time.monotonic()
+
+    def run(self, *, max_jobs: Optional[int] = None) -> int:
+        """Run until interrupted (or until *max_jobs* jobs finished); returns jobs run."""
+
+        finished = 0
+        running: Set[Future] = set()
+        with ThreadPoolExecutor(max_workers=self._max_concurrency, thread_name_prefix="collect") as pool:
+            try:
+                while max_jobs is None or finished < max_jobs:
+                    if time.monotonic() - self._synced_at >= self._sync_interval:
+                        self.sync()
+
+                    free = self._max_concurrency - len(running)
+                    if max_jobs is not None:
+                        free = min(free, max_jobs - finished - len(running))
+                    db = self._session_factory()
+                    try:
+                        jobs = claim_due_jobs(db, free, max_running=self._max_running)
+                    finally:
+                        db.close()
+                    for job in jobs:
+                        running.add(pool.submit(run_job, self._session_factory, *job))
+
+                    if not running:
+                        time.sleep(self._poll_interval)
+                        continue
+                    done, running = wait(running, timeout=self._poll_interval, return_when=FIRST_COMPLETED)
+                    finished += len(done)
+            except KeyboardInterrupt:
+                print("[collection_scheduler] interrupted; waiting for running jobs")
+            wait(running)
+        return finished + len(running)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Tiered stock collection scheduler")
+    parser.add_argument("--concurrency", type=int, default=settings.SCHEDULER_MAX_CONCURRENCY,
+                        help="Worker threads in this process (the total across processes is "
+                             "capped by SCHEDULER_MAX_CONCURRENCY)")
+    parser.add_argument("--max-jobs", type=int, default=None, help="Exit after this many jobs (for testing)")
+    parser.add_argument("--sync-only", action="store_true", help="Create/retier jobs and exit")
+    args = parser.parse_args(argv)
+
+    scheduler = CollectionScheduler(max_concurrency=args.concurrency)
+    if args.sync_only:
+        scheduler.sync()
+        return
+    scheduler.run(max_jobs=args.max_jobs)
+
+
+if __name__ == "__main__":
+    main()
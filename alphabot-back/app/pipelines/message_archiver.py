@@ -0,0 +1,219 @@
+"""Archival of trashed and inactive chats to compressed cold storage.
+
+A chat is archived when
+
+- it is in the trash (`TrashEnum.OUT`) and its last activity is older than
+  `ARCHIVE_TRASHED_AFTER_DAYS`, or
+- its last activity (`lastchat_at`, else `created_at`) is older than
+  `ARCHIVE_INACTIVE_AFTER_DAYS`.
+
+Chats are processed in batches of `ARCHIVE_BATCH_CHATS`. Each batch is written
+to one gzip-compressed NDJSON file under `ARCHIVE_DIR/messages/YYYY/MM/` (one
+line per chat with its messages and bookmarks), fsynced, recorded in
+`archived_chats`, and then purged with one DELETE per table
+(`message_crud.purge_chats`) in the same transaction. The purged message ids
+land in `deleted_messages`, from which the API removes them from its vector
+index. The file is removed again if the transaction fails.
+
+Afterwards the monthly `messages` partitions are maintained (upcoming months
+created, emptied past months dropped; PostgreSQL only, see
+`app.db.partitions`).
+
+Run with `python -m app.pipelines.message_archiver` (e.g. daily from cron).
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func, insert, or_, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.serialization import dumps
+from app.crud.crud_message import message_crud
+from app.db import SessionLocal
+from app.db.partitions import drop_empty_partitions, ensure_message_partitions
+from app.models import ArchivedChat, Bookmark, Chat, Message, TrashEnum
+
+_MESSAGE_FETCH_ROWS = 1000
+
+
+def archivable_chats(db: Session, *, now: datetime, limit: int) -> List[Row]:
+    """Chats due for archival, oldest ids first (rows locked on PostgreSQL)."""
+
+    last_activity = func.coalesce(Chat.lastchat_at, Chat.created_at)
+    trashed_before = now - timedelta(days=settings.ARCHIVE_TRASHED_AFTER_DAYS)
+    inactive_before = now - timedelta(days=settings.ARCHIVE_INACTIVE_AFTER_DAYS)
+    return db.execute(
+        select(Chat.__table__)
+        .where(or_(
+            and_(Chat.trash_can == TrashEnum.OUT, last_activity < trashed_before),
+            last_activity < inactive_before,
+        ))
+        .order_by(Chat.chat_id)
+        .limit(limit)
+        # 다른 archiver 프로세스와 같은 채팅을 동시에 처리하지 않도록 (SQLite에서는 무시됨)
+        .with_for_update(skip_locked=True)
+    ).all()
+
+
+def _records(db: Session, chats: Sequence[Row]) -> Iterator[Tuple[Row, Dict[str, Any]]]:
+    """(chat, archive record) per chat; messages are streamed in chat order."""
+
+    chat_ids = [chat.chat_id for chat in chats]
+    bookmarks: Dict[int, List[Dict[str, Any]]] = {}
+    for bookmark in db.execute(
+        select(Bookmark.__table__, Message.chat_id)
+        .join(Message, Message.messages_id == Bookmark.messages_id)
+        .where(Message.chat_id.in_(chat_ids))
+    ).mappings():
+        record = dict(bookmark)
+        bookmarks.setdefault(record.pop("chat_id"), []).append(record)
+
+    messages = db.execute(
+        select(Message.__table__)
+        .where(Message.chat_id.in_(chat_ids))
+        .order_by(Message.chat_id, Message.messages_id)
+        .execution_options(yield_per=_MESSAGE_FETCH_ROWS)
+    ).mappings()
+    pending: Optional[Dict[str, Any]] = next(messages, None)
+    for chat in chats:
+        chat_messages = []
+        while pending is not None and pending["chat_id"] == chat.chat_id:
+            chat_messages.append(dict(pending))
+            pending = next(messages, None)
+        yield chat, {
+            "chat": dict(chat._mapping),
+            "messages": chat_messages,
+            "bookmarks": bookmarks.get(chat.chat_id, []),
+        }
+
+
+def _archive_path(archive_dir: Path, now: datetime, chats: Sequence[Row]) -> Path:
+    directory = archive_dir / "messages" / f"{now:%Y}" / f"{now:%m}"
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / f"chats-{chats[0].chat_id}-{chats[-1].chat_id}-{now:%Y%m%dT%H%M%S}.ndjson.gz"
+
+
+def _write_archive(path: Path, records: Iterator[Tuple[Row, Dict[str, Any]]]) -> Dict[int, int]:
+    """Write *records* as gzip NDJSON; returns the message count per chat."""
+
+    counts: Dict[int, int] = {}
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as raw:
+        with gzip.GzipFile(fileobj=raw, mode="wb") as archive:
+            for chat, record in records:
+                archive.write(dumps(record) + b"\n")
+                counts[chat.chat_id] = len(record["messages"])
+        raw.flush()
+        # DB에서 지우기 전에 디스크에 확실히 기록
+        os.fsync(raw.fileno())
+    os.replace(tmp_path, path)
+    return counts
+
+
+def archive_batch(
+    db: Session, *, now: datetime, batch_size: int, archive_dir: Path, dry_run: bool = False
+) -> Tuple[int, int]:
+    """Archive and purge one batch; returns (chats, messages) archived."""
+
+    chats = archivable_chats(db, now=now, limit=batch_size)
+    if not chats:
+        return 0, 0
+    if dry_run:
+        messages = db.scalar(
+            select(func.count()).select_from(Message).where(Message.chat_id.in_([c.chat_id for c in chats]))
+        )
+        return len(chats), messages
+
+    path = _archive_path(archive_dir, now, chats)
+    counts = _write_archive(path, _records(db, chats))
+    try:
+        db.execute(insert(ArchivedChat), [
+            {
+                "chat_id": chat.chat_id,
+                "user_id": chat.user_id,
+                "title": chat.title,
+                "trash_can": chat.trash_can,
+                "message_count": counts[chat.chat_id],
+                "archive_path": str(path),
+                "created_at": chat.created_at,
+                "lastchat_at": chat.lastchat_at,
+            }
+            for chat in chats
+        ])
+        purged = message_crud.purge_chats(db, chat_ids=[chat.chat_id for chat in chats])
+        db.commit()
+    except BaseException:
+        db.rollback()
+        path.unlink(missing_ok=True)
+        raise
+    return len(chats), purged
+
+
+def maintain_partitions(db: Session) -> None:
+    connection = db.connection()
+    created = ensure_message_partitions(connection)
+    dropped = drop_empty_partitions(connection)
+    db.commit()
+    if created or dropped:
+        print(f"[message_archiver] partitions: created={created}, dropped={dropped}")
+
+
+def run(
+    session_factory: Callable[[], Session] = SessionLocal,
+    *,
+    batch_size: int = settings.ARCHIVE_BATCH_CHATS,
+    max_batches: Optional[int] = None,
+    archive_dir: str = settings.ARCHIVE_DIR,
+    dry_run: bool = False,
+) -> Tuple[int, int]:
+    """Archive until no chat is due (or *max_batches* ran); returns (chats, messages)."""
+
+    now = datetime.now()
+    total_chats = total_messages = batches = 0
+    db = session_factory()
+    try:
+        while max_batches is None or batches < max_batches:
+            chats, messages = archive_batch(
+                db, now=now, batch_size=batch_size, archive_dir=Path(archive_dir), dry_run=dry_run
+            )
+            if not chats:
+                break
+            total_chats += chats
+            total_messages += messages
+            batches += 1
+            if dry_run:
+                # 실제로 지우지 않으므로 같은 배치가 반복된다
+                break
+        if not dry_run:
+            maintain_partitions(db)
+    finally:
+        db.close()
+    print(f"[message_archiver] {'due' if dry_run else 'archived'}: chats={total_chats}, "
+          f"messages={total_messages}, batches={batches}")
+    return total_chats, total_messages
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Archive trashed and inactive chats to cold storage")
+    parser.add_argument("--batch-size", type=int, default=settings.ARCHIVE_BATCH_CHATS,
+                        help="Chats per archive file / purge transaction")
+    parser.add_argument("--max-batches", type=int, default=None, help="Stop after this many batches")
+    parser.add_argument("--archive-dir", default=settings.ARCHIVE_DIR, help="Cold storage directory")
+    parser.add_argument("--dry-run", action="store_true", help="Only count the first due batch")
+    args = parser.parse_args(argv)
+
+    run(batch_size=args.batch_size, max_batches=args.max_batches,
+        archive_dir=args.archive_dir, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
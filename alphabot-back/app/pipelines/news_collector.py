@@ -0,0 +1,369 @@
+"""Collect the latest news items per ticker and store them in `news_items`.
+
+Features:
+- Fetch per-ticker news via yfinance (`YahooNewsSource`) or a local JSON fixture
+  (`FixtureNewsSource`, see `app/pipelines/data/news_fixture.json`).
+- Fetch tickers concurrently with a bounded worker pool; requests are spaced by
+  the collector's randomized throttle so the overall request rate stays the same.
+- Deduplicate per ticker by normalized URL hash and by title+summary content
+  hash, both within a run and against rows already stored; an article about
+  several tickers is kept once for each of them. Concurrent runs are covered by
+  `ON CONFLICT DO NOTHING` on the per-ticker unique keys.
+- Keep a per-ticker cursor (`news_cursors`) so each run skips items older than
+  the last stored one; items sharing the cursor's timestamp (common with
+  minute-resolution feeds) are kept and left to the hash dedup. Everything is
+  written with bulk inserts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Protocol, Sequence
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from sqlalchemy import insert, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.db.database import SessionLocal
+from app.models.models import NewsCursor, NewsItem, Stock
+from app.pipelines.stock_collector import (
+    DEFAULT_SP500_CSV,
+    MAX_DELAY_S,
+    MIN_DELAY_S,
+    _read_sp500_tickers,
+    _sleep,
+)
+
+DEFAULT_NEWS_FIXTURE = Path(__file__).with_name("data").joinpath("news_fixture.json")
+DEFAULT_WORKERS = 4
+_TRACKING_PARAMS = ("utm_", "guccounter", "guce_", "ncid", "soc_src", "soc_trk")
+
+
+@dataclass(frozen=True)
+class NewsEntry:
+    """Source-agnostic news item before deduplication."""
+
+    stock_code: str
+    url: str
+    title: str
+    publisher: Optional[str]
+    summary: Optional[str]
+    published_at: Optional[datetime]
+    source: str
+
+
+class NewsSource(Protocol):
+    name: str
+
+    def fetch(self, ticker: str) -> List[Dict[str, Any]]:
+        """Return raw news dicts for *ticker* (newest first is not required)."""
+        ...
+
+
+# --------- Sources ---------
+
+class YahooNewsSource:
+    """`yf.Ticker(ticker).news`; network-bound, so calls are throttled."""
+
+    name = "yahoo"
+
+    def fetch(self, ticker: str) -> List[Dict[str, Any]]:
+        import yfinance as yf
+
+        return list(yf.Ticker(ticker).news or [])
+
+
+class FixtureNewsSource:
+    """Read `{ticker: [raw item, ...]}` from a JSON file; used for tests and local runs."""
+
+    name = "fixture"
+
+    def __init__(self, path: Path = DEFAULT_NEWS_FIXTURE) -> None:
+        with Path(path).open(encoding="utf-8") as f:
+            self._items: Dict[str, List[Dict[str, Any]]] = {
+                ticker.upper(): items for ticker, items in json.load(f).items()
+            }
+
+    def fetch(self, ticker: str) -> List[Dict[str, Any]]:
+        return list(self._items.get(ticker.upper(), []))
+
+
+class _Throttle:
+    """Shared between workers: spaces request starts by the collector's random delay."""
+
+    def __init__(self, min_s: float = MIN_DELAY_S, max_s: float = MAX_DELAY_S) -> None:
+        self._min_s = min_s
+        self._max_s = max_s
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        # 락을 쥔 채로 잠들어 다음 워커의 요청 시작을 지연시킴 (요청 자체는 병렬로 진행)
+        with self._lock:
+            _sleep(self._min_s, self._max_s)
+
+
+# --------- Helpers for parsing and normalization ---------
+
+def normalize_url(url: str) -> str:
+    """Lowercase scheme/host, drop fragment and tracking query params, sort the rest."""
+
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(_TRACKING_PARAMS)
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+def _sha256(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def url_hash(url: str) -> str:
+    return _sha256(normalize_url(url))
+
+
+def content_hash(title: str, summary: Optional[str]) -> str:
+    """Hash of whitespace/case-normalized title and summary (catches syndicated copies)."""
+
+    text = f"{title}\n{summary or ''}"
+    return _sha256(" ".join(text.lower().split()))
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    if value is None or value == "":
+        return None
+    try:
+        if isinstance(value, (int, float)):
+            return datetime.fromtimestamp(value, tz=timezone.utc)
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    except (ValueError, OverflowError, OSError) as e:
+        print(f"[news_collector] _to_datetime: failed to parse {value!r}, error={e!r}")
+        return None
+
+
+def parse_news_item(ticker: str, raw: Mapping[str, Any], source: str) -> Optional[NewsEntry]:
+    """Map one raw item (flat legacy or nested `content` Yahoo format) to a NewsEntry."""
+
+    content = raw.get("content")
+    if isinstance(content, Mapping):
+        url = (content.get("canonicalUrl") or {}).get("url") or (content.get("clickThroughUrl") or {}).get("url")
+        title = content.get("title")
+        publisher = (content.get("provider") or {}).get("displayName")
+        summary = content.get("summary") or content.get("description")
+        published_at = _to_datetime(content.get("pubDate") or content.get("displayTime"))
+    else:
+        url = raw.get("link") or raw.get("url")
+        title = raw.get("title")
+        publisher = raw.get("publisher")
+        summary = raw.get("summary")
+        published_at = _to_datetime(raw.get("providerPublishTime") or raw.get("published_at"))
+
+    if not url or not title:
+        return None
+    return NewsEntry(
+        stock_code=ticker.upper(),
+        url=url,
+        title=title.strip(),
+        publisher=publisher,
+        summary=summary or None,
+        published_at=published_at,
+        source=source,
+    )
+
+
+# --------- Fetch and store ---------
+
+def fetch_news(
+    source: NewsSource,
+    tickers: Sequence[str],
+    *,
+    workers: int = DEFAULT_WORKERS,
+    throttle: bool = True,
+) -> Dict[str, List[NewsEntry]]:
+    """Fetch and parse news for *tickers* concurrently; failed tickers map to []."""
+
+    gate = _Throttle() if throttle else None
+
+    def _fetch_one(ticker: str) -> List[NewsEntry]:
+        if gate is not None:
+            gate.wait()
+        try:
+            raw_items = source.fetch(ticker)
+        except Exception as e:
+            print(f"[news_collector] fetch failed: ticker={ticker}, error={e!r}")
+            return []
+        entries = [parse_news_item(ticker, raw, source.name) for raw in raw_items]
+        return [entry for entry in entries if entry is not None]
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="news") as pool:
+        results = pool.map(_fetch_one, tickers)
+        return {ticker.upper(): entries for ticker, entries in zip(tickers, results)}
+
+
+def _load_cursors(session: Session, tickers: Sequence[str]) -> Dict[str, Optional[datetime]]:
+    rows = session.execute(
+        select(NewsCursor.stock_code, NewsCursor.last_published_at).where(NewsCursor.stock_code.in_(tickers))
+    ).all()
+    return {row.stock_code: _as_aware(row.last_published_at) for row in rows}
+
+
+def _as_aware(value: Optional[datetime]) -> Optional[datetime]:
+    # SQLite는 tz 정보를 저장하지 않으므로 UTC로 간주
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _insert_news(session: Session, rows: List[Dict[str, Any]]) -> int:
+    """Insert *rows*, skipping ones that hit a per-ticker unique key; returns the inserted count."""
+
+    dialect = session.get_bind().dialect.name
+    if dialect not in ("postgresql", "sqlite"):
+        session.execute(insert(NewsItem), rows)
+        return len(rows)
+    # 조회 이후 다른 수집 실행이 같은 기사를 넣었어도 실패하지 않도록 충돌은 무시
+    # (대상 컬럼을 지정하지 않아 두 유니크 키 모두에 적용)
+    insert_ = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    stmt = insert_(NewsItem).on_conflict_do_nothing().returning(NewsItem.id)
+    return len(session.execute(stmt, rows).all())
+
+
+def store_news(session: Session, fetched: Mapping[str, Sequence[NewsEntry]]) -> int:
+    """Insert new, non-duplicate entries and advance cursors; returns the inserted count.
+
+    Caller commits.
+    """
+
+    tickers = list(fetched)
+    if not tickers:
+        return 0
+    # 주식 테이블에 없는 종목은 FK 위반이므로 건너뜀
+    known = set(session.execute(select(Stock.code).where(Stock.code.in_(tickers))).scalars())
+    cursors = _load_cursors(session, tickers)
+
+    # 중복 판정은 종목 단위: (종목, URL 해시) / (종목, 본문 해시)
+    candidates: Dict[tuple[str, str], Dict[str, Any]] = {}
+    seen_content: set[tuple[str, str]] = set()
+    newest: Dict[str, Optional[datetime]] = {}
+    for ticker in tickers:
+        if ticker not in known:
+            print(f"[news_collector] store_news: skip unknown ticker={ticker}")
+            continue
+        cursor = cursors.get(ticker)
+        newest[ticker] = cursor
+        for entry in fetched[ticker]:
+            # 커서와 같은 시각의 기사는 새 기사일 수 있으므로 남기고 해시 중복 제거에 맡김
+            if cursor is not None and entry.published_at is not None and entry.published_at < cursor:
+                continue
+            u_hash = url_hash(entry.url)
+            c_hash = content_hash(entry.title, entry.summary)
+            if (ticker, u_hash) in candidates or (ticker, c_hash) in seen_content:
+                continue
+            seen_content.add((ticker, c_hash))
+            candidates[(ticker, u_hash)] = {
+                "stock_code": ticker,
+                "url": entry.url,
+                "url_hash": u_hash,
+                "content_hash": c_hash,
+                "title": entry.title,
+                "publisher": entry.publisher,
+                "summary": entry.summary,
+                "published_at": entry.published_at,
+                "source": entry.source,
+            }
+            if entry.published_at is not None and (newest[ticker] is None or entry.published_at > newest[ticker]):
+                newest[ticker] = entry.published_at
+
+    inserted = 0
+    if candidates:
+        # 이미 저장된 기사와의 중복은 한 번의 조회로 걸러냄
+        content_keys = [(row["stock_code"], row["content_hash"]) for row in candidates.values()]
+        existing = session.execute(
+            select(NewsItem.stock_code, NewsItem.url_hash, NewsItem.content_hash).where(
+                tuple_(NewsItem.stock_code, NewsItem.url_hash).in_(list(candidates))
+                | tuple_(NewsItem.stock_code, NewsItem.content_hash).in_(content_keys)
+            )
+        ).all()
+        existing_urls = {(row.stock_code, row.url_hash) for row in existing}
+        existing_contents = {(row.stock_code, row.content_hash) for row in existing}
+        rows = [
+            row for key, row in candidates.items()
+            if key not in existing_urls and (row["stock_code"], row["content_hash"]) not in existing_contents
+        ]
+        if rows:
+            inserted = _insert_news(session, rows)
+
+    now = datetime.now(timezone.utc)
+    updates = [
+        {"stock_code": ticker, "last_published_at": newest[ticker], "last_run_at": now}
+        for ticker in newest if ticker in cursors
+    ]
+    inserts = [
+        {"stock_code": ticker, "last_published_at": newest[ticker], "last_run_at": now}
+        for ticker in newest if ticker not in cursors
+    ]
+    if updates:
+        session.execute(update(NewsCursor), updates)
+    if inserts:
+        session.execute(insert(NewsCursor), inserts)
+
+    print(f"[news_collector] store_news: tickers={len(newest)}, candidates={len(candidates)}, inserted={inserted}")
+    return inserted
+
+
+def collect_news(
+    session: Session,
+    tickers: Iterable[str],
+    *,
+    source: Optional[NewsSource] = None,
+    workers: int = DEFAULT_WORKERS,
+) -> int:
+    """Fetch, deduplicate and store news for *tickers*; commits and returns the inserted count."""
+
+    source = source or YahooNewsSource()
+    tickers = list(dict.fromkeys(t.upper() for t in tickers))
+    started = time.perf_counter()
+    fetched = fetch_news(source, tickers, workers=workers, throttle=not isinstance(source, FixtureNewsSource))
+    inserted = store_news(session, fetched)
+    session.commit()
+    print(f"[news_collector] collect_news: tickers={len(tickers)}, inserted={inserted}, "
+          f"elapsed={time.perf_counter() - started:.2f}s")
+    return inserted
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Per-ticker news collector")
+    parser.add_argument("tickers", nargs="*", help="Ticker symbols (default: S&P 500 CSV)")
+    parser.add_argument("--csv-path", type=Path, default=DEFAULT_SP500_CSV, help="Ticker CSV used when no tickers are given")
+    parser.add_argument("--limit", type=int, default=None, help="Only the first N tickers")
+    parser.add_argument("--fixture", type=Path, default=None, help="Read news from a local JSON fixture instead of Yahoo")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent fetch workers")
+    args = parser.parse_args(argv)
+
+    tickers = args.tickers or _read_sp500_tickers(args.csv_path)
+    if args.limit is not None:
+        tickers = tickers[:args.limit]
+    source: NewsSource = FixtureNewsSource(args.fixture) if args.fixture else YahooNewsSource()
+
+    db: Session = SessionLocal()
+    try:
+        collect_news(db, tickers, source=source, workers=args.workers)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
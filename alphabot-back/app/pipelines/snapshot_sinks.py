@@ -0,0 +1,230 @@
+"""Destinations for streamed company snapshots (`stock_collector --us-all`).
+
+Snapshots are buffered and written `batch_size` at a time, so memory stays
+constant however many tickers are streamed through a sink:
+
+- `StockTableSink`: bulk upsert into `stocks` (one INSERT .. ON CONFLICT per batch)
+- `NdjsonSink`:     one JSON object per line
+- `ParquetSink`:    one row group per batch (requires the optional `pyarrow`)
+
+`open_sink()` picks the sink from the `--output` path suffix.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.models import Stock
+
+DEFAULT_SINK_BATCH_SIZE = 200
+
+# snapshot 키 -> stocks 컬럼
+SNAPSHOT_STOCK_COLUMNS: Dict[str, str] = {
+    "long_name": "company_name",
+    "sector": "sector",
+    "industry": "industry",
+    "website": "website",
+    "market_cap": "market_cap",
+    "regular_market_price": "current_price",
+    "previous_close": "previous_close",
+    "day_low": "day_low",
+    "day_high": "day_high",
+    "fifty_two_week_low": "fifty_two_week_low",
+    "fifty_two_week_high": "fifty_two_week_high",
+    "dividend_yield": "dividend_yield",
+}
+_INTEGER_COLUMNS = {"market_cap"}
+# 나머지 snapshot 키는 숫자 값
+_SNAPSHOT_TEXT_KEYS = {"ticker", "long_name", "currency", "sector", "industry", "website"}
+_TEXT_COLUMNS = {"company_name", "sector", "industry", "website"}
+
+
+def _number(value: Any, *, integer: bool) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    if math.isnan(number) or math.isinf(number):
+        return None
+    return int(round(number)) if integer else number
+
+
+def snapshot_to_stock_row(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    row: Dict[str, Any] = {"code": str(snapshot["ticker"]).upper()}
+    for key, column in SNAPSHOT_STOCK_COLUMNS.items():
+        value = snapshot.get(key)
+        if column in _TEXT_COLUMNS:
+            row[column] = None if value is None else str(value)
+        else:
+            row[column] = _number(value, integer=column in _INTEGER_COLUMNS)
+    return row
+
+
+class _BatchingSink:
+    def __init__(self, batch_size: int = DEFAULT_SINK_BATCH_SIZE) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than zero")
+        self._batch_size = batch_size
+        self._buffer: List[Dict[str, Any]] = []
+        self.written = 0
+
+    def write(self, snapshot: Dict[str, Any]) -> None:
+        self._buffer.append(snapshot)
+        if len(self._buffer) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        self._write_batch(batch)
+        self.written += len(batch)
+
+    def close(self) -> None:
+        self.flush()
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    def __enter__(self) -> "_BatchingSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class StockTableSink(_BatchingSink):
+    """Upsert snapshots into `stocks`, committing once per batch.
+
+    *on_batch(session, codes)* runs after each upsert, inside the same transaction.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        batch_size: int = DEFAULT_SINK_BATCH_SIZE,
+        *,
+        on_batch: Optional[Callable[[Session, List[str]], None]] = None,
+    ) -> None:
+        super().__init__(batch_size)
+        self._on_batch = on_batch
+        self._session = session_factory()
+        dialect = self._session.get_bind().dialect.name
+        if dialect not in ("postgresql", "sqlite"):
+            raise NotImplementedError(f"snapshot upsert is not supported for dialect {dialect!r}")
+        self._insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        # 같은 배치 안의 중복 티커는 마지막 값만 남김 (ON CONFLICT는 한 문장 내 중복을 허용하지 않음)
+        rows = list({row["code"]: row for row in map(snapshot_to_stock_row, batch)}.values())
+        stmt = self._insert(Stock)
+        table = Stock.__table__
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Stock.code],
+            set_={
+                # 이번 snapshot에 빠진 값(None)은 기존 값을 유지 (일시적인 조회 누락으로 지표가 지워지지 않도록)
+                **{
+                    column: func.coalesce(stmt.excluded[column], table.c[column])
+                    for column in SNAPSHOT_STOCK_COLUMNS.values()
+                },
+                "last_updated": func.now(),
+            },
+        )
+        try:
+            self._session.execute(stmt, rows)
+            if self._on_batch is not None:
+                self._on_batch(self._session, [row["code"] for row in rows])
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
+        print(f"[snapshot_sinks] stocks upserted: batch={len(rows)}, total={self.written + len(batch)}")
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._session.close()
+
+
+class NdjsonSink(_BatchingSink):
+    def __init__(self, path: Path, batch_size: int = DEFAULT_SINK_BATCH_SIZE) -> None:
+        super().__init__(batch_size)
+        self._file = Path(path).open("w", encoding="utf-8")
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        self._file.writelines(json.dumps(snapshot, default=str, ensure_ascii=False) + "\n" for snapshot in batch)
+        self._file.flush()
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._file.close()
+
+
+class ParquetSink(_BatchingSink):
+    """Columnar output; text snapshot fields as strings, the rest as float64."""
+
+    def __init__(self, path: Path, batch_size: int = DEFAULT_SINK_BATCH_SIZE) -> None:
+        super().__init__(batch_size)
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError("Parquet output requires the optional 'pyarrow' package") from e
+        self._pa = pa
+        self._path = Path(path)
+        self._pq = pq
+        self._writer = None
+        self._schema = None
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        if self._schema is None:
+            fields = [
+                self._pa.field(key, self._pa.string() if key in _SNAPSHOT_TEXT_KEYS else self._pa.float64())
+                for key in batch[0]
+            ]
+            self._schema = self._pa.schema(fields)
+            self._writer = self._pq.ParquetWriter(self._path, self._schema)
+        columns = {}
+        for field in self._schema:
+            values = [snapshot.get(field.name) for snapshot in batch]
+            if self._pa.types.is_floating(field.type):
+                columns[field.name] = [_number(value, integer=False) for value in values]
+            else:
+                columns[field.name] = [None if value is None else str(value) for value in values]
+        self._writer.write_table(self._pa.table(columns, schema=self._schema))
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+
+
+def open_sink(
+    output: Optional[Path],
+    session_factory: Callable[[], Session],
+    *,
+    batch_size: int = DEFAULT_SINK_BATCH_SIZE,
+    on_batch: Optional[Callable[[Session, List[str]], None]] = None,
+) -> _BatchingSink:
+    """`stocks` table when *output* is None, else NDJSON (.ndjson/.jsonl) or Parquet (.parquet)."""
+
+    if output is None:
+        return StockTableSink(session_factory, batch_size, on_batch=on_batch)
+    suffix = Path(output).suffix.lower()
+    if suffix in (".ndjson", ".jsonl"):
+        return NdjsonSink(output, batch_size)
+    if suffix == ".parquet":
+        return ParquetSink(output, batch_size)
+    raise ValueError(f"unsupported output format {suffix!r}; use .ndjson, .jsonl or .parquet")
@@ -10,38 +10,56 @@ from __future__ import annotations
 
 import argparse
 import csv
+import importlib
+import math
 import sys
 from itertools import islice
 from pathlib import Path
 from datetime import date, datetime
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 import time
 import random
 
-import requests
-import yfinance as yf
-from sqlalchemy.orm import Session
-
-# ORM models and DB session
-from app.models.models import (
-    Stock,
-    FinancialStatement,
-    ReportTypeEnum,
-)
-from app.db.database import SessionLocal
-
-# Optional imports used for type and value handling
-try:
-    import pandas as pd
-except Exception as e:  # pragma: no cover - defensive import
-    print(f"[stock_collector] pandas import failed: error={e!r}")
-    pd = None  # type: ignore
-try:
-    from pandas import Timestamp as _PandasTimestamp  # type: ignore
-except Exception as e:  # pragma: no cover - defensive import
-    print(f"[stock_collector] pandas.Timestamp import failed: error={e!r}; using stub")
-    class _PandasTimestamp:  # type: ignore
-        ...
+# Heavy dependencies (yfinance, pandas, requests, SQLAlchemy models, the DB engine and
+# the app services) are imported on first use so that `--help`, ticker-list inspection
+# and importing this module stay fast. See `benchmarks/import_time.py`.
+if TYPE_CHECKING:
+    import yfinance as yf  # noqa: F401
+    from sqlalchemy.orm import Session
+
+    from app.models.models import ReportTypeEnum, Stock
+
+
+class _LazyModule:
+    """Module proxy that imports *name* on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._module: Optional[ModuleType] = None
+
+    def __getattr__(self, attr: str) -> Any:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+requests = _LazyModule("requests")
+yf = _LazyModule("yfinance")  # noqa: F811
+
+
+def _isna(value: Any) -> bool:
+    # pandas 값은 pandas가 이미 로드된 경우(yfinance 사용 시)에만 나올 수 있음
+    pandas = sys.modules.get("pandas")
+    if pandas is not None:
+        return bool(pandas.isna(value))
+    return isinstance(value, float) and math.isnan(value)
+
+
+def _is_pandas_timestamp(value: Any) -> bool:
+    pandas = sys.modules.get("pandas")
+    return pandas is not None and isinstance(value, pandas.Timestamp)
+
 
 YF_SCREENER_URL = "https://query1.finance.yahoo.com/v1/finance/screener/predefined/saved"
 YF_US_SCREENER_ID = "universe_us"
@@ -151,7 +169,7 @@ def _to_int(value: Any) -> Optional[int]:
         if value is None:
             return None
         # Handle pandas NA/NaN
-        if pd is not None and pd.isna(value):  # type: ignore[attr-defined]
+        if _isna(value):
             return None
         # Handle numeric strings with commas or parentheses
         if isinstance(value, str):
@@ -174,7 +192,7 @@ def _to_float(value: Any) -> Optional[float]:
     try:
         if value is None:
             return None
-        if pd is not None and pd.isna(value):  # type: ignore[attr-defined]
+        if _isna(value):
             return None
         if isinstance(value, str):
             s = value.strip()
@@ -194,17 +212,18 @@ def _to_date(col_label: Any) -> Optional["date"]:
     from datetime import date, datetime
 
     try:
-        if isinstance(col_label, _PandasTimestamp):  # type: ignore
+        if _is_pandas_timestamp(col_label):
             return col_label.date()  # type: ignore[return-value]
         if isinstance(col_label, datetime):
             return col_label.date()
         if isinstance(col_label, date):
             return col_label
         # Try pandas to_datetime for strings
-        if pd is not None:
-            ts = pd.to_datetime(col_label, errors="coerce")  # type: ignore[attr-defined]
-            if ts is not None and not pd.isna(ts):  # type: ignore[attr-defined]
-                return ts.date()  # type: ignore[return-value]
+        import pandas as pd
+
+        ts = pd.to_datetime(col_label, errors="coerce")
+        if ts is not None and not pd.isna(ts):
+            return ts.date()  # type: ignore[return-value]
     except Exception as e:
         print(f"[stock_collector] _to_date: failed to convert col_label={col_label!r}, error={e!r}")
         return None
@@ -222,7 +241,7 @@ def _to_timestamp_from_epoch(value: Any) -> Optional["datetime"]:
         if isinstance(value, (int, float)):
             return datetime.fromtimestamp(int(value), tz=timezone.utc)
         # Some APIs return pandas Timestamp
-        if isinstance(value, _PandasTimestamp):  # type: ignore
+        if _is_pandas_timestamp(value):
             return value.to_pydatetime().replace(tzinfo=timezone.utc)
     except Exception as e:
         print(f"[stock_collector] _to_timestamp_from_epoch: failed to convert value={value!r}, error={e!r}")
@@ -341,6 +360,8 @@ def _upsert_stock(session: Session, ticker: str, info: Dict[str, Any]) -> Stock:
 
     print(f"[stock_collector] _upsert_stock: ticker={ticker}")
 
+    from app.models.models import Stock
+
     code = ticker.upper()
     print(f"[stock_collector] _upsert_stock: code={code}")
     # code가 존재하지 않으면 None을 반환
@@ -574,6 +595,8 @@ def _save_financials(session: Session, stock_code: str, t: yf.Ticker, report_typ
 
     print(f"[stock_collector] _save_financials: stock_code={stock_code}, report_type={report_type.value}")
 
+    from app.models.models import FinancialStatement, ReportTypeEnum
+
     if report_type == ReportTypeEnum.annual:
         income_df = _get_df(t, "financials")
         bs_df = _get_df(t, "balance_sheet")
@@ -671,6 +694,8 @@ def ingest_ticker(session: Session, ticker: str) -> None:
     """Fetch and store both Stock summary and its financial statements."""
 
     print(f"[stock_collector] ingest_ticker: ticker={ticker}")
+
+    from app.models.models import ReportTypeEnum
     # Throttle before making requests for this ticker
     _sleep()
 
@@ -692,6 +717,32 @@ def ingest_ticker(session: Session, ticker: str) -> None:
     _save_financials(session, stock.code, t, ReportTypeEnum.quarterly)
 
 
+def ingest_quote(session: Session, ticker: str) -> Stock:
+    """Fetch and store only the Stock summary (quote, valuation, profile) for *ticker*."""
+
+    print(f"[stock_collector] ingest_quote: ticker={ticker}")
+    _sleep()
+
+    t = yf.Ticker(ticker)
+    return _upsert_stock(session, ticker, t.get_info())
+
+
+def ingest_statements(session: Session, ticker: str) -> int:
+    """Fetch and store annual and quarterly statements for an existing Stock row."""
+
+    print(f"[stock_collector] ingest_statements: ticker={ticker}")
+
+    from app.models.models import ReportTypeEnum
+    _sleep()
+
+    t = yf.Ticker(ticker)
+    code = ticker.upper()
+    return (
+        _save_financials(session, code, t, ReportTypeEnum.annual)
+        + _save_financials(session, code, t, ReportTypeEnum.quarterly)
+    )
+
+
 def print_snapshot(snapshot: Dict[str, Any]) -> None:
     """Print the collected snapshot in a readable format."""
 
@@ -705,19 +756,28 @@ def print_snapshot(snapshot: Dict[str, Any]) -> None:
         print(f"- {key}: {value}")
 
 
+def iter_snapshots(tickers: Iterable[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Lazily fetch snapshots one ticker at a time; failed tickers are skipped."""
+
+    for ticker in tickers:
+        try:
+            snapshot = fetch_company_snapshot(ticker)
+        except Exception as e:
+            print(f"[stock_collector] iter_snapshots: failed ticker={ticker}, error={e!r}")
+            continue
+        yield ticker.upper(), snapshot
+        # Throttle between tickers to avoid rate limits
+        _sleep()
+
+
 def collect_many(tickers: Iterable[str]) -> Dict[str, Dict[str, Any]]:
     """Fetch snapshots for multiple tickers and print each result."""
 
-    try:
-        print(f"[stock_collector] collect_many: count={len(list(tickers))}")
-    except Exception as e:
-        print(f"[stock_collector] collect_many: failed to print count, error={e!r}")
-
     results: Dict[str, Dict[str, Any]] = {}
-    for ticker in tickers:
-        snapshot = fetch_company_snapshot(ticker)
+    for symbol, snapshot in iter_snapshots(tickers):
         print_snapshot(snapshot)
-        results[ticker.upper()] = snapshot
+        results[symbol] = snapshot
+    print(f"[stock_collector] collect_many: count={len(results)}")
     return results
 
 
@@ -775,7 +835,7 @@ def collect_all_us_companies(
     page_size: int = DEFAULT_PAGE_SIZE,
     batch_size: int = 50,
 ) -> Iterator[Tuple[str, Dict[str, Any]]]:
-    """Fetch company snapshots for the entire U.S. ticker universe."""
+    """Stream company snapshots for the entire U.S. ticker universe."""
 
     print(f"[stock_collector] collect_all_us_companies: limit={limit}, page_size={page_size}, batch_size={batch_size}")
 
@@ -783,10 +843,36 @@ def collect_all_us_companies(
     print(f"Total U.S. tickers fetched: {len(tickers)}")
     print(f"Collecting Yahoo Finance snapshots in batches of {batch_size}...")
 
-    for chunk in _chunked(tickers, batch_size):
-        chunk_results = collect_many(chunk)
-        for symbol, data in chunk_results.items():
-            yield symbol, data
+    for i, chunk in enumerate(_chunked(tickers, batch_size), 1):
+        yield from iter_snapshots(chunk)
+        print(f"[stock_collector] collect_all_us_companies: batches={i}, done={min(i * batch_size, len(tickers))}/{len(tickers)}")
+
+
+def store_all_us_companies(
+    *,
+    output: Optional[Path] = None,
+    limit: int | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    batch_size: int = 50,
+) -> int:
+    """Stream the U.S. universe into `stocks` (or *output* NDJSON/Parquet); returns the count written."""
+
+    from app.db.database import SessionLocal
+    from app.pipelines.snapshot_sinks import open_sink
+    from app.pipelines.stock_documents import refresh_stock_documents
+    from app.services.alerts import evaluate_alerts
+
+    def _after_batch(session: Session, codes: List[str]) -> None:
+        # 배치마다 상세 문서와 알림을 갱신 (전체 티커 목록을 메모리에 모으지 않음)
+        session.flush()
+        refresh_stock_documents(session, codes)
+        evaluate_alerts(session, codes)
+
+    with open_sink(output, SessionLocal, batch_size=batch_size, on_batch=_after_batch) as sink:
+        for _symbol, snapshot in collect_all_us_companies(limit=limit, page_size=page_size, batch_size=batch_size):
+            sink.write(snapshot)
+    print(f"[stock_collector] store_all_us_companies: written={sink.written}, output={output or 'stocks'}")
+    return sink.written
 
 
 def ingest_from_csv(csv_path: Path = DEFAULT_SP500_CSV, *, limit: Optional[int] = None) -> None:
@@ -800,12 +886,19 @@ def ingest_from_csv(csv_path: Path = DEFAULT_SP500_CSV, *, limit: Optional[int]
         tickers = tickers[:limit]
 
     print(f"Ingesting {len(tickers)} tickers from {csv_path}...")
+    from app.db.database import SessionLocal
+    from app.pipelines.stock_documents import refresh_stock_documents
+    from app.services.alerts import evaluate_alerts
+    from app.services.retrieval import index_stocks
+
     db: Session = SessionLocal()
     print(f"[stock_collector] ingest_from_csv: db={db}")
+    ingested: List[str] = []
     try:
         for i, sym in enumerate(tickers, 1):
             try:
                 ingest_ticker(db, sym)
+                ingested.append(sym)
                 if i % 5 == 0:
                     db.commit()
                 print(f"[{i}/{len(tickers)}] Ingested {sym}")
@@ -815,6 +908,13 @@ def ingest_from_csv(csv_path: Path = DEFAULT_SP500_CSV, *, limit: Optional[int]
             # Throttle between tickers to avoid rate limits
             _sleep()
         db.commit()
+        # Rebuild detail documents and retrieval vectors for the tickers touched in this run
+        refresh_stock_documents(db, ingested)
+        db.commit()
+        # Evaluate price/event alerts against the refreshed quotes
+        evaluate_alerts(db, ingested)
+        db.commit()
+        index_stocks(db, ingested)
     finally:
         db.close()
 
@@ -850,7 +950,13 @@ def main(argv: list[str] | None = None) -> None:
         "--batch-size",
         type=int,
         default=50,
-        help="Number of symbols to process per batch when using --us-all",
+        help="Number of symbols to process per batch (and per bulk write) when using --us-all",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="With --us-all, write snapshots to this .ndjson/.jsonl/.parquet file instead of the stocks table",
     )
     parser.add_argument(
         "--page-size",
@@ -870,26 +976,37 @@ def main(argv: list[str] | None = None) -> None:
     if args.sp500:
         ingest_from_csv(Path(args.csv_path), limit=args.limit)
     elif args.us_all:
-        for _symbol, _data in collect_all_us_companies(
+        store_all_us_companies(
+            output=Path(args.output) if args.output else None,
             limit=args.limit,
             page_size=args.page_size,
             batch_size=args.batch_size,
-        ):
-            # Output handled inside collect_many via print_snapshot.
-            pass
+        )
     else:
         tickers = args.tickers or ["AAPL"]
+        from app.db.database import SessionLocal
+        from app.pipelines.stock_documents import refresh_stock_documents
+        from app.services.alerts import evaluate_alerts
+        from app.services.retrieval import index_stocks
+
         # Ingest into DB for ad-hoc tickers as well
         db: Session = SessionLocal()
         try:
+            ingested: List[str] = []
             for sym in tickers:
                 try:
                     ingest_ticker(db, sym)
+                    ingested.append(sym)
                     print(f"Ingested {sym}")
                 except Exception as e:
                     db.rollback()
                     print(f"Error ingesting {sym}: {e}")
             db.commit()
+            refresh_stock_documents(db, ingested)
+            db.commit()
+            evaluate_alerts(db, ingested)
+            db.commit()
+            index_stocks(db, ingested)
         finally:
             db.close()
 
@@ -0,0 +1,170 @@
+"""Prebuilt per-ticker JSON documents for the stock detail panel.
+
+Each document bundles a ticker's profile, market data, valuation metrics and
+its most recent annual and quarterly financial statements. Documents are
+rebuilt by the collector after ingestion, stored gzip-compressed in
+`stock_documents`, and served as raw bytes by `GET /stocks/{code}` so a detail
+panel load costs a single primary-key lookup.
+
+A document is only rewritten when its content hash changes. The collector
+stamps `stocks.last_updated` on every upsert, so that timestamp is kept out
+of the document (it would change every hash) and served by the route as the
+`Last-Modified` header instead.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+from typing import Any, Dict, Iterable, List
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session, aliased
+
+from app.core.serialization import dumps
+from app.models.models import FinancialStatement, ReportTypeEnum, Stock, StockDocument
+
+ANNUAL_STATEMENTS = 4
+QUARTERLY_STATEMENTS = 8
+
+# 모델 정의의 구분을 그대로 따르는 문서 섹션
+STOCK_SECTIONS: Dict[str, List[str]] = {
+    "profile": [
+        "company_name", "sector", "industry", "country", "website",
+        "full_time_employees", "business_summary",
+    ],
+    "market": [
+        "current_price", "previous_close", "open", "day_high", "day_low",
+        "market_cap", "volume", "average_volume_10d",
+    ],
+    "valuation": [
+        "pe_ratio", "forward_pe", "pbr", "psr", "eps", "forward_eps",
+        "enterprise_value", "enterprise_to_revenue", "enterprise_to_ebitda",
+    ],
+    "financial_health": [
+        "profit_margins", "operating_margins", "gross_margins", "roa", "roe",
+        "total_debt", "total_cash", "debt_to_equity", "free_cashflow",
+        "revenue_growth", "earnings_growth",
+    ],
+    "price_history": [
+        "fifty_two_week_high", "fifty_two_week_low", "fifty_day_average",
+        "two_hundred_day_average", "beta",
+    ],
+    "dividends": [
+        "dividend_rate", "dividend_yield", "payout_ratio", "ex_dividend_date",
+        "last_dividend_value",
+    ],
+    "analyst": [
+        "recommendation", "target_mean_price", "target_high_price",
+        "target_low_price", "number_of_analyst_opinions",
+    ],
+}
+
+STATEMENT_FIELDS: List[str] = [
+    "revenue", "gross_profit", "operating_income", "ebitda", "net_income",
+    "total_assets", "total_liabilities", "total_equity",
+    "operating_cash_flow", "investing_cash_flow", "financing_cash_flow", "free_cash_flow",
+]
+
+
+def _dump(document: Dict[str, Any]) -> bytes:
+    # 키 정렬: 내용이 같으면 바이트도 같아야 content hash 비교가 의미 있음
+    return dumps(document, sort_keys=True)
+
+
+def _statement_dict(fs: FinancialStatement) -> Dict[str, Any]:
+    row = {"report_period": fs.report_period}
+    row.update({field: getattr(fs, field) for field in STATEMENT_FIELDS})
+    return row
+
+
+def _load_recent_statements(session: Session, codes: List[str]) -> Dict[str, Dict[str, List[FinancialStatement]]]:
+    """Load the latest N annual / quarterly statements for every code in one query."""
+
+    rn = (
+        func.row_number()
+        .over(
+            partition_by=(FinancialStatement.stock_code, FinancialStatement.report_type),
+            order_by=FinancialStatement.report_period.desc(),
+        )
+        .label("rn")
+    )
+    ranked = select(FinancialStatement, rn).where(FinancialStatement.stock_code.in_(codes)).subquery()
+    fs_alias = aliased(FinancialStatement, ranked)
+    stmt = (
+        select(fs_alias)
+        .where(
+            or_(
+                and_(ranked.c.report_type == ReportTypeEnum.annual, ranked.c.rn <= ANNUAL_STATEMENTS),
+                and_(ranked.c.report_type == ReportTypeEnum.quarterly, ranked.c.rn <= QUARTERLY_STATEMENTS),
+            )
+        )
+        .order_by(ranked.c.stock_code, ranked.c.report_period.desc())
+    )
+
+    grouped: Dict[str, Dict[str, List[FinancialStatement]]] = {
+        code: {"annual": [], "quarterly": []} for code in codes
+    }
+    for fs in session.scalars(stmt):
+        key = "annual" if fs.report_type == ReportTypeEnum.annual else "quarterly"
+        grouped[fs.stock_code][key].append(fs)
+    return grouped
+
+
+def build_stock_documents(session: Session, codes: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """Build detail documents for *codes* with two queries in total."""
+
+    codes = sorted({code.upper() for code in codes})
+    if not codes:
+        return {}
+
+    stocks = session.scalars(select(Stock).where(Stock.code.in_(codes))).all()
+    statements = _load_recent_statements(session, [stock.code for stock in stocks])
+
+    documents: Dict[str, Dict[str, Any]] = {}
+    for stock in stocks:
+        document: Dict[str, Any] = {"code": stock.code}
+        for section, fields in STOCK_SECTIONS.items():
+            document[section] = {field: getattr(stock, field) for field in fields}
+        document["statements"] = {
+            key: [_statement_dict(fs) for fs in rows]
+            for key, rows in statements[stock.code].items()
+        }
+        documents[stock.code] = document
+    return documents
+
+
+def refresh_stock_documents(session: Session, codes: Iterable[str]) -> int:
+    """Rebuild documents for *codes*, writing only those whose content changed.
+
+    Returns the number of documents written. The caller commits.
+    """
+
+    documents = build_stock_documents(session, codes)
+    if not documents:
+        return 0
+
+    existing = {
+        doc.stock_code: doc
+        for doc in session.scalars(
+            select(StockDocument).where(StockDocument.stock_code.in_(list(documents)))
+        )
+    }
+
+    written = 0
+    for code, document in documents.items():
+        raw = _dump(document)
+        content_hash = hashlib.sha256(raw).hexdigest()
+        current = existing.get(code)
+        if current is not None and current.content_hash == content_hash:
+            continue
+        payload = gzip.compress(raw, compresslevel=6)
+        if current is None:
+            session.add(StockDocument(stock_code=code, payload=payload, content_hash=content_hash))
+        else:
+            current.payload = payload
+            current.content_hash = content_hash
+        written += 1
+
+    print(f"[stock_documents] refresh_stock_documents: built={len(documents)}, written={written}")
+    return written
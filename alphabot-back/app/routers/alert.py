@@ -0,0 +1,93 @@
+from datetime import datetime, timezone
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.core.dependencies import get_current_user
+from app.db import get_db, requires_primary
+from app.models import User
+from app.models.models import AlertEvent, PriceAlert, Stock
+from app.schemas.alert import AlertCreate, AlertEventRead, AlertRead
+
+router = APIRouter(tags=["alert"])
+
+
+@router.post("/", response_model=AlertRead, status_code=status.HTTP_201_CREATED)
+def create_alert(
+    alert_in: AlertCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """가격/이벤트 알림 등록 (다음 수집 주기부터 평가)"""
+    stock_code = alert_in.stock_code.upper()
+    if db.get(Stock, stock_code) is None:
+        raise HTTPException(status_code=404, detail="Stock not found")
+
+    alert = PriceAlert(
+        user_id=current_user.user_id,
+        stock_code=stock_code,
+        field=alert_in.field,
+        condition=alert_in.condition,
+        threshold=alert_in.threshold,
+        is_active=True,
+    )
+    db.add(alert)
+    db.commit()
+    db.refresh(alert)
+    return alert
+
+
+@router.get("/", response_model=List[AlertRead])
+def list_alerts(
+    active_only: bool = Query(False, description="활성 알림만 조회"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """내 알림 규칙 목록"""
+    stmt = select(PriceAlert).where(PriceAlert.user_id == current_user.user_id)
+    if active_only:
+        stmt = stmt.where(PriceAlert.is_active.is_(True))
+    return db.execute(stmt.order_by(PriceAlert.alert_id.desc())).scalars().all()
+
+
+@router.delete("/{alert_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_alert(
+    alert_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """알림 규칙 삭제"""
+    alert = db.get(PriceAlert, alert_id)
+    if alert is None or alert.user_id != current_user.user_id:
+        raise HTTPException(status_code=404, detail="Alert not found or permission denied")
+    db.delete(alert)
+    db.commit()
+
+
+@router.get("/events", response_model=List[AlertEventRead])
+@requires_primary
+def pull_alert_events(
+    limit: int = Query(50, ge=1, le=200, description="최대 결과 수"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """전달 대기 중인 발동 알림을 가져오고 전달 완료로 표시"""
+    events = db.execute(
+        select(AlertEvent)
+        .where(AlertEvent.user_id == current_user.user_id, AlertEvent.delivered_at.is_(None))
+        .order_by(AlertEvent.event_id)
+        .limit(limit)
+    ).scalars().all()
+    # commit 이후 만료된 객체를 다시 읽지 않도록 먼저 직렬화
+    result = [AlertEventRead.model_validate(event) for event in events]
+    if events:
+        db.execute(
+            update(AlertEvent)
+            .where(AlertEvent.event_id.in_([event.event_id for event in events]))
+            .values(delivered_at=datetime.now(timezone.utc))
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+    return result
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
-from app.core.security import create_access_token, verify_password
+from app.core.security import PasswordHasherBusy, create_access_token, password_hasher
 from app.db import get_db
 from app.schemas.auth_token import Token
 from app.models import User
@@ -15,20 +16,45 @@ def get_user(db: Session, username: str):
     return db.query(User).filter(User.username == username).first()
 
 
+def _update_password_hash(db: Session, user: User, new_hash: str) -> None:
+    """해시 설정 변경 시 로그인 과정에서 비밀번호 해시를 갱신"""
+    user.password = new_hash
+    db.add(user)
+    db.commit()
+
+
 @router.post("/token", response_model=Token)
-def login_for_access_token(
+async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)
 ):
     """사용자 인증 후 jwt 액세스 토큰을 발급"""
-    user = get_user(db, username=form_data.username)
+    user = await run_in_threadpool(get_user, db, form_data.username)
+
+    try:
+        if user is None:
+            await password_hasher.dummy_verify()
+            verified, new_hash = False, None
+        else:
+            verified, new_hash = await password_hasher.verify_and_update(
+                form_data.password, user.password
+            )
+    except PasswordHasherBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress",
+            headers={"Retry-After": "1"},
+        )
 
-    if not user or not verify_password(form_data.password, user.password):
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    if new_hash is not None:
+        await run_in_threadpool(_update_password_hash, db, user, new_hash)
+
     access_token = create_access_token(data={"sub": user.username})
 
     return {"access_token": access_token, "token_type": "bearer"}
@@ -6,8 +6,8 @@ import math
 from app.db import get_db
 from app.crud.crud_category import category_crud
 from app.schemas.category import Category, CategoryCreate, CategoryUpdate, CategoryList
-from app.models.user import User
-from app.core.auth import require_admin_user
+from app.models import User
+from app.core.dependencies import require_admin_user
 
 router = APIRouter()
 
@@ -46,10 +46,9 @@ def read_categories(
     skip = (page - 1) * page_size
     
     if search:
-        categories = category_crud.search_categories(
+        categories, total = category_crud.search_categories_with_total(
             db, search_term=search, skip=skip, limit=page_size
         )
-        total = len(category_crud.search_categories(db, search_term=search, skip=0, limit=1000))
     else:
         categories = category_crud.get_multi_categories(db, skip=skip, limit=page_size)
         total = category_crud.get_count(db)
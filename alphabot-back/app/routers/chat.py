@@ -1,11 +1,26 @@
+from datetime import datetime
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_user
+from app.core.coalesce import single_flight
+from app.core.config import settings
+from app.core.rate_limit import rate_limit
+from app.core.serialization import dumps, streamed_response, trusted_response, trusted_rows
+from app.crud.crud_message import message_crud
 from app.db import get_db
-from app.schemas.chats import MessageCreate, MessageRead, ChatRead
-from app.models import User, Chat, Message
+from app.schemas.chats import (
+    MessageCreate,
+    MessageRead,
+    ChatRead,
+    ChatRoomPage,
+    ChatRoomSummary,
+    MessageSearchHit,
+    MessageSearchPage,
+)
+from app.models import User, Chat, Message, TrashEnum
 
 router = APIRouter(tags=["chat"])
 
@@ -32,19 +47,31 @@ def get_messages(
     room_id: int,
     last_message_id: int | None = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(rate_limit("messages", settings.RATE_LIMIT_MESSAGES_PER_MINUTE)),
 ):
     """특정 채팅방의 메시지 내역을 조회"""
     chat = db.query(Chat).filter(Chat.chat_id == room_id, Chat.user_id == current_user.user_id).first()
     if not chat:
         raise HTTPException(status_code=404, detail="Chat room not found or permission denied")
 
-    query = db.query(Message).filter(Message.chat_id == room_id)
+    stmt = select(Message).where(Message.chat_id == room_id)
     if last_message_id:
-        query = query.filter(Message.messages_id > last_message_id)
+        stmt = stmt.where(Message.messages_id > last_message_id)
+    stmt = stmt.order_by(Message.created_at.asc(), Message.messages_id.asc())
+
+    def load() -> bytes | None:
+        messages = db.execute(stmt.limit(settings.STREAM_JSON_MIN_ROWS + 1)).scalars().all()
+        if len(messages) > settings.STREAM_JSON_MIN_ROWS:
+            return None
+        # DB에서 읽은 행이므로 MessageRead 재검증 없이 바로 직렬화
+        return dumps(trusted_rows(messages, MessageRead))
 
-    messages = query.order_by(Message.created_at.asc()).all()
-    return messages
+    # 같은 조회가 동시에 여러 번 들어오면 쿼리와 직렬화를 한 번만 수행하고 결과를 공유
+    body = single_flight.do(("messages", str(db.get_bind().url), room_id, last_message_id), load)
+    if body is None:
+        # 메시지가 많으면 전체 본문을 메모리에 만들지 않고 조회하면서 JSON 배열로 스트리밍
+        return streamed_response(db.get_bind(), stmt, MessageRead)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/api/rooms", response_model=List[ChatRead])
@@ -53,4 +80,102 @@ def get_chat_rooms(
 ):
     """현재 사용자가 참여 중인 모든 채팅방 목록을 조회"""
     chat_rooms = db.query(Chat).filter(Chat.user_id == current_user.user_id).all()
-    return chat_rooms
+    return trusted_response(chat_rooms, ChatRead)
+
+
+# 사이드바 미리보기에 사용할 마지막 메시지 길이
+ROOM_PREVIEW_LENGTH = 100
+
+
+@router.get("/api/rooms/overview", response_model=ChatRoomPage)
+def get_chat_room_overview(
+    trash: TrashEnum = Query(TrashEnum.IN, description="휴지통 상태 필터"),
+    limit: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    before_at: datetime | None = Query(None, description="이전 페이지의 next_before_at"),
+    before_id: int | None = Query(None, description="이전 페이지의 next_before_id"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """채팅방 목록을 마지막 메시지 미리보기, 메시지 수와 함께 한 번의 쿼리로 조회"""
+    # 먼저 키셋으로 이번 페이지의 채팅방만 고른 뒤
+    sort_at = func.coalesce(Chat.lastchat_at, Chat.created_at)
+    page = select(
+        Chat.chat_id,
+        Chat.title,
+        Chat.trash_can,
+        Chat.lastchat_at,
+        sort_at.label("sort_at"),
+    ).where(Chat.user_id == current_user.user_id, Chat.trash_can == trash)
+    if before_at is not None and before_id is not None:
+        page = page.where(
+            or_(sort_at < before_at, and_(sort_at == before_at, Chat.chat_id < before_id))
+        )
+    page = page.order_by(sort_at.desc(), Chat.chat_id.desc()).limit(limit + 1).subquery()
+
+    # 그 채팅방들에 대해서만 최신 메시지와 메시지 수를 구한다
+    # (ix_messages_chat_id_messages_id 인덱스 탐색 한 번씩, 사용자의 전체 메시지는 읽지 않음)
+    def last_message(column):
+        return (
+            select(column)
+            .where(Message.chat_id == page.c.chat_id)
+            .order_by(Message.messages_id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+
+    message_count = select(func.count()).where(Message.chat_id == page.c.chat_id).scalar_subquery()
+    stmt = (
+        select(
+            page.c.chat_id,
+            page.c.title,
+            page.c.trash_can,
+            page.c.lastchat_at,
+            page.c.sort_at,
+            last_message(func.substr(Message.content, 1, ROOM_PREVIEW_LENGTH)).label("last_message"),
+            last_message(Message.created_at).label("last_message_at"),
+            message_count.label("message_count"),
+        )
+        .select_from(page)
+        .order_by(page.c.sort_at.desc(), page.c.chat_id.desc())
+    )
+
+    rows = db.execute(stmt).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    rooms = [ChatRoomSummary.model_validate(row, from_attributes=True) for row in rows]
+    if not has_more:
+        return ChatRoomPage(rooms=rooms)
+    return ChatRoomPage(
+        rooms=rooms,
+        next_before_at=rows[-1].sort_at,
+        next_before_id=rows[-1].chat_id,
+    )
+
+
+@router.get("/api/messages/search", response_model=MessageSearchPage)
+def search_messages(
+    q: str = Query(..., min_length=1, max_length=200, description="검색어"),
+    limit: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    before_score: float | None = Query(None, description="이전 페이지의 next_before_score"),
+    before_id: int | None = Query(None, description="이전 페이지의 next_before_id"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(rate_limit("search", settings.RATE_LIMIT_SEARCH_PER_MINUTE)),
+):
+    """현재 사용자의 전체 대화 내역을 전문 검색 (관련도순, 강조된 스니펫 포함)"""
+    rows, has_more = message_crud.search_messages(
+        db,
+        user_id=current_user.user_id,
+        query=q,
+        limit=limit,
+        before_score=before_score,
+        before_id=before_id,
+    )
+    hits = [MessageSearchHit.model_validate(row, from_attributes=True) for row in rows]
+    if not has_more:
+        return MessageSearchPage(hits=hits)
+    return MessageSearchPage(
+        hits=hits,
+        next_before_score=rows[-1].score,
+        next_before_id=rows[-1].messages_id,
+    )
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import JSONResponse
+
+from app.db.engines import pool_metrics
+from app.routers.metrics import require_metrics_access
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/live")
+def live():
+    """프로세스 생존 여부 (워밍업과 무관하게 항상 200)"""
+    return {"status": "ok"}
+
+
+@router.get("/ready")
+def ready(request: Request):
+    """워밍업의 DB 단계(커넥션 풀, 테이블 버전)가 성공한 뒤에만 200, 그 전에는 503"""
+    state = request.app.state.warmup
+    body = {"status": "ready" if state.ready else "warming", "steps": state.steps}
+    return JSONResponse(body, status_code=200 if state.ready else 503)
+
+
+@router.get("/pool", dependencies=[Depends(require_metrics_access)])
+def pool():
+    """엔진별 커넥션 풀 지표 (체크아웃 수, 신규 연결, 무효화, 대기 시간, 타임아웃, 현재 사용 중인 커넥션)
+
+    엔진 URL(DB 사용자·호스트)과 풀 포화도가 드러나므로 /metrics와 같은 접근 제한을 둔다"""
+    return pool_metrics()
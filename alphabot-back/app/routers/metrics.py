@@ -0,0 +1,47 @@
+import hmac
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+
+from app.core.config import settings
+from app.core.metrics import metrics, profiles
+
+_LOOPBACK_HOSTS = frozenset({"127.0.0.1", "::1", "localhost"})
+
+
+def require_metrics_access(request: Request) -> None:
+    """지표·쿼리 샘플·프로파일은 내부용: PROFILE_TOKEN이 있으면 `Authorization: Bearer <토큰>`,
+    없으면 같은 호스트(loopback)에서 온 요청만 허용"""
+    token = settings.PROFILE_TOKEN
+    if token:
+        scheme, _, credentials = (request.headers.get("authorization") or "").partition(" ")
+        if scheme.lower() == "bearer" and hmac.compare_digest(credentials.encode(), token.encode()):
+            return
+    elif request.client is not None and request.client.host in _LOOPBACK_HOSTS:
+        return
+    raise HTTPException(status_code=403, detail="Metrics are internal only")
+
+
+router = APIRouter(tags=["metrics"], dependencies=[Depends(require_metrics_access)])
+
+
+@router.get("", response_class=PlainTextResponse)
+def prometheus_metrics():
+    """Prometheus 텍스트 형식 지표 (라우트별 지연 시간, 요청당 쿼리 수·시간, 커넥션 풀)"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
+@router.get("/slow-queries")
+def slow_queries():
+    """METRICS_SLOW_QUERY_SECONDS 이상 걸린 최근 쿼리 샘플 (최신순)"""
+    return [asdict(sample) for sample in reversed(metrics.slow_queries)]
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+def get_profile(profile_id: str):
+    """X-Profile 헤더로 프로파일링한 요청의 collapsed stack (flamegraph.pl 입력 형식)"""
+    collapsed = profiles.get(profile_id)
+    if collapsed is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(collapsed)
@@ -0,0 +1,49 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import and_, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.serialization import FastJSONResponse, trusted_rows
+from app.db import get_db
+from app.models.models import NewsItem
+from app.schemas.stock import NewsItemRead, NewsPage
+
+router = APIRouter(tags=["news"])
+
+
+@router.get("/{code}", response_model=NewsPage)
+def get_stock_news(
+    code: str,
+    limit: int = Query(20, ge=1, le=100, description="최대 결과 수"),
+    before_at: Optional[datetime] = Query(None, description="이전 페이지의 next_before_at"),
+    before_id: Optional[int] = Query(None, description="이전 페이지의 next_before_id"),
+    db: Session = Depends(get_db),
+):
+    """종목의 최신 뉴스 (뉴스 수집 파이프라인이 저장한 기사, 게시 시각 내림차순)"""
+    stmt = select(NewsItem).where(NewsItem.stock_code == code.upper())
+    # (published_at DESC NULLS LAST, id DESC) 키셋: 같은 시각의 기사도 id로 이어 받고,
+    # 게시 시각이 없는 기사는 목록 끝에서 id만으로 이어 받는다
+    if before_id is not None:
+        if before_at is not None:
+            stmt = stmt.where(
+                or_(
+                    NewsItem.published_at < before_at,
+                    and_(NewsItem.published_at == before_at, NewsItem.id < before_id),
+                    NewsItem.published_at.is_(None),
+                )
+            )
+        else:
+            stmt = stmt.where(NewsItem.published_at.is_(None), NewsItem.id < before_id)
+    stmt = stmt.order_by(NewsItem.published_at.desc().nulls_last(), NewsItem.id.desc()).limit(limit + 1)
+
+    rows = db.execute(stmt).scalars().all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    last = rows[-1] if has_more else None
+    return FastJSONResponse({
+        "items": trusted_rows(rows, NewsItemRead),
+        "next_before_at": last.published_at if last is not None else None,
+        "next_before_id": last.id if last is not None else None,
+    })
@@ -0,0 +1,79 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.dependencies import get_current_user
+from app.db import get_db, requires_primary
+from app.models import User
+from app.models.models import Holding, Stock
+from app.schemas.portfolio import HoldingRead, HoldingUpsert, PortfolioValuation
+from app.services.portfolio import portfolio_cache
+
+router = APIRouter(tags=["portfolio"])
+
+
+@router.get("/holdings", response_model=List[HoldingRead])
+def list_holdings(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """내 보유 종목 목록"""
+    return db.execute(
+        select(Holding).where(Holding.user_id == current_user.user_id).order_by(Holding.stock_code)
+    ).scalars().all()
+
+
+@router.put("/holdings/{code}", response_model=HoldingRead)
+def upsert_holding(
+    code: str,
+    holding_in: HoldingUpsert,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """보유 종목 등록 또는 수량/평균 매입가 수정"""
+    stock_code = code.upper()
+    if db.get(Stock, stock_code) is None:
+        raise HTTPException(status_code=404, detail="Stock not found")
+
+    holding = db.execute(
+        select(Holding).where(Holding.user_id == current_user.user_id, Holding.stock_code == stock_code)
+    ).scalar_one_or_none()
+    if holding is None:
+        holding = Holding(user_id=current_user.user_id, stock_code=stock_code)
+        db.add(holding)
+    holding.quantity = holding_in.quantity
+    holding.average_cost = holding_in.average_cost
+    db.commit()
+    db.refresh(holding)
+    portfolio_cache.invalidate(current_user.user_id)
+    return holding
+
+
+@router.delete("/holdings/{code}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_holding(
+    code: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """보유 종목 삭제"""
+    holding = db.execute(
+        select(Holding).where(Holding.user_id == current_user.user_id, Holding.stock_code == code.upper())
+    ).scalar_one_or_none()
+    if holding is None:
+        raise HTTPException(status_code=404, detail="Holding not found")
+    db.delete(holding)
+    db.commit()
+    portfolio_cache.invalidate(current_user.user_id)
+
+
+@router.get("/valuation", response_model=PortfolioValuation)
+# 캐시 키가 primary의 table_versions이므로 캐시를 채우는 조회도 primary에서
+@requires_primary
+def get_portfolio_valuation(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """실시간 시세 기준 평가금액, 평가손익, 수익률 (다음 시세 갱신 전까지 캐시)"""
+    return portfolio_cache.get(db, current_user.user_id)
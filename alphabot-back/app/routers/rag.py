@@ -0,0 +1,43 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.rate_limit import rate_limit
+from app.db import get_db
+from app.models import User
+from app.schemas.rag import RetrievalHit
+from app.services import retrieval
+
+router = APIRouter(tags=["rag"])
+
+
+def _to_hits(results) -> List[RetrievalHit]:
+    return [RetrievalHit(key=str(key), score=score, metadata=metadata) for key, score, metadata in results]
+
+
+@router.get("/search/stocks", response_model=List[RetrievalHit])
+def search_stocks(
+    q: str = Query(..., min_length=1, description="검색 질의"),
+    k: int = Query(5, ge=1, le=50, description="결과 수"),
+    sector: str | None = Query(None, description="섹터 필터"),
+    current_user: User = Depends(rate_limit("search", settings.RATE_LIMIT_SEARCH_PER_MINUTE)),
+):
+    """종목 사업 개요에 대한 벡터 검색 (챗봇 근거 자료용)"""
+    filters = {"sector": sector} if sector else None
+    return _to_hits(retrieval.search_stocks(q, k=k, filters=filters))
+
+
+@router.get("/search/messages", response_model=List[RetrievalHit])
+def search_messages(
+    q: str = Query(..., min_length=1, description="검색 질의"),
+    k: int = Query(5, ge=1, le=50, description="결과 수"),
+    chat_id: int | None = Query(None, description="채팅방 필터"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(rate_limit("search", settings.RATE_LIMIT_SEARCH_PER_MINUTE)),
+):
+    """현재 사용자의 채팅 메시지에 대한 벡터 검색"""
+    return _to_hits(
+        retrieval.search_messages(db, q, user_id=current_user.user_id, k=k, chat_id=chat_id)
+    )
@@ -0,0 +1,101 @@
+import gzip
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.coalesce import single_flight
+from app.core.config import settings
+from app.core.serialization import dumps, streamed_response, trusted_rows
+from app.db import SessionLocal, get_db
+from app.models.models import FinancialStatement, ReportTypeEnum, Stock, StockDocument
+from app.schemas.stock import FinancialStatementRead, StockSuggestionRead
+from app.services.stock_interest import stock_interest
+from app.services.stock_search import stock_suggest_index
+
+router = APIRouter(tags=["stock"])
+
+
+# /{code} 보다 먼저 등록되어야 함
+@router.get("/suggest", response_model=List[StockSuggestionRead])
+def suggest_stocks(
+    q: str = Query(..., min_length=1, max_length=50, description="종목명 또는 종목코드 일부"),
+    limit: int = Query(10, ge=1, le=50, description="최대 결과 수"),
+):
+    """종목명/종목코드 자동완성 (시가총액 순, 메모리 인덱스 사용)"""
+    stock_suggest_index.ensure_fresh(SessionLocal)
+    return stock_suggest_index.suggest(q, limit=limit)
+
+
+@router.get("/{code}")
+def get_stock_detail(code: str, request: Request, db: Session = Depends(get_db)):
+    """종목 상세 정보(프로필, 밸류에이션, 최근 재무제표)를 미리 만들어 둔 문서로 반환"""
+    code = code.upper()
+    # 수집기 갱신 직후 같은 종목 조회가 몰려도 DB 조회는 한 번만
+    row = single_flight.do(
+        ("stock_document", str(db.get_bind().url), code),
+        lambda: db.execute(
+            select(StockDocument.payload, Stock.last_updated)
+            .join(Stock, Stock.code == StockDocument.stock_code)
+            .where(StockDocument.stock_code == code)
+        ).one_or_none(),
+    )
+    if row is None:
+        raise HTTPException(status_code=404, detail="Stock not found")
+    payload, last_updated = row
+    # 최근 조회 종목은 수집 스케줄러가 더 자주 갱신
+    stock_interest.record(code, SessionLocal)
+
+    # 수집 시각은 문서 해시에서 빠져 있으므로 헤더로 전달
+    headers = {"Vary": "Accept-Encoding"}
+    if last_updated is not None:
+        headers["Last-Modified"] = _http_date(last_updated)
+
+    # 문서는 gzip으로 저장되어 있으므로 클라이언트가 지원하면 그대로 전송
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            content=payload,
+            media_type="application/json",
+            headers={**headers, "Content-Encoding": "gzip"},
+        )
+    return Response(content=gzip.decompress(payload), media_type="application/json", headers=headers)
+
+
+def _http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def record_cached_view(path: str) -> None:
+    """응답 캐시가 라우팅 전에 응답한 `/stocks/{code}` 조회도 관심 종목으로 기록"""
+    parts = path.strip("/").split("/")
+    if len(parts) == 2 and parts[1] != "suggest":
+        stock_interest.record(parts[1].upper(), SessionLocal)
+
+
+@router.get("/{code}/statements", response_model=List[FinancialStatementRead])
+def get_statement_history(
+    code: str,
+    report_type: Optional[ReportTypeEnum] = Query(None, description="Annual / Quarterly (생략 시 전체)"),
+    db: Session = Depends(get_db),
+):
+    """종목의 전체 재무제표 이력 (보고 기간 내림차순, 행이 많으면 스트리밍)"""
+    stmt = select(FinancialStatement).where(FinancialStatement.stock_code == code.upper())
+    if report_type is not None:
+        stmt = stmt.where(FinancialStatement.report_type == report_type)
+    stmt = stmt.order_by(FinancialStatement.report_period.desc(), FinancialStatement.id.desc())
+
+    def load() -> Optional[bytes]:
+        statements = db.execute(stmt.limit(settings.STREAM_JSON_MIN_ROWS + 1)).scalars().all()
+        if len(statements) > settings.STREAM_JSON_MIN_ROWS:
+            return None
+        return dumps(trusted_rows(statements, FinancialStatementRead))
+
+    body = single_flight.do(("statements", str(db.get_bind().url), code.upper(), report_type), load)
+    if body is None:
+        return streamed_response(db.get_bind(), stmt, FinancialStatementRead)
+    return Response(content=body, media_type="application/json")
@@ -0,0 +1,104 @@
+import json
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.dependencies import get_current_user
+from app.db import get_db
+from app.models import User
+from app.models.models import Stock, WatchlistItem
+from app.schemas.stock import WatchlistItemRead
+from app.services.quote_fanout import quote_hub
+
+router = APIRouter(tags=["watchlist"])
+
+# 연결 유지용 주석 이벤트 간격 (초)
+STREAM_KEEPALIVE_SECONDS = 30.0
+
+
+@router.get("/", response_model=List[WatchlistItemRead])
+def list_watchlist(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """내 관심 종목 목록"""
+    return db.execute(
+        select(WatchlistItem).where(WatchlistItem.user_id == current_user.user_id).order_by(WatchlistItem.stock_code)
+    ).scalars().all()
+
+
+@router.put("/{code}", response_model=WatchlistItemRead)
+def add_to_watchlist(
+    code: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """관심 종목 추가 (이미 있으면 그대로 반환)"""
+    stock_code = code.upper()
+    if db.get(Stock, stock_code) is None:
+        raise HTTPException(status_code=404, detail="Stock not found")
+
+    item = db.execute(
+        select(WatchlistItem).where(WatchlistItem.user_id == current_user.user_id, WatchlistItem.stock_code == stock_code)
+    ).scalar_one_or_none()
+    if item is None:
+        item = WatchlistItem(user_id=current_user.user_id, stock_code=stock_code)
+        db.add(item)
+        db.commit()
+        db.refresh(item)
+    return item
+
+
+@router.delete("/{code}", status_code=status.HTTP_204_NO_CONTENT)
+def remove_from_watchlist(
+    code: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """관심 종목 삭제"""
+    item = db.execute(
+        select(WatchlistItem).where(WatchlistItem.user_id == current_user.user_id, WatchlistItem.stock_code == code.upper())
+    ).scalar_one_or_none()
+    if item is None:
+        raise HTTPException(status_code=404, detail="Watchlist item not found")
+    db.delete(item)
+    db.commit()
+
+
+def _watchlist_codes(db: Session, user_id: int) -> List[str]:
+    """스트림 시작 시 한 번만 조회하고, 연결이 오래 유지되므로 세션은 바로 반환"""
+    try:
+        return db.execute(
+            select(WatchlistItem.stock_code).where(WatchlistItem.user_id == user_id)
+        ).scalars().all()
+    finally:
+        db.close()
+
+
+@router.get("/stream")
+async def stream_watchlist_quotes(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """관심 종목 시세 변경분을 Server-Sent Events로 전송 (종목별 공유 구독)"""
+    # 동기 DB 조회가 이벤트 루프를 막지 않도록 스레드 풀에서 실행
+    codes = await run_in_threadpool(_watchlist_codes, db, current_user.user_id)
+    subscriber = quote_hub.subscribe(codes)
+
+    async def events():
+        try:
+            while not await request.is_disconnected():
+                updates = await subscriber.next_updates(timeout=STREAM_KEEPALIVE_SECONDS)
+                if updates:
+                    yield f"event: quotes\ndata: {json.dumps(updates, separators=(',', ':'))}\n\n"
+                else:
+                    yield ": keepalive\n\n"
+        finally:
+            quote_hub.unsubscribe(subscriber)
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
@@ -0,0 +1,48 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from decimal import Decimal
+from typing import Literal, Optional
+
+from app.models.models import AlertConditionEnum
+
+AlertField = Literal[
+    "current_price", "day_high", "day_low", "fifty_two_week_high", "fifty_two_week_low", "change_percent"
+]
+
+
+class AlertCreate(BaseModel):
+    """가격/이벤트 알림 생성을 위한 요청 스키마"""
+    stock_code: str = Field(..., max_length=20, description="종목 코드")
+    field: AlertField = Field("current_price", description="비교 대상 (change_percent는 전일 종가 대비 등락률 %)")
+    condition: AlertConditionEnum = Field(..., description="above: 값 >= 기준값, below: 값 <= 기준값")
+    threshold: Decimal = Field(..., description="기준값")
+
+
+class AlertRead(BaseModel):
+    """알림 규칙 응답 스키마"""
+    alert_id: int
+    stock_code: str
+    field: str
+    condition: AlertConditionEnum
+    threshold: Decimal
+    is_active: bool
+    created_at: Optional[datetime] = None
+    triggered_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class AlertEventRead(BaseModel):
+    """발동된 알림 응답 스키마"""
+    event_id: int
+    alert_id: int
+    stock_code: str
+    field: str
+    condition: AlertConditionEnum
+    threshold: Decimal
+    value: Decimal
+    triggered_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
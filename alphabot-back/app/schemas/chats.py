@@ -1,5 +1,8 @@
 from pydantic import BaseModel
 from datetime import datetime
+from typing import Optional
+
+from app.models import TrashEnum
 
 # 메시지 생성을 위한 요청 스키마
 # POST /api/rooms/{room_id}/messages
@@ -27,4 +30,47 @@ class ChatRead(BaseModel):
     title: str
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# 사이드바용 채팅방 요약 (마지막 메시지 미리보기 + 메시지 수)
+# GET /api/rooms/overview
+class ChatRoomSummary(BaseModel):
+    chat_id: int
+    title: str
+    trash_can: TrashEnum
+    lastchat_at: Optional[datetime] = None
+    last_message: Optional[str] = None
+    last_message_at: Optional[datetime] = None
+    message_count: int = 0
+
+    class Config:
+        from_attributes = True
+
+
+class ChatRoomPage(BaseModel):
+    rooms: list[ChatRoomSummary]
+    # 다음 페이지 요청 시 before_at / before_id 로 그대로 전달 (키셋 페이지네이션)
+    next_before_at: Optional[datetime] = None
+    next_before_id: Optional[int] = None
+
+
+# 메시지 전문 검색 결과
+# snippet은 HTML 조각이다: 메시지 본문은 HTML 이스케이프되어 있고, 일치 구간만 <mark>...</mark>로 감싼다
+# (클라이언트는 이 값을 그대로 innerHTML에 넣어도 되며, 다시 이스케이프하면 안 된다)
+# GET /api/messages/search
+class MessageSearchHit(BaseModel):
+    messages_id: int
+    chat_id: int
+    created_at: datetime
+    score: float
+    snippet: str
+
+    class Config:
+        from_attributes = True
+
+
+class MessageSearchPage(BaseModel):
+    hits: list[MessageSearchHit]
+    # 다음 페이지 요청 시 before_score / before_id 로 그대로 전달 (키셋 페이지네이션)
+    next_before_score: Optional[float] = None
+    next_before_id: Optional[int] = None
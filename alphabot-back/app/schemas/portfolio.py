@@ -0,0 +1,49 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
+
+
+class HoldingUpsert(BaseModel):
+    """보유 종목 등록/수정을 위한 요청 스키마"""
+    quantity: Decimal = Field(..., gt=0, description="보유 수량")
+    average_cost: Decimal = Field(..., ge=0, description="주당 평균 매입가")
+
+
+class HoldingRead(BaseModel):
+    """보유 종목 응답 스키마"""
+    stock_code: str
+    quantity: Decimal
+    average_cost: Decimal
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class PositionValuation(BaseModel):
+    """종목별 평가 (시세가 없으면 평가 관련 값은 null)"""
+    stock_code: str
+    company_name: Optional[str] = None
+    quantity: float
+    average_cost: float
+    current_price: Optional[float] = None
+    previous_close: Optional[float] = None
+    cost_basis: float
+    market_value: Optional[float] = None
+    unrealized_pnl: Optional[float] = None
+    return_pct: Optional[float] = None
+    day_change: Optional[float] = None
+    day_change_pct: Optional[float] = None
+    weight_pct: Optional[float] = None
+
+
+class PortfolioValuation(BaseModel):
+    """포트폴리오 전체 평가 응답 스키마"""
+    positions: List[PositionValuation]
+    total_cost_basis: Optional[float] = None
+    total_market_value: Optional[float] = None
+    total_unrealized_pnl: Optional[float] = None
+    total_return_pct: Optional[float] = None
+    total_day_change: Optional[float] = None
+    total_day_change_pct: Optional[float] = None
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+from typing import Any, Dict
+
+
+# 벡터 검색 결과 응답 스키마
+# GET /reports/search/stocks, GET /reports/search/messages
+class RetrievalHit(BaseModel):
+    key: str
+    score: float
+    metadata: Dict[str, Any]
@@ -0,0 +1,68 @@
+from pydantic import BaseModel
+from datetime import date, datetime
+from typing import List, Optional
+
+
+# 종목 자동완성 응답 스키마
+# GET /stocks/suggest?q=
+class StockSuggestionRead(BaseModel):
+    code: str
+    company_name: Optional[str] = None
+    sector: Optional[str] = None
+    market_cap: Optional[int] = None
+
+    class Config:
+        from_attributes = True
+
+
+# 종목 뉴스 응답 스키마
+# GET /news/{code}
+class NewsItemRead(BaseModel):
+    url: str
+    title: str
+    publisher: Optional[str] = None
+    summary: Optional[str] = None
+    published_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class NewsPage(BaseModel):
+    items: List[NewsItemRead]
+    # 다음 페이지 요청 시 before_at / before_id 로 그대로 전달 (키셋 페이지네이션)
+    # 게시 시각이 없는 기사(목록 끝)에 이르면 next_before_at 없이 next_before_id만 온다
+    next_before_at: Optional[datetime] = None
+    next_before_id: Optional[int] = None
+
+
+# 관심 종목 응답 스키마
+# GET /watchlist
+class WatchlistItemRead(BaseModel):
+    stock_code: str
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+# 재무제표 이력 응답 스키마
+# GET /stocks/{code}/statements
+class FinancialStatementRead(BaseModel):
+    report_period: date
+    report_type: str
+    revenue: Optional[int] = None
+    gross_profit: Optional[int] = None
+    operating_income: Optional[int] = None
+    ebitda: Optional[int] = None
+    net_income: Optional[int] = None
+    total_assets: Optional[int] = None
+    total_liabilities: Optional[int] = None
+    total_equity: Optional[int] = None
+    operating_cash_flow: Optional[int] = None
+    investing_cash_flow: Optional[int] = None
+    financing_cash_flow: Optional[int] = None
+    free_cash_flow: Optional[int] = None
+
+    class Config:
+        from_attributes = True
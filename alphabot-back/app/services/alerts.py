@@ -0,0 +1,205 @@
+"""Price and event alert evaluation.
+
+Active `PriceAlert` rules are compiled into sorted threshold arrays keyed by
+(field, condition, stock_code). Evaluating a refreshed stock is then one
+`searchsorted` per (field, condition) pair: every `above` rule with a
+threshold <= the value fires, every `below` rule with a threshold >= the
+value fires. Cost scales with the number of changed stocks (and the alerts
+that actually fire), not with the total number of rules.
+
+Fired alerts are one-shot: they are deactivated and an `AlertEvent` row is
+queued for delivery in the same transaction.
+
+The compiled book is rebuilt whenever the `price_alerts` table version (see
+`app.db.versioning`) changes.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models import TableVersion
+from app.models.models import AlertConditionEnum, AlertEvent, PriceAlert, Stock
+
+ALERTS_TABLE = PriceAlert.__tablename__
+
+# Stock 컬럼 + 파생 값(change_percent: 전일 종가 대비 등락률 %)
+STOCK_FIELDS = ("current_price", "day_high", "day_low", "fifty_two_week_high", "fifty_two_week_low")
+ALERT_FIELDS = STOCK_FIELDS + ("change_percent",)
+
+
+@dataclass(frozen=True)
+class AlertHit:
+    alert_id: int
+    user_id: int
+    stock_code: str
+    field: str
+    condition: AlertConditionEnum
+    threshold: float
+    value: float
+
+
+def stock_field_values(row: Any) -> Dict[str, float]:
+    """Alert-relevant values of a Stock row (None columns are skipped)."""
+
+    values = {
+        field: float(getattr(row, field))
+        for field in STOCK_FIELDS
+        if getattr(row, field, None) is not None
+    }
+    previous_close = getattr(row, "previous_close", None)
+    if row.current_price is not None and previous_close:
+        values["change_percent"] = (float(row.current_price) / float(previous_close) - 1.0) * 100.0
+    return values
+
+
+class AlertBook:
+    """Active rules as sorted threshold arrays per (field, condition, stock_code)."""
+
+    def __init__(self, rules: Iterable[Tuple[int, int, str, str, AlertConditionEnum, Any]] = ()) -> None:
+        grouped: Dict[Tuple[str, AlertConditionEnum, str], List[Tuple[float, int, int]]] = {}
+        for alert_id, user_id, stock_code, field, condition, threshold in rules:
+            grouped.setdefault((field, condition, stock_code), []).append((float(threshold), alert_id, user_id))
+
+        self._arrays: Dict[Tuple[str, AlertConditionEnum, str], Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        for key, items in grouped.items():
+            items.sort()
+            self._arrays[key] = (
+                np.fromiter((t for t, _, _ in items), dtype=np.float64, count=len(items)),
+                np.fromiter((a for _, a, _ in items), dtype=np.int64, count=len(items)),
+                np.fromiter((u for _, _, u in items), dtype=np.int64, count=len(items)),
+            )
+        self._fired: Set[int] = set()
+        self.size = sum(len(items) for items in grouped.values())
+
+    def evaluate(self, stock_code: str, values: Mapping[str, float]) -> List[AlertHit]:
+        hits: List[AlertHit] = []
+        for field, value in values.items():
+            for condition in AlertConditionEnum:
+                arrays = self._arrays.get((field, condition, stock_code))
+                if arrays is None:
+                    continue
+                thresholds, alert_ids, user_ids = arrays
+                if condition is AlertConditionEnum.above:
+                    matched = slice(0, int(np.searchsorted(thresholds, value, side="right")))
+                else:
+                    matched = slice(int(np.searchsorted(thresholds, value, side="left")), len(thresholds))
+                for threshold, alert_id, user_id in zip(
+                    thresholds[matched].tolist(), alert_ids[matched].tolist(), user_ids[matched].tolist()
+                ):
+                    if alert_id in self._fired:
+                        continue
+                    hits.append(AlertHit(alert_id, user_id, stock_code, field, condition, threshold, value))
+        return hits
+
+    def mark_fired(self, alert_ids: Iterable[int]) -> None:
+        # 재컴파일 전까지 같은 알림이 다시 발동되지 않도록 기록
+        self._fired.update(alert_ids)
+
+
+class AlertEngine:
+    """Process-wide compiled alert book plus the last evaluated values per stock."""
+
+    def __init__(self) -> None:
+        self._book = AlertBook()
+        self._version: Optional[int] = None
+        self._last_values: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def ensure_compiled(self, session: Session) -> AlertBook:
+        """Recompile the book when the `price_alerts` table version has changed."""
+
+        version = session.execute(
+            select(TableVersion.version).where(TableVersion.table_name == ALERTS_TABLE)
+        ).scalar_one_or_none() or 0
+        with self._lock:
+            if version != self._version:
+                rules = session.execute(
+                    select(
+                        PriceAlert.alert_id,
+                        PriceAlert.user_id,
+                        PriceAlert.stock_code,
+                        PriceAlert.field,
+                        PriceAlert.condition,
+                        PriceAlert.threshold,
+                    ).where(PriceAlert.is_active.is_(True))
+                ).all()
+                self._book = AlertBook(rules)
+                self._version = version
+                # 새 규칙은 가격이 그대로여도 한 번은 평가되어야 함
+                self._last_values.clear()
+                print(f"[alerts] compiled: rules={self._book.size}, version={version}")
+            return self._book
+
+    def evaluate(self, session: Session, stock_codes: Iterable[str]) -> List[AlertHit]:
+        """Evaluate the rules of *stock_codes* whose values changed since the last call."""
+
+        codes = list(dict.fromkeys(code.upper() for code in stock_codes))
+        if not codes:
+            return []
+        book = self.ensure_compiled(session)
+        if not book.size:
+            return []
+
+        rows = session.execute(
+            select(Stock.code, Stock.previous_close, *(getattr(Stock, field) for field in STOCK_FIELDS))
+            .where(Stock.code.in_(codes))
+        ).all()
+        hits: List[AlertHit] = []
+        with self._lock:
+            for row in rows:
+                values = stock_field_values(row)
+                if self._last_values.get(row.code) == values:
+                    continue
+                self._last_values[row.code] = values
+                hits.extend(book.evaluate(row.code, values))
+            book.mark_fired(hit.alert_id for hit in hits)
+        return hits
+
+
+alert_engine = AlertEngine()
+
+
+def evaluate_alerts(session: Session, stock_codes: Iterable[str]) -> int:
+    """Evaluate alerts for refreshed stocks and queue fired ones; caller commits.
+
+    Returns the number of queued alert events.
+    """
+
+    hits = alert_engine.evaluate(session, stock_codes)
+    if not hits:
+        return 0
+
+    now = datetime.now(timezone.utc)
+    session.execute(
+        insert(AlertEvent),
+        [
+            {
+                "alert_id": hit.alert_id,
+                "user_id": hit.user_id,
+                "stock_code": hit.stock_code,
+                "field": hit.field,
+                "condition": hit.condition,
+                "threshold": Decimal(str(hit.threshold)),
+                "value": Decimal(str(round(hit.value, 4))),
+                "triggered_at": now,
+            }
+            for hit in hits
+        ],
+    )
+    session.execute(
+        update(PriceAlert)
+        .where(PriceAlert.alert_id.in_([hit.alert_id for hit in hits]))
+        .values(is_active=False, triggered_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    print(f"[alerts] evaluate_alerts: queued={len(hits)}")
+    return len(hits)
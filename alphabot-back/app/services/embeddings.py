@@ -0,0 +1,105 @@
+"""Pluggable text embedders for the local retrieval index.
+
+`get_embedder()` returns the embedder selected by `settings.EMBEDDER`.
+The default `hashing` embedder is deterministic, dependency-free (NumPy only)
+and always available; other embedders are registered by name and fall back
+to it when their optional dependency is missing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from functools import lru_cache
+from typing import Callable, Dict, List, Protocol, Sequence
+
+import numpy as np
+
+from app.core.config import settings
+
+_TOKEN_RE = re.compile(r"[0-9a-z가-힣]+")
+
+
+class Embedder(Protocol):
+    """Maps texts to L2-normalized float32 vectors of a fixed dimension."""
+
+    name: str
+    dim: int
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        ...
+
+
+def _l2_normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).astype(np.float32, copy=False)
+
+
+class HashingEmbedder:
+    """Feature-hashing embedder over word unigrams and bigrams.
+
+    Same text always yields the same vector across processes and machines,
+    which keeps persisted indexes valid without a model download.
+    """
+
+    def __init__(self, dim: int) -> None:
+        self.name = f"hashing-{dim}"
+        self.dim = dim
+
+    def _features(self, text: str) -> List[str]:
+        tokens = _TOKEN_RE.findall(text.lower())
+        return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text or ""):
+                digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+                value = int.from_bytes(digest, "little")
+                sign = 1.0 if value & 1 else -1.0
+                vectors[row, (value >> 1) % self.dim] += sign
+        # 빈도 편향 완화 (sublinear tf)
+        np.copysign(np.log1p(np.abs(vectors)), vectors, out=vectors)
+        return _l2_normalize(vectors)
+
+
+class SentenceTransformerEmbedder:
+    """Embedder backed by the optional `sentence-transformers` package."""
+
+    def __init__(self, model_name: str) -> None:
+        from sentence_transformers import SentenceTransformer  # type: ignore
+
+        self._model = SentenceTransformer(model_name)
+        self.name = f"st-{model_name}"
+        self.dim = int(self._model.get_sentence_embedding_dimension())
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = self._model.encode(list(texts), convert_to_numpy=True, show_progress_bar=False)
+        return _l2_normalize(np.asarray(vectors, dtype=np.float32))
+
+
+_EMBEDDERS: Dict[str, Callable[[], Embedder]] = {
+    "hashing": lambda: HashingEmbedder(settings.EMBEDDING_DIM),
+    "sentence-transformers": lambda: SentenceTransformerEmbedder(settings.EMBEDDING_MODEL),
+}
+
+
+def register_embedder(name: str, factory: Callable[[], Embedder]) -> None:
+    """Make an embedder selectable through `settings.EMBEDDER`."""
+
+    _EMBEDDERS[name] = factory
+    get_embedder.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def get_embedder() -> Embedder:
+    """Return the configured embedder, falling back to the hashing embedder."""
+
+    factory = _EMBEDDERS.get(settings.EMBEDDER)
+    if factory is not None:
+        try:
+            return factory()
+        except Exception as e:
+            print(f"[embeddings] embedder {settings.EMBEDDER!r} unavailable, using hashing: error={e!r}")
+    return HashingEmbedder(settings.EMBEDDING_DIM)
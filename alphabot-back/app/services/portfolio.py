@@ -0,0 +1,159 @@
+"""Portfolio valuation over a user's holdings.
+
+One query joins `holdings` to the latest `stocks` quote; per-position and
+aggregate figures are computed column-wise with NumPy. Results are cached
+per user and keyed by the `stocks` table version, so a cached valuation is
+served until the collector writes new prices. Holding edits invalidate only
+the editing user's entry (`invalidate`); keying on the global `holdings`
+version would evict every user's valuation on any edit.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.versioning import table_versions
+from app.models.models import Holding, Stock
+
+VALUATION_TABLES = ("stocks",)
+_CACHE_MAX_USERS = 1024
+
+
+def _column(rows: List[Any], attr: str) -> np.ndarray:
+    # NULL(시세 없음)은 NaN으로 두어 합계에서 제외
+    return np.array(
+        [np.nan if getattr(row, attr) is None else float(getattr(row, attr)) for row in rows],
+        dtype=np.float64,
+    )
+
+
+def _rounded(values: np.ndarray) -> List[Optional[float]]:
+    return [None if np.isnan(value) else round(value, 4) for value in values.tolist()]
+
+
+def _total(values: np.ndarray) -> Optional[float]:
+    if np.isnan(values).all():
+        return None
+    return round(float(np.nansum(values)), 4)
+
+
+def value_holdings(session: Session, user_id: int) -> Dict[str, Any]:
+    """Compute the valuation of *user_id*'s holdings from the stored quotes."""
+
+    rows = session.execute(
+        select(
+            Holding.stock_code,
+            Holding.quantity,
+            Holding.average_cost,
+            Stock.company_name,
+            Stock.current_price,
+            Stock.previous_close,
+        )
+        .join(Stock, Stock.code == Holding.stock_code)
+        .where(Holding.user_id == user_id)
+        .order_by(Holding.stock_code)
+    ).all()
+
+    quantity = _column(rows, "quantity")
+    average_cost = _column(rows, "average_cost")
+    price = _column(rows, "current_price")
+    previous_close = _column(rows, "previous_close")
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cost_basis = quantity * average_cost
+        market_value = quantity * price
+        unrealized_pnl = market_value - cost_basis
+        return_pct = np.where(cost_basis != 0, unrealized_pnl / cost_basis * 100.0, np.nan)
+        day_change = quantity * (price - previous_close)
+        day_change_pct = np.where(previous_close != 0, (price / previous_close - 1.0) * 100.0, np.nan)
+        total_value = np.nansum(market_value)
+        weight_pct = market_value / total_value * 100.0 if total_value else np.full_like(market_value, np.nan)
+
+        # 시세가 있는 포지션만 합산해 수익률 분모/분자를 맞춤
+        priced = ~np.isnan(market_value)
+        priced_cost = float(np.nansum(np.where(priced, cost_basis, np.nan))) if priced.any() else 0.0
+        total_pnl = _total(unrealized_pnl)
+        priced_prev = np.where(~np.isnan(day_change), quantity * previous_close, np.nan)
+        prev_value = float(np.nansum(priced_prev)) if (~np.isnan(priced_prev)).any() else 0.0
+        total_day_change = _total(day_change)
+
+    positions = [
+        {
+            "stock_code": row.stock_code,
+            "company_name": row.company_name,
+            "quantity": qty,
+            "average_cost": cost,
+            "current_price": px,
+            "previous_close": prev,
+            "cost_basis": basis,
+            "market_value": value,
+            "unrealized_pnl": pnl,
+            "return_pct": ret,
+            "day_change": change,
+            "day_change_pct": change_pct,
+            "weight_pct": weight,
+        }
+        for row, qty, cost, px, prev, basis, value, pnl, ret, change, change_pct, weight in zip(
+            rows,
+            _rounded(quantity),
+            _rounded(average_cost),
+            _rounded(price),
+            _rounded(previous_close),
+            _rounded(cost_basis),
+            _rounded(market_value),
+            _rounded(unrealized_pnl),
+            _rounded(return_pct),
+            _rounded(day_change),
+            _rounded(day_change_pct),
+            _rounded(weight_pct),
+        )
+    ]
+    return {
+        "positions": positions,
+        "total_cost_basis": _total(cost_basis),
+        "total_market_value": _total(market_value),
+        "total_unrealized_pnl": total_pnl,
+        "total_return_pct": round(total_pnl / priced_cost * 100.0, 4) if total_pnl is not None and priced_cost else None,
+        "total_day_change": total_day_change,
+        "total_day_change_pct": (
+            round(total_day_change / prev_value * 100.0, 4) if total_day_change is not None and prev_value else None
+        ),
+    }
+
+
+class PortfolioValuationCache:
+    """Per-user valuations, valid while the `stocks` version is unchanged."""
+
+    def __init__(self, max_users: int = _CACHE_MAX_USERS) -> None:
+        self._max_users = max_users
+        self._entries: "OrderedDict[int, Tuple[Tuple[int, ...], Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session: Session, user_id: int) -> Dict[str, Any]:
+        versions = table_versions.current(VALUATION_TABLES)
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] == versions:
+                self._entries.move_to_end(user_id)
+                return entry[1]
+
+        valuation = value_holdings(session, user_id)
+        with self._lock:
+            self._entries[user_id] = (versions, valuation)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self._max_users:
+                self._entries.popitem(last=False)
+        return valuation
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+
+portfolio_cache = PortfolioValuationCache()
@@ -0,0 +1,152 @@
+"""Shared quote subscriptions for watchlist clients.
+
+Every connected client registers a `Subscriber` for its watched tickers with
+the process-wide `quote_hub`. The hub keeps one subscription per distinct
+ticker and a single background refresh loop that fetches each subscribed
+ticker once per `QUOTE_REFRESH_SECONDS` through the collector's
+`fetch_company_snapshot`, so upstream calls scale with distinct tickers, not
+with clients.
+
+Updates are compact deltas (`{"ticker": ..., <changed fields>}`). A client
+that falls behind does not queue unbounded updates: pending deltas are merged
+per ticker until it reads them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+import anyio
+
+from app.core.config import settings
+
+QUOTE_FIELDS = (
+    "regular_market_price",
+    "previous_close",
+    "day_low",
+    "day_high",
+    "market_cap",
+    "fifty_two_week_low",
+    "fifty_two_week_high",
+)
+
+Fetcher = Callable[[str], Dict[str, Any]]
+
+
+def _default_fetcher(ticker: str) -> Dict[str, Any]:
+    # yfinance/pandas 로딩 비용은 첫 구독 시점에만 발생하도록 지연 import
+    from app.pipelines.stock_collector import fetch_company_snapshot
+
+    return fetch_company_snapshot(ticker)
+
+
+class Subscriber:
+    """One client's view: merged pending deltas per ticker plus a wake-up event."""
+
+    def __init__(self, tickers: Iterable[str]) -> None:
+        self.tickers: Set[str] = {ticker.upper() for ticker in tickers}
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._ready = asyncio.Event()
+
+    def push(self, ticker: str, delta: Dict[str, Any]) -> None:
+        self._pending.setdefault(ticker, {}).update(delta)
+        self._ready.set()
+
+    async def next_updates(self, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Wait for pending deltas (or *timeout*) and return them as a list."""
+
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return []
+        self._ready.clear()
+        pending, self._pending = self._pending, {}
+        return [{"ticker": ticker, **delta} for ticker, delta in pending.items()]
+
+
+class QuoteHub:
+    """Process-wide fan-out of quote deltas from one refresh loop."""
+
+    def __init__(
+        self,
+        *,
+        fetcher: Fetcher = _default_fetcher,
+        interval: float = settings.QUOTE_REFRESH_SECONDS,
+        max_workers: int = settings.QUOTE_FETCH_WORKERS,
+    ) -> None:
+        self._fetcher = fetcher
+        self._interval = interval
+        self._limiter = anyio.CapacityLimiter(max(1, max_workers))
+        self._subscribers: Dict[str, Set[Subscriber]] = {}
+        self._latest: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def tickers(self) -> List[str]:
+        return list(self._subscribers)
+
+    def subscribe(self, tickers: Iterable[str]) -> Subscriber:
+        """Register a subscriber; must be called from the event loop."""
+
+        subscriber = Subscriber(tickers)
+        for ticker in subscriber.tickers:
+            self._subscribers.setdefault(ticker, set()).add(subscriber)
+            # 이미 조회된 종목은 업스트림 호출 없이 현재 시세를 바로 전달
+            if ticker in self._latest:
+                subscriber.push(ticker, dict(self._latest[ticker]))
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        for ticker in subscriber.tickers:
+            subscribers = self._subscribers.get(ticker)
+            if subscribers is None:
+                continue
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self._subscribers[ticker]
+                self._latest.pop(ticker, None)
+
+    async def refresh(self) -> int:
+        """Fetch every subscribed ticker once and push deltas; returns the number fetched."""
+
+        tickers = self.tickers
+        if not tickers:
+            return 0
+        snapshots: Dict[str, Dict[str, Any]] = {}
+
+        async def _fetch(ticker: str) -> None:
+            try:
+                snapshots[ticker] = await anyio.to_thread.run_sync(self._fetcher, ticker, limiter=self._limiter)
+            except Exception as e:
+                print(f"[quote_fanout] fetch failed: ticker={ticker}, error={e!r}")
+
+        async with anyio.create_task_group() as tg:
+            for ticker in tickers:
+                tg.start_soon(_fetch, ticker)
+
+        for ticker, snapshot in snapshots.items():
+            previous = self._latest.get(ticker, {})
+            quote = {field: snapshot.get(field) for field in QUOTE_FIELDS}
+            delta = {field: value for field, value in quote.items() if previous.get(field) != value or field not in previous}
+            if ticker not in self._subscribers:
+                continue
+            self._latest[ticker] = quote
+            if not delta:
+                continue
+            for subscriber in self._subscribers[ticker]:
+                subscriber.push(ticker, delta)
+        return len(tickers)
+
+    async def _run(self) -> None:
+        while self._subscribers:
+            await self.refresh()
+            # 여러 프로세스가 같은 주기로 몰리지 않도록 약간의 지터
+            await asyncio.sleep(self._interval * random.uniform(0.9, 1.1))
+        self._task = None
+
+
+quote_hub = QuoteHub()
@@ -0,0 +1,192 @@
+"""Retrieval over stock business summaries and chat messages.
+
+Wires the configured embedder to two vector indexes:
+
+- "stocks":   keyed by `Stock.code`, metadata sector / industry / company_name
+- "messages": keyed by `Message.messages_id`, metadata user_id / chat_id
+
+Stock vectors are refreshed by the collector for the tickers it ingested.
+Message vectors are synced incrementally from the last indexed
+`messages_id` by a background loop in the API process (`run_message_sync`),
+never inside a search request. The same loop removes messages purged in bulk
+(recorded in `deleted_messages` by `message_crud.purge_chats`, e.g. by the
+archiver). Searches also drop hits whose message no longer exists and queue
+them; the loop removes those after checking the primary database.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set
+
+import anyio
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.models import DeletedMessage, Message
+from app.models.models import Stock
+from app.services.embeddings import get_embedder
+from app.services.vector_index import FlatIndex, SearchHit, get_index
+
+STOCKS_NAMESPACE = "stocks"
+MESSAGES_NAMESPACE = "messages"
+_SYNC_BATCH = 500
+
+logger = logging.getLogger(__name__)
+
+# 검색 중 발견된, DB에 없는 메시지 id (백그라운드 루프가 확인 후 인덱스에서 제거)
+_stale_messages: Set[int] = set()
+_stale_lock = threading.Lock()
+
+
+def _index(namespace: str) -> FlatIndex:
+    embedder = get_embedder()
+    return get_index(namespace, dim=embedder.dim, embedder_name=embedder.name)
+
+
+def _stock_text(stock: Stock) -> str:
+    parts = [stock.company_name, stock.sector, stock.industry, stock.business_summary]
+    return "\n".join(part for part in parts if part)
+
+
+def index_stocks(session: Session, codes: Optional[Iterable[str]] = None) -> int:
+    """Embed and upsert stocks (all of them when *codes* is None); returns the count."""
+
+    stmt = select(Stock.code, Stock.company_name, Stock.sector, Stock.industry, Stock.business_summary)
+    if codes is not None:
+        codes = [code.upper() for code in codes]
+        if not codes:
+            return 0
+        stmt = stmt.where(Stock.code.in_(codes))
+    stocks = session.execute(stmt).all()
+    if not stocks:
+        return 0
+
+    vectors = get_embedder().embed([_stock_text(stock) for stock in stocks])
+    metadata = [
+        {"company_name": stock.company_name, "sector": stock.sector, "industry": stock.industry}
+        for stock in stocks
+    ]
+    _index(STOCKS_NAMESPACE).add([stock.code for stock in stocks], vectors, metadata)
+    print(f"[retrieval] index_stocks: indexed={len(stocks)}")
+    return len(stocks)
+
+
+def remove_stocks(codes: Iterable[str]) -> int:
+    return _index(STOCKS_NAMESPACE).delete([code.upper() for code in codes])
+
+
+def sync_messages(session: Session) -> int:
+    """Index messages newer than the last indexed `messages_id`; returns the count."""
+
+    index = _index(MESSAGES_NAMESPACE)
+    index.reload_if_changed()
+    cursor = int(index.state.get("cursor", 0))
+    total = 0
+    while True:
+        rows = session.execute(
+            select(Message.messages_id, Message.user_id, Message.chat_id, Message.content)
+            .where(Message.messages_id > cursor)
+            .order_by(Message.messages_id)
+            .limit(_SYNC_BATCH)
+        ).all()
+        if not rows:
+            break
+        vectors = get_embedder().embed([row.content for row in rows])
+        metadata = [{"user_id": row.user_id, "chat_id": row.chat_id} for row in rows]
+        cursor = rows[-1].messages_id
+        index.add([row.messages_id for row in rows], vectors, metadata, state={"cursor": cursor})
+        total += len(rows)
+    return total
+
+
+def remove_messages(message_ids: Iterable[int]) -> int:
+    return _index(MESSAGES_NAMESPACE).delete(list(message_ids))
+
+
+def search_stocks(query: str, *, k: int = 5, filters: Optional[Mapping[str, Any]] = None) -> List[SearchHit]:
+    """Top-k stocks for *query*, optionally filtered by metadata (e.g. sector)."""
+
+    return _index(STOCKS_NAMESPACE).search(get_embedder().embed([query])[0], k=k, filters=filters)
+
+
+def search_messages(
+    session: Session, query: str, *, user_id: int, k: int = 5, chat_id: Optional[int] = None
+) -> List[SearchHit]:
+    """Top-k messages of *user_id* for *query*; always scoped to that user.
+
+    Hits for deleted messages are skipped (and queued for removal from the
+    index), so up to 2k hits are fetched to still return k.
+    """
+
+    filters: Dict[str, Any] = {"user_id": user_id}
+    if chat_id is not None:
+        filters["chat_id"] = chat_id
+    hits = _index(MESSAGES_NAMESPACE).search(get_embedder().embed([query])[0], k=2 * k, filters=filters)
+    if not hits:
+        return []
+    existing = set(
+        session.scalars(
+            select(Message.messages_id).where(
+                Message.user_id == user_id, Message.messages_id.in_([key for key, _, _ in hits])
+            )
+        )
+    )
+    missing = {key for key, _, _ in hits if key not in existing}
+    if missing:
+        with _stale_lock:
+            _stale_messages.update(missing)
+    return [hit for hit in hits if hit[0] in existing][:k]
+
+
+def remove_stale_messages(session: Session) -> int:
+    """Remove queued ids that are really gone from the database (checked on *session*)."""
+
+    with _stale_lock:
+        candidates = list(_stale_messages)
+        _stale_messages.clear()
+    if not candidates:
+        return 0
+    # 복제본 지연으로 잘못 큐에 들어간 id는 primary에서 다시 확인해 남겨 둔다
+    existing = set(session.scalars(select(Message.messages_id).where(Message.messages_id.in_(candidates))))
+    return remove_messages([message_id for message_id in candidates if message_id not in existing])
+
+
+def remove_purged_messages(session: Session) -> int:
+    """Remove ids recorded in `deleted_messages` from the index, then forget them; commits."""
+
+    removed = 0
+    while True:
+        ids = session.scalars(
+            select(DeletedMessage.messages_id).order_by(DeletedMessage.messages_id).limit(_SYNC_BATCH)
+        ).all()
+        if not ids:
+            return removed
+        removed += remove_messages(ids)
+        # 인덱스에서 지운 뒤에 기록을 지워, 중간에 실패해도 다음 주기에 다시 시도
+        session.execute(delete(DeletedMessage).where(DeletedMessage.messages_id.in_(ids)))
+        session.commit()
+
+
+def sync_message_index(session_factory: Callable[[], Session]) -> int:
+    """One background pass: index new messages and drop deleted ones."""
+
+    with session_factory() as session:
+        added = sync_messages(session)
+        removed = remove_purged_messages(session) + remove_stale_messages(session)
+    if added or removed:
+        logger.info("message index sync: added=%d removed=%d", added, removed)
+    return added
+
+
+async def run_message_sync(session_factory: Callable[[], Session], interval: float) -> None:
+    """Run `sync_message_index` every *interval* seconds until cancelled."""
+
+    while True:
+        try:
+            await anyio.to_thread.run_sync(sync_message_index, session_factory)
+        except Exception:
+            logger.exception("message index sync failed")
+        await asyncio.sleep(interval)
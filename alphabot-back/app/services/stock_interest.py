@@ -0,0 +1,64 @@
+"""Record which stocks API users are looking at.
+
+`stock_interest.record(code)` only touches an in-memory set; the set is
+written to `stock_interest` with one bulk upsert at most once per
+`STOCK_INTEREST_FLUSH_SECONDS`. The collection scheduler reads the table to
+refresh recently viewed stocks more often.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Set
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.models import StockInterest
+
+
+class StockInterestRecorder:
+    def __init__(self, *, flush_interval: float) -> None:
+        self._flush_interval = flush_interval
+        self._pending: Set[str] = set()
+        self._flushed_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def record(self, stock_code: str, session_factory: Callable[[], Session]) -> None:
+        with self._lock:
+            self._pending.add(stock_code.upper())
+            if time.monotonic() - self._flushed_at < self._flush_interval:
+                return
+            pending, self._pending = self._pending, set()
+            self._flushed_at = time.monotonic()
+        self._flush(pending, session_factory)
+
+    def _flush(self, codes: Set[str], session_factory: Callable[[], Session]) -> None:
+        now = datetime.now(timezone.utc)
+        db = session_factory()
+        try:
+            dialect = db.get_bind().dialect.name
+            if dialect not in ("postgresql", "sqlite"):
+                return
+            insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            stmt = insert(StockInterest)
+            db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[StockInterest.stock_code],
+                    set_={"last_requested_at": stmt.excluded.last_requested_at},
+                ),
+                [{"stock_code": code, "last_requested_at": now} for code in sorted(codes)],
+            )
+            db.commit()
+        except Exception as e:
+            # 조회 기록은 부가 정보이므로 실패해도 요청은 계속 처리
+            db.rollback()
+            print(f"[stock_interest] flush failed: count={len(codes)}, error={e!r}")
+        finally:
+            db.close()
+
+
+stock_interest = StockInterestRecorder(flush_interval=settings.STOCK_INTEREST_FLUSH_SECONDS)
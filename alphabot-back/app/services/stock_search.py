@@ -0,0 +1,179 @@
+"""In-memory ticker / company-name autocomplete index.
+
+The index is built from the `stocks` table (code, company name, sector,
+market cap) and lives in process memory:
+
+- prefix matches use sorted key arrays searched with `bisect`
+  (the flat-array equivalent of a trie),
+- fuzzy matches use a character-trigram inverted index,
+- results are ranked by match tier first and `market_cap` second.
+
+It is rebuilt when the `stocks` table version changes (see
+`app.db.versioning`), i.e. after each collector run, so keystroke-level
+queries never scan the database.
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.versioning import TableVersionRegistry, table_versions
+from app.models.models import Stock
+
+# 매칭 등급 (작을수록 우선)
+TIER_EXACT_CODE = 0
+TIER_CODE_PREFIX = 1
+TIER_NAME_PREFIX = 2
+TIER_FUZZY = 3
+
+FUZZY_MIN_SCORE = 0.3
+
+
+@dataclass(frozen=True)
+class StockSuggestion:
+    code: str
+    company_name: Optional[str]
+    sector: Optional[str]
+    market_cap: Optional[int]
+
+
+def _normalize(text: str) -> str:
+    return "".join(ch for ch in text.lower() if ch.isalnum())
+
+
+def _trigrams(text: str) -> List[str]:
+    padded = f"  {text} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def _prefix_range(keys: List[Tuple[str, int]], prefix: str) -> List[int]:
+    """Return entry ids whose key starts with *prefix*."""
+
+    matches: List[int] = []
+    i = bisect_left(keys, (prefix, -1))
+    while i < len(keys) and keys[i][0].startswith(prefix):
+        matches.append(keys[i][1])
+        i += 1
+    return matches
+
+
+class _Snapshot:
+    """Immutable index built from one read of the stocks table."""
+
+    def __init__(self, stocks: Sequence[StockSuggestion], version: Tuple[int, ...]) -> None:
+        self.version = version
+        # market_cap 내림차순 순위를 entry id로 사용해 정렬 비용을 줄인다
+        self.entries = sorted(stocks, key=lambda s: -(s.market_cap or 0))
+        self.exact: Dict[str, int] = {}
+        code_keys: List[Tuple[str, int]] = []
+        name_keys: List[Tuple[str, int]] = []
+        grams: Dict[str, List[int]] = defaultdict(list)
+
+        for entry_id, stock in enumerate(self.entries):
+            code = _normalize(stock.code)
+            self.exact.setdefault(code, entry_id)
+            code_keys.append((code, entry_id))
+            keys = {code}
+            if stock.company_name:
+                name = _normalize(stock.company_name)
+                name_keys.append((name, entry_id))
+                keys.add(name)
+                for word in stock.company_name.split():
+                    word_key = _normalize(word)
+                    if word_key:
+                        name_keys.append((word_key, entry_id))
+            for key in keys:
+                for gram in set(_trigrams(key)):
+                    grams[gram].append(entry_id)
+
+        self.code_keys = sorted(code_keys)
+        self.name_keys = sorted(name_keys)
+        self.grams = dict(grams)
+
+    def suggest(self, query: str, limit: int) -> List[StockSuggestion]:
+        q = _normalize(query)
+        if not q:
+            return []
+
+        best: Dict[int, Tuple[int, float]] = {}
+
+        def offer(entry_id: int, tier: int, score: float = 0.0) -> None:
+            current = best.get(entry_id)
+            if current is None or (tier, -score) < current:
+                best[entry_id] = (tier, -score)
+
+        if q in self.exact:
+            offer(self.exact[q], TIER_EXACT_CODE)
+        for entry_id in _prefix_range(self.code_keys, q):
+            offer(entry_id, TIER_CODE_PREFIX)
+        for entry_id in _prefix_range(self.name_keys, q):
+            offer(entry_id, TIER_NAME_PREFIX)
+
+        if len(best) < limit and len(q) >= 3:
+            query_grams = set(_trigrams(q))
+            overlap: Dict[int, int] = defaultdict(int)
+            for gram in query_grams:
+                for entry_id in self.grams.get(gram, ()):
+                    overlap[entry_id] += 1
+            for entry_id, count in overlap.items():
+                score = count / len(query_grams)
+                if score >= FUZZY_MIN_SCORE:
+                    offer(entry_id, TIER_FUZZY, score)
+
+        top = heapq.nsmallest(limit, best.items(), key=lambda item: (item[1], item[0]))
+        return [self.entries[entry_id] for entry_id, _ in top]
+
+
+class StockSuggestIndex:
+    """Process-wide autocomplete index, rebuilt when the stocks table changes."""
+
+    def __init__(self, registry: TableVersionRegistry = table_versions) -> None:
+        self._registry = registry
+        self._snapshot: Optional[_Snapshot] = None
+        self._lock = threading.Lock()
+
+    def build(self, session: Session) -> None:
+        """Load every stock and atomically swap in a new snapshot."""
+
+        version = self._registry.current(("stocks",))
+        rows = session.execute(
+            select(Stock.code, Stock.company_name, Stock.sector, Stock.market_cap)
+        ).all()
+        stocks = [
+            StockSuggestion(code=code, company_name=name, sector=sector, market_cap=market_cap)
+            for code, name, sector, market_cap in rows
+        ]
+        self._snapshot = _Snapshot(stocks, version)
+
+    def ensure_fresh(self, session_factory: Callable[[], Session]) -> None:
+        """Rebuild the snapshot if it is missing or the stocks table version moved."""
+
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == self._registry.current(("stocks",)):
+            return
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.version == self._registry.current(("stocks",)):
+                return
+            session = session_factory()
+            try:
+                self.build(session)
+            finally:
+                session.close()
+
+    def suggest(self, query: str, *, limit: int = 10) -> List[StockSuggestion]:
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        return snapshot.suggest(query, limit)
+
+
+stock_suggest_index = StockSuggestIndex()
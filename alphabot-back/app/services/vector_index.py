@@ -0,0 +1,544 @@
+"""NumPy vector indexes persisted as memory-mapped files.
+
+Each index lives in its own directory:
+
+- `vectors.f32`  float32 memmap of shape (capacity, dim), one row per item
+- `rows-*.jsonl` append-only log of row keys and metadata (`["+", key, meta]`
+                 adds a row, `["-", key]` tombstones one)
+- `meta.json`    small header: counters, embedder identity, the current log
+                 file and how many of its bytes are committed, a generation
+- `centroids.f32` / `assign.i32`  IVF coarse quantizer (IVF indexes only)
+
+Items are keyed by an application id (e.g. `Stock.code`, `messages_id`).
+Adding an existing key replaces it; deleting leaves a tombstone that is
+reclaimed by compaction once tombstones exceed a quarter of the rows.
+Vectors are expected to be L2-normalized, so the inner product is the
+cosine similarity.
+
+Writes append to the log and then replace the header, so a write costs the
+size of the batch, not of the index. Several processes may share an index
+directory: writers are serialized by a lock file (where `fcntl` exists), and
+every index reloads itself before a search or write when the header on disk
+was written by someone else.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+SearchHit = Tuple[Hashable, float, Dict[str, Any]]
+
+_INITIAL_CAPACITY = 1024
+_COMPACT_RATIO = 0.25
+
+
+def _open_memmap(path: Path, shape: Tuple[int, ...], dtype: Any) -> np.memmap:
+    mode = "r+" if path.exists() else "w+"
+    return np.memmap(path, dtype=dtype, mode=mode, shape=shape)
+
+
+def _grow_memmap(path: Path, old: Optional[np.memmap], rows: int, shape: Tuple[int, ...], dtype: Any) -> np.memmap:
+    """Copy the first *rows* of *old* into a new, larger memmap at *path*."""
+
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    new = np.memmap(tmp, dtype=dtype, mode="w+", shape=shape)
+    if old is not None and rows:
+        new[:rows] = old[:rows]
+    new.flush()
+    del old
+    os.replace(tmp, path)
+    return np.memmap(path, dtype=dtype, mode="r+", shape=shape)
+
+
+class FlatIndex:
+    """Exact inner-product search over every live row."""
+
+    kind = "flat"
+
+    def __init__(self, path: Path, *, dim: int, embedder_name: str) -> None:
+        self.path = Path(path)
+        self.dim = dim
+        self.embedder_name = embedder_name
+        self._lock = threading.RLock()
+        self._write_depth = 0
+        self._columns: Dict[str, np.ndarray] = {}
+        self._log_name = ""
+        self._log_bytes = 0
+        self.generation = 0
+        self._disk_stamp: Optional[Tuple[int, int, int]] = None
+        self.path.mkdir(parents=True, exist_ok=True)
+        with self._write_lock():
+            self._load()
+
+    # --------- persistence ---------
+
+    @property
+    def _meta_path(self) -> Path:
+        return self.path / "meta.json"
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        """Serialize writers in this process and, via a lock file, across processes."""
+
+        with self._lock:
+            # flock은 같은 프로세스라도 파일을 새로 열면 막히므로 중첩 호출은 바깥 잠금을 재사용
+            if fcntl is None or self._write_depth:
+                self._write_depth += 1
+                try:
+                    yield
+                finally:
+                    self._write_depth -= 1
+                return
+            with open(self.path / ".lock", "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                self._write_depth += 1
+                try:
+                    yield
+                finally:
+                    self._write_depth -= 1
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _stamp(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self._meta_path)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def _read_meta(self) -> Dict[str, Any]:
+        if not self._meta_path.exists():
+            return {}
+        return json.loads(self._meta_path.read_text(encoding="utf-8"))
+
+    def _load(self) -> None:
+        stamp = self._stamp()
+        meta = self._read_meta()
+        if (
+            meta.get("kind") != self.kind
+            or meta.get("dim") != self.dim
+            or meta.get("embedder") != self.embedder_name
+            or "log" not in meta
+        ):
+            # 임베더나 차원이 바뀌면 기존 벡터와 호환되지 않으므로 초기화
+            self._reset()
+            return
+
+        keys: List[Optional[Hashable]] = []
+        metadata: List[Dict[str, Any]] = []
+        row_of: Dict[Hashable, int] = {}
+        with open(self.path / meta["log"], "rb") as log:
+            data = log.read(meta["log_bytes"])
+        for line in data.splitlines():
+            entry = json.loads(line)
+            if entry[0] == "+":
+                row_of[entry[1]] = len(keys)
+                keys.append(entry[1])
+                metadata.append(entry[2])
+            else:
+                row = row_of.pop(entry[1], None)
+                if row is not None:
+                    keys[row] = None
+                    metadata[row] = {}
+
+        self.capacity: int = meta["capacity"]
+        self.keys = keys
+        self.metadata = metadata
+        self.state: Dict[str, Any] = meta.get("state", {})
+        self._extra_meta = meta.get("extra", {})
+        self._log_name = meta["log"]
+        self._log_bytes = meta["log_bytes"]
+        self.generation = meta.get("generation", 0)
+        self.vectors = _open_memmap(self.path / "vectors.f32", (self.capacity, self.dim), np.float32)
+        self._rebuild_lookup()
+        self._load_extra()
+        self._disk_stamp = stamp
+
+    def reload_if_changed(self) -> bool:
+        """Reload when another process rewrote the header; returns True if reloaded."""
+
+        with self._lock:
+            stamp = self._stamp()
+            if stamp == self._disk_stamp:
+                return False
+            try:
+                meta = self._read_meta()
+                if (meta.get("log"), meta.get("generation")) == (self._log_name, self.generation):
+                    self._disk_stamp = stamp
+                    return False
+                self._load()
+            except (FileNotFoundError, ValueError):
+                # 다른 프로세스가 압축 중이면 다음 호출에서 다시 시도
+                return False
+            return True
+
+    def _reset(self) -> None:
+        for child in self.path.iterdir():
+            if child.is_file() and child.name != ".lock":
+                child.unlink()
+        self.capacity = _INITIAL_CAPACITY
+        self.keys = []
+        self.metadata = []
+        self.state = {}
+        self._extra_meta = {}
+        self.vectors = _open_memmap(self.path / "vectors.f32", (self.capacity, self.dim), np.float32)
+        self._rebuild_lookup()
+        self._load_extra()
+        self._rewrite_log()
+
+    def _rewrite_log(self) -> None:
+        """Start a new log holding only the live rows (after reset or compaction)."""
+
+        old_log = self._log_name
+        self._log_name = f"rows-{uuid.uuid4().hex[:12]}.jsonl"
+        lines = [
+            json.dumps(["+", key, meta], ensure_ascii=False, default=str)
+            for key, meta in zip(self.keys, self.metadata)
+        ]
+        data = ("\n".join(lines) + "\n").encode("utf-8") if lines else b""
+        (self.path / self._log_name).write_bytes(data)
+        self._log_bytes = len(data)
+        self._save()
+        if old_log and old_log != self._log_name:
+            (self.path / old_log).unlink(missing_ok=True)
+
+    def _append_log(self, entries: Sequence[List[Any]]) -> None:
+        data = "".join(
+            json.dumps(entry, ensure_ascii=False, default=str) + "\n" for entry in entries
+        ).encode("utf-8")
+        with open(self.path / self._log_name, "r+b") as log:
+            # 중간에 실패한 쓰기의 꼬리는 버리고 확정된 위치부터 이어 쓴다
+            log.truncate(self._log_bytes)
+            log.seek(self._log_bytes)
+            log.write(data)
+        self._log_bytes += len(data)
+        self._save()
+
+    def _save(self) -> None:
+        """Flush vectors/side files and publish a new header (O(1) in the index size)."""
+
+        self.vectors.flush()
+        self._save_extra()
+        self.generation += 1
+        meta = {
+            "kind": self.kind,
+            "dim": self.dim,
+            "embedder": self.embedder_name,
+            "capacity": self.capacity,
+            "log": self._log_name,
+            "log_bytes": self._log_bytes,
+            "generation": self.generation,
+            "state": self.state,
+            "extra": self._extra_meta,
+        }
+        tmp = self._meta_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(meta, ensure_ascii=False, default=str), encoding="utf-8")
+        os.replace(tmp, self._meta_path)
+        self._disk_stamp = self._stamp()
+
+    def _rebuild_lookup(self) -> None:
+        self._row_of: Dict[Hashable, int] = {
+            key: row for row, key in enumerate(self.keys) if key is not None
+        }
+        self._alive = np.array([key is not None for key in self.keys], dtype=bool)
+        self._columns.clear()
+
+    # Hooks for subclasses keeping per-row side structures
+    def _load_extra(self) -> None:
+        pass
+
+    def _save_extra(self) -> None:
+        pass
+
+    def _grow_extra(self, rows: int) -> None:
+        pass
+
+    def _after_add(self, rows: np.ndarray) -> None:
+        pass
+
+    def _after_compact(self) -> None:
+        pass
+
+    # --------- writes ---------
+
+    @property
+    def count(self) -> int:
+        return len(self.keys)
+
+    @property
+    def live_count(self) -> int:
+        return len(self._row_of)
+
+    def add(
+        self,
+        keys: Sequence[Hashable],
+        vectors: np.ndarray,
+        metadata: Optional[Sequence[Mapping[str, Any]]] = None,
+        *,
+        state: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """Insert or replace items; *vectors* must have shape (len(keys), dim).
+
+        *state* entries (e.g. a sync cursor) are saved together with the rows.
+        """
+
+        if len(keys) == 0:
+            return
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(keys), self.dim)
+        metadata = metadata or [{} for _ in keys]
+        with self._write_lock():
+            self.reload_if_changed()
+            removed = self._tombstone(keys)
+            start = self.count
+            end = start + len(keys)
+            if end > self.capacity:
+                new_capacity = max(self.capacity * 2, end)
+                self.vectors = _grow_memmap(
+                    self.path / "vectors.f32", self.vectors, start, (new_capacity, self.dim), np.float32
+                )
+                self.capacity = new_capacity
+                self._grow_extra(start)
+            self.vectors[start:end] = vectors
+            entries: List[List[Any]] = [["-", key] for key in removed]
+            for offset, key in enumerate(keys):
+                meta = dict(metadata[offset])
+                self.keys.append(key)
+                self.metadata.append(meta)
+                self._row_of[key] = start + offset
+                entries.append(["+", key, meta])
+            self._alive = np.concatenate([self._alive, np.ones(len(keys), dtype=bool)])
+            self._columns.clear()
+            self._after_add(np.arange(start, end))
+            self.state.update(state or {})
+            self._append_log(entries)
+
+    def delete(self, keys: Sequence[Hashable]) -> int:
+        """Remove items by key; returns the number removed."""
+
+        with self._write_lock():
+            self.reload_if_changed()
+            removed = self._tombstone(keys)
+            if removed:
+                if self.count > _INITIAL_CAPACITY and (self.count - self.live_count) > self.count * _COMPACT_RATIO:
+                    self.compact()
+                else:
+                    self._append_log([["-", key] for key in removed])
+            return len(removed)
+
+    def _tombstone(self, keys: Sequence[Hashable]) -> List[Hashable]:
+        removed = []
+        for key in keys:
+            row = self._row_of.pop(key, None)
+            if row is not None:
+                self.keys[row] = None
+                self.metadata[row] = {}
+                self._alive[row] = False
+                removed.append(key)
+        if removed:
+            self._columns.clear()
+        return removed
+
+    def compact(self) -> None:
+        """Rewrite the files keeping only live rows."""
+
+        with self._write_lock():
+            rows = np.flatnonzero(self._alive)
+            live_vectors = np.array(self.vectors[rows])
+            self.keys = [self.keys[row] for row in rows]
+            self.metadata = [self.metadata[row] for row in rows]
+            self.capacity = max(_INITIAL_CAPACITY, len(rows) * 2)
+            self.vectors = _grow_memmap(
+                self.path / "vectors.f32", None, 0, (self.capacity, self.dim), np.float32
+            )
+            self.vectors[: len(rows)] = live_vectors
+            self._rebuild_lookup()
+            self._after_compact()
+            self._rewrite_log()
+
+    # --------- reads ---------
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._row_of
+
+    def _column(self, name: str) -> np.ndarray:
+        column = self._columns.get(name)
+        if column is None:
+            column = np.array([meta.get(name) for meta in self.metadata], dtype=object)
+            self._columns[name] = column
+        return column
+
+    def _candidates(self, query: np.ndarray, allowed: np.ndarray, k: int) -> np.ndarray:
+        """Rows to score exactly, chosen among the *allowed* (live, filtered) rows."""
+
+        return np.flatnonzero(allowed)
+
+    def search(
+        self,
+        query: np.ndarray,
+        *,
+        k: int = 10,
+        filters: Optional[Mapping[str, Any]] = None,
+    ) -> List[SearchHit]:
+        """Return up to *k* (key, score, metadata) hits, best first.
+
+        *filters* keeps only rows whose metadata equals every given value; it is
+        applied before candidates are chosen, so a filtered search still finds
+        *k* hits when that many rows match.
+        """
+
+        query = np.asarray(query, dtype=np.float32).reshape(self.dim)
+        with self._lock:
+            self.reload_if_changed()
+            if not self._row_of:
+                return []
+            allowed = self._alive.copy()
+            for name, value in (filters or {}).items():
+                allowed &= self._column(name) == value
+            rows = self._candidates(query, allowed, k)
+            if rows.size == 0:
+                return []
+            scores = self.vectors[rows] @ query
+            if rows.size > k:
+                top = np.argpartition(-scores, k - 1)[:k]
+            else:
+                top = np.arange(rows.size)
+            top = top[np.argsort(-scores[top])]
+            return [
+                (self.keys[rows[i]], float(scores[i]), self.metadata[rows[i]])
+                for i in top
+            ]
+
+
+class IVFIndex(FlatIndex):
+    """Inverted-file index: rows are bucketed by their nearest k-means centroid
+    and a query only scores the rows in its `nprobe` closest buckets.
+
+    Until enough rows exist to train the quantizer it behaves like `FlatIndex`.
+    The quantizer is retrained when the live row count grows 4x past the
+    size it was trained on.
+    """
+
+    kind = "ivf"
+    min_train_rows = 256
+    train_iterations = 10
+    train_sample = 20000
+
+    def __init__(self, path: Path, *, dim: int, embedder_name: str, nprobe: int = 8) -> None:
+        self.nprobe = nprobe
+        super().__init__(path, dim=dim, embedder_name=embedder_name)
+
+    def _load_extra(self) -> None:
+        self.nlist = int(self._extra_meta.get("nlist", 0))
+        self.trained_rows = int(self._extra_meta.get("trained_rows", 0))
+        self.assign = _open_memmap(self.path / "assign.i32", (self.capacity,), np.int32)
+        self.centroids: Optional[np.ndarray] = None
+        if self.nlist:
+            self.centroids = np.array(
+                np.memmap(self.path / "centroids.f32", dtype=np.float32, mode="r", shape=(self.nlist, self.dim))
+            )
+
+    def _save_extra(self) -> None:
+        self.assign.flush()
+        self._extra_meta = {"nlist": self.nlist, "trained_rows": self.trained_rows}
+
+    def _grow_extra(self, rows: int) -> None:
+        self.assign = _grow_memmap(self.path / "assign.i32", self.assign, rows, (self.capacity,), np.int32)
+
+    def _after_add(self, rows: np.ndarray) -> None:
+        if self.centroids is None or self.live_count >= 4 * self.trained_rows:
+            if self.live_count >= self.min_train_rows:
+                self.train()
+            return
+        self.assign[rows] = self._nearest_centroid(np.asarray(self.vectors[rows]))
+
+    def _after_compact(self) -> None:
+        self.assign = _grow_memmap(self.path / "assign.i32", None, 0, (self.capacity,), np.int32)
+        self.centroids = None
+        self.nlist = 0
+        if self.live_count >= self.min_train_rows:
+            self.train()
+
+    def _nearest_centroid(self, vectors: np.ndarray) -> np.ndarray:
+        return np.argmax(vectors @ self.centroids.T, axis=1).astype(np.int32)
+
+    def train(self) -> None:
+        """Fit spherical k-means centroids on live rows and reassign every row."""
+
+        with self._write_lock():
+            live = np.flatnonzero(self._alive)
+            nlist = int(min(1024, max(8, math.sqrt(live.size))))
+            rng = np.random.default_rng(0)
+            sample_rows = live if live.size <= self.train_sample else rng.choice(live, self.train_sample, replace=False)
+            sample = np.asarray(self.vectors[np.sort(sample_rows)])
+            centroids = sample[rng.choice(sample.shape[0], nlist, replace=False)].copy()
+            for _ in range(self.train_iterations):
+                labels = np.argmax(sample @ centroids.T, axis=1)
+                for c in range(nlist):
+                    members = sample[labels == c]
+                    if members.size:
+                        centroid = members.sum(axis=0)
+                        norm = np.linalg.norm(centroid)
+                        if norm > 0:
+                            centroids[c] = centroid / norm
+
+            self.centroids = centroids.astype(np.float32)
+            self.nlist = nlist
+            # 읽는 프로세스가 쓰다 만 파일을 보지 않도록 임시 파일에 쓴 뒤 교체
+            tmp = self.path / "centroids.f32.tmp"
+            stored = np.memmap(tmp, dtype=np.float32, mode="w+", shape=centroids.shape)
+            stored[:] = self.centroids
+            stored.flush()
+            del stored
+            os.replace(tmp, self.path / "centroids.f32")
+            if self.count:
+                self.assign[: self.count] = self._nearest_centroid(np.asarray(self.vectors[: self.count]))
+            self.trained_rows = int(live.size)
+
+    def _candidates(self, query: np.ndarray, allowed: np.ndarray, k: int) -> np.ndarray:
+        rows = np.flatnonzero(allowed)
+        if self.centroids is None or rows.size <= k:
+            return rows
+        buckets = self.assign[rows]
+        order = np.argsort(-(self.centroids @ query))
+        # nprobe개 버킷을 보되, 필터를 통과한 후보가 k개에 못 미치면 k개가 찰 때까지 더 탐색
+        filled = np.cumsum(np.bincount(buckets, minlength=self.nlist)[order])
+        nprobe = max(min(self.nprobe, self.nlist), int(np.searchsorted(filled, k)) + 1)
+        return rows[np.isin(buckets, order[:nprobe])]
+
+
+_INDEX_TYPES = {"flat": FlatIndex, "ivf": IVFIndex}
+_indexes: Dict[str, FlatIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_index(namespace: str, *, dim: int, embedder_name: str) -> FlatIndex:
+    """Return the process-wide index for *namespace* (e.g. "stocks", "messages").
+
+    The instance is cached, but reloads itself whenever another process (e.g.
+    the collector indexing stocks) has written to the same directory.
+    """
+
+    with _indexes_lock:
+        index = _indexes.get(namespace)
+        if index is None or index.dim != dim or index.embedder_name != embedder_name:
+            index_type = _INDEX_TYPES.get(settings.VECTOR_INDEX_KIND, IVFIndex)
+            index = index_type(
+                Path(settings.VECTOR_INDEX_DIR) / namespace, dim=dim, embedder_name=embedder_name
+            )
+            _indexes[namespace] = index
+        return index
@@ -0,0 +1,77 @@
+"""Import-time budget check for the collector CLI.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter and
+fails (exit code 1) when the module's cumulative import time exceeds the
+budget or when a heavy dependency is loaded eagerly. Suitable for CI.
+
+Usage (from `alphabot-back/`):
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --module app.pipelines.news_collector --budget-ms 400
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+DEFAULT_MODULE = "app.pipelines.stock_collector"
+DEFAULT_BUDGET_MS = 150.0
+# 첫 사용 시점까지 로딩을 미뤄야 하는 모듈
+EAGER_FORBIDDEN = ("yfinance", "pandas", "requests", "numpy", "sqlalchemy.orm", "app.db.database")
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def measure(module: str) -> Tuple[float, Dict[str, float]]:
+    """Return (cumulative ms of *module*, cumulative ms per imported module)."""
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        check=True,
+    )
+    cumulative: Dict[str, float] = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if match:
+            cumulative[match.group(4)] = int(match.group(2)) / 1000.0
+    return cumulative.get(module, 0.0), cumulative
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Check the import-time budget using CLI arguments."""
+
+    parser = argparse.ArgumentParser(description="import-time budget check")
+    parser.add_argument("--module", default=DEFAULT_MODULE, help="Module to import")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Cumulative import budget")
+    parser.add_argument("--runs", type=int, default=3, help="Take the best of N fresh interpreters")
+    parser.add_argument("--top", type=int, default=10, help="Show the N slowest imports")
+    args = parser.parse_args(argv or sys.argv[1:])
+
+    runs = [measure(args.module) for _ in range(max(1, args.runs))]
+    total_ms, cumulative = min(runs, key=lambda run: run[0])
+
+    print(f"{args.module}: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms, best of {len(runs)})")
+    # 인터프리터 시작 시 로딩되는 모듈(site 등)도 포함된 전체 목록 기준
+    for name, ms in sorted(cumulative.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {ms:8.1f} ms  {name}")
+
+    failures: List[str] = []
+    if total_ms > args.budget_ms:
+        failures.append(f"import time {total_ms:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+    eager = [name for name in EAGER_FORBIDDEN if name in cumulative]
+    if eager:
+        failures.append(f"heavy modules imported eagerly: {', '.join(eager)}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+"""Benchmark `stock_collector` ingestion against recorded Yahoo Finance payloads.
+
+Two steps:
+
+1. `record` fetches `get_info()` and the six statement DataFrames for a
+   sample of tickers once and stores them as JSON fixtures.
+2. `run` replays the fixtures through a fake `yf.Ticker` (throttling
+   disabled) and reports, per database URL:
+   - parse µs/ticker: `_upsert_stock` + `_save_financials` mapping against a
+     no-op session (no database work)
+   - ingest µs/ticker and DB rows/sec: `ingest_ticker` + commit on a fresh schema
+   - peak RSS of the process (and, with `--trace-memory`, the peak Python
+     heap from tracemalloc, which slows the run down noticeably)
+
+`run --synthetic N` generates N tickers with realistic shapes instead of
+reading fixtures, so the harness works offline.
+
+Usage (from `alphabot-back/`):
+    python -m benchmarks.ingest_pipeline record AAPL MSFT NVDA --fixtures benchmarks/fixtures/ingest
+    python -m benchmarks.ingest_pipeline run --fixtures benchmarks/fixtures/ingest \
+        --database-url sqlite:// --database-url postgresql+psycopg://user:pw@localhost/bench --output run.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import pandas as pd
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+from app.models import TableVersion
+from app.models.models import Base, FinancialStatement, ReportTypeEnum, Stock
+from app.pipelines import stock_collector
+
+DEFAULT_FIXTURES = Path(__file__).with_name("fixtures").joinpath("ingest")
+STATEMENT_ATTRS = (
+    "financials",
+    "balance_sheet",
+    "cashflow",
+    "quarterly_financials",
+    "quarterly_balance_sheet",
+    "quarterly_cashflow",
+)
+
+
+# --------- Fixtures ---------
+
+def _frame_to_json(df: Any) -> Optional[Dict[str, Any]]:
+    if df is None or getattr(df, "empty", True):
+        return None
+    return json.loads(df.to_json(orient="split", date_format="iso"))
+
+
+def _frame_from_json(payload: Optional[Dict[str, Any]]) -> Optional[pd.DataFrame]:
+    if payload is None:
+        return None
+    return pd.DataFrame(payload["data"], index=payload["index"], columns=pd.to_datetime(payload["columns"]))
+
+
+def record(tickers: List[str], fixtures: Path) -> None:
+    """Fetch live payloads once and store them as `<TICKER>.json`."""
+
+    import yfinance as yf
+
+    fixtures.mkdir(parents=True, exist_ok=True)
+    for ticker in tickers:
+        t = yf.Ticker(ticker)
+        payload = {
+            "ticker": ticker.upper(),
+            "info": t.get_info(),
+            "statements": {attr: _frame_to_json(getattr(t, attr, None)) for attr in STATEMENT_ATTRS},
+        }
+        path = fixtures / f"{ticker.upper()}.json"
+        path.write_text(json.dumps(payload, default=str), encoding="utf-8")
+        print(f"recorded {ticker.upper()} -> {path}")
+
+
+def load_fixtures(fixtures: Path) -> List[Dict[str, Any]]:
+    payloads = []
+    for path in sorted(fixtures.glob("*.json")):
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload["statements"] = {attr: _frame_from_json(df) for attr, df in payload["statements"].items()}
+        payloads.append(payload)
+    return payloads
+
+
+def synthetic_fixtures(count: int, *, seed: int = 7) -> List[Dict[str, Any]]:
+    """Payloads shaped like yfinance output (same info keys and statement row labels)."""
+
+    rng = random.Random(seed)
+    text_fields = {"longName", "sector", "industry", "country", "website", "longBusinessSummary", "recommendationKey"}
+    row_labels = [
+        candidates[0]
+        for rows in (stock_collector.INCOME_ROWS, stock_collector.BALANCE_ROWS, stock_collector.CASHFLOW_ROWS)
+        for candidates in rows.values()
+    ]
+    # 실제 재무제표처럼 매핑되지 않는 행도 섞어 행 탐색 비용을 반영
+    row_labels += [f"Other Line Item {i}" for i in range(30)]
+    annual = pd.to_datetime([date(2024 - i, 12, 31) for i in range(4)])
+    quarterly = pd.to_datetime([date(2025, 9, 30), date(2025, 6, 30), date(2025, 3, 31), date(2024, 12, 31),
+                                date(2024, 9, 30)])
+
+    def frame(columns: Any) -> pd.DataFrame:
+        return pd.DataFrame(
+            [[rng.uniform(-1e10, 1e11) for _ in columns] for _ in row_labels],
+            index=row_labels,
+            columns=columns,
+        )
+
+    payloads = []
+    for i in range(count):
+        info: Dict[str, Any] = {}
+        for key in stock_collector._INFO_FIELD_MAP:
+            info[key] = f"{key}-{i}" if key in text_fields else rng.uniform(0, 1e6)
+        info["exDividendDate"] = 1_700_000_000 + i
+        payloads.append({
+            "ticker": f"SYN{i:04d}",
+            "info": info,
+            "statements": {
+                attr: frame(quarterly if attr.startswith("quarterly") else annual) for attr in STATEMENT_ATTRS
+            },
+        })
+    return payloads
+
+
+class FakeTicker:
+    """Stands in for `yf.Ticker`, serving one recorded payload."""
+
+    def __init__(self, payload: Dict[str, Any]) -> None:
+        self._payload = payload
+        for attr, df in payload["statements"].items():
+            setattr(self, attr, df)
+
+    def get_info(self) -> Dict[str, Any]:
+        return dict(self._payload["info"])
+
+
+class _NullQuery:
+    def filter(self, *args: Any, **kwargs: Any) -> "_NullQuery":
+        return self
+
+    def one_or_none(self) -> None:
+        return None
+
+
+class _NullSession:
+    """Session double for measuring parsing/mapping without database work."""
+
+    def get(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    def add(self, obj: Any) -> None:
+        pass
+
+    def query(self, *args: Any, **kwargs: Any) -> _NullQuery:
+        return _NullQuery()
+
+
+@contextlib.contextmanager
+def replay(payloads: List[Dict[str, Any]], *, quiet: bool) -> Iterator[None]:
+    """Patch the collector to read *payloads* and skip throttling."""
+
+    by_ticker = {payload["ticker"]: payload for payload in payloads}
+    original_ticker, original_sleep = stock_collector.yf.Ticker, stock_collector._sleep
+    stock_collector.yf.Ticker = lambda ticker: FakeTicker(by_ticker[ticker.upper()])  # type: ignore[assignment]
+    stock_collector._sleep = lambda *args, **kwargs: None  # type: ignore[assignment]
+    try:
+        # 수집기의 디버그 출력은 측정에서 제외
+        with contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext():
+            yield
+    finally:
+        stock_collector.yf.Ticker = original_ticker  # type: ignore[assignment]
+        stock_collector._sleep = original_sleep  # type: ignore[assignment]
+
+
+# --------- Measurements ---------
+
+def measure_parse(payloads: List[Dict[str, Any]], *, quiet: bool) -> Dict[str, float]:
+    session = _NullSession()
+    with replay(payloads, quiet=quiet):
+        started = time.perf_counter()
+        for payload in payloads:
+            ticker = FakeTicker(payload)
+            stock_collector._upsert_stock(session, payload["ticker"], ticker.get_info())  # type: ignore[arg-type]
+            for report_type in (ReportTypeEnum.annual, ReportTypeEnum.quarterly):
+                stock_collector._save_financials(session, payload["ticker"], ticker, report_type)  # type: ignore[arg-type]
+        elapsed = time.perf_counter() - started
+    return {"parse_us_per_ticker": elapsed / len(payloads) * 1e6}
+
+
+def _make_engine(database_url: str):
+    engine = create_engine(database_url)
+    if engine.dialect.name == "sqlite":
+        # 모델이 'public' 스키마를 사용하므로 SQLite에서는 별도 DB를 붙여 대응
+        @event.listens_for(engine, "connect")
+        def _attach_public(dbapi_connection, connection_record) -> None:
+            dbapi_connection.execute("ATTACH DATABASE ':memory:' AS public")
+    return engine
+
+
+def measure_ingest(payloads: List[Dict[str, Any]], database_url: str, *, quiet: bool) -> Dict[str, Any]:
+    engine = _make_engine(database_url)
+    tables = [Stock.__table__, FinancialStatement.__table__]
+    Base.metadata.drop_all(engine, tables=tables)
+    Base.metadata.create_all(engine, tables=tables)
+    # 커밋마다 테이블 버전을 올리는 세션 훅(app.db.versioning)이 사용하는 테이블
+    TableVersion.__table__.drop(engine, checkfirst=True)
+    TableVersion.__table__.create(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+
+    per_ticker: List[float] = []
+    with replay(payloads, quiet=quiet):
+        db: Session = session_factory()
+        try:
+            started = time.perf_counter()
+            for payload in payloads:
+                ticker_started = time.perf_counter()
+                stock_collector.ingest_ticker(db, payload["ticker"])
+                db.commit()
+                per_ticker.append(time.perf_counter() - ticker_started)
+            elapsed = time.perf_counter() - started
+            rows = db.execute(select(func.count()).select_from(Stock)).scalar_one() + db.execute(
+                select(func.count()).select_from(FinancialStatement)
+            ).scalar_one()
+        finally:
+            db.close()
+    engine.dispose()
+
+    per_ticker.sort()
+    return {
+        "database": engine.dialect.name,
+        "tickers": len(payloads),
+        "rows": rows,
+        "elapsed_s": elapsed,
+        "ingest_us_per_ticker": elapsed / len(payloads) * 1e6,
+        "ingest_us_p50": per_ticker[len(per_ticker) // 2] * 1e6,
+        "ingest_us_p95": per_ticker[min(len(per_ticker) - 1, int(len(per_ticker) * 0.95))] * 1e6,
+        "rows_per_s": rows / elapsed if elapsed else None,
+    }
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    # Linux는 KB, macOS는 byte 단위
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / (1024 * 1024)
+
+
+def run(
+    payloads: List[Dict[str, Any]], database_urls: List[str], *, quiet: bool, trace_memory: bool = False
+) -> Dict[str, Any]:
+    if trace_memory:
+        tracemalloc.start()
+    result: Dict[str, Any] = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "tickers": len(payloads),
+        **measure_parse(payloads, quiet=quiet),
+        "databases": [],
+    }
+    for database_url in database_urls:
+        result["databases"].append(measure_ingest(payloads, database_url, quiet=quiet))
+    result["peak_rss_mb"] = _peak_rss_mb()
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result["peak_traced_mb"] = peak / (1024 * 1024)
+    return result
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the ingestion benchmark using CLI arguments."""
+
+    parser = argparse.ArgumentParser(description="stock_collector ingestion benchmark")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("record", help="Fetch live payloads once and store them as fixtures")
+    rec.add_argument("tickers", nargs="+", help="Ticker symbols to record")
+    rec.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES, help="Fixture directory")
+
+    bench = sub.add_parser("run", help="Replay fixtures and measure ingestion")
+    bench.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES, help="Fixture directory")
+    bench.add_argument("--synthetic", type=int, default=None, help="Generate N synthetic tickers instead")
+    bench.add_argument("--repeat", type=int, default=1, help="Replay the fixture set N times (as distinct tickers)")
+    bench.add_argument("--database-url", action="append", default=None,
+                       help="Database to ingest into (repeatable; default: in-memory SQLite)")
+    bench.add_argument("--output", type=Path, default=None, help="Write the JSON result to this file")
+    bench.add_argument("--verbose", action="store_true", help="Keep the collector's debug output")
+    bench.add_argument("--trace-memory", action="store_true", help="Also report the tracemalloc peak (slower)")
+    args = parser.parse_args(argv or sys.argv[1:])
+
+    if args.command == "record":
+        record(args.tickers, args.fixtures)
+        return
+
+    payloads = synthetic_fixtures(args.synthetic) if args.synthetic else load_fixtures(args.fixtures)
+    if not payloads:
+        parser.error(f"no fixtures in {args.fixtures}; run `record` first or pass --synthetic N")
+    if args.repeat > 1:
+        payloads = [
+            {**payload, "ticker": f"{payload['ticker']}{i}" if i else payload["ticker"]}
+            for i in range(args.repeat)
+            for payload in payloads
+        ]
+
+    result = run(payloads, args.database_url or ["sqlite://"], quiet=not args.verbose, trace_memory=args.trace_memory)
+    text = json.dumps(result, indent=2)
+    if args.output:
+        args.output.write_text(text + os.linesep, encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Compare response serialization paths for large list payloads.
+
+Payloads (built in memory, no database needed):
+
+- messages: `Message` ORM objects returned as `List[MessageRead]`
+- stocks:   `Stock` ORM objects with every column set (Numeric -> Decimal)
+
+Paths:
+
+- default: Pydantic validation from attributes, `mode="json"` dump, `JSONResponse`
+           (what FastAPI does for `response_model=` routes)
+- fast:    `trusted_rows` + `FastJSONResponse` (`app.core.serialization`)
+
+Usage (from `alphabot-back/`):
+    python -m benchmarks.json_serialization --rows 5000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+from sqlalchemy import Numeric
+
+from app.core import serialization
+from app.core.serialization import FastJSONResponse, trusted_rows
+from app.models import Message
+from app.models.models import Stock
+from app.schemas.chats import MessageRead
+
+
+def message_rows(count: int) -> List[Message]:
+    started = datetime(2024, 1, 1, 9, 0, 0)
+    return [
+        Message(
+            messages_id=i + 1,
+            chat_id=1,
+            user_id=1,
+            content=f"메시지 {i} - " + "AAPL 분기 실적 요약과 밸류에이션 비교 " * 4,
+            created_at=started + timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+
+
+def stock_rows(count: int) -> List[Stock]:
+    rows = []
+    for i in range(count):
+        values: Dict[str, Any] = {}
+        for column in Stock.__table__.columns:
+            if isinstance(column.type, Numeric):
+                values[column.key] = Decimal(f"{1000 + i}.{i % 10000:04d}")
+            elif column.type.python_type in (datetime, date):
+                values[column.key] = column.type.python_type(2024, 1, 1) + timedelta(days=i % 365)
+            elif column.type.python_type is int:
+                values[column.key] = 1_000_000 + i
+            else:
+                values[column.key] = f"{column.key}-{i}"
+        values["code"] = f"T{i:05d}"
+        rows.append(Stock(**values))
+    return rows
+
+
+def stock_schema() -> Type[BaseModel]:
+    """Read schema with one Optional field per `stocks` column."""
+
+    fields = {
+        column.key: (Optional[column.type.python_type], None)
+        for column in Stock.__table__.columns
+    }
+    return create_model("StockRead", __config__=ConfigDict(from_attributes=True), **fields)
+
+
+def default_path(schema: Type[BaseModel]) -> Callable[[List[Any]], bytes]:
+    adapter = TypeAdapter(List[schema])
+
+    def encode(rows: List[Any]) -> bytes:
+        validated = adapter.validate_python(rows, from_attributes=True)
+        return JSONResponse(jsonable_encoder(adapter.dump_python(validated, mode="json"))).body
+
+    return encode
+
+
+def fast_path(schema: Type[BaseModel]) -> Callable[[List[Any]], bytes]:
+    def encode(rows: List[Any]) -> bytes:
+        return FastJSONResponse(trusted_rows(rows, schema)).body
+
+    return encode
+
+
+def measure(encode: Callable[[List[Any]], bytes], rows: List[Any], repeat: int) -> Dict[str, float]:
+    body = encode(rows)  # 워밍업
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        encode(rows)
+        timings.append(time.perf_counter() - started)
+    best = min(timings)
+    return {"best_ms": best * 1000, "rows_per_s": len(rows) / best, "bytes": len(body)}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="JSON response serialization benchmark")
+    parser.add_argument("--rows", type=int, default=5000, help="Rows per payload")
+    parser.add_argument("--repeat", type=int, default=5, help="Take the best of N runs")
+    args = parser.parse_args(argv or sys.argv[1:])
+
+    encoder = "orjson" if serialization.orjson is not None else "json (orjson not installed)"
+    print(f"rows={args.rows}, repeat={args.repeat}, fast encoder={encoder}")
+    payloads = {
+        "messages": (message_rows(args.rows), MessageRead),
+        "stocks": (stock_rows(args.rows), stock_schema()),
+    }
+    for name, (rows, schema) in payloads.items():
+        default = measure(default_path(schema), rows, args.repeat)
+        fast = measure(fast_path(schema), rows, args.repeat)
+        print(f"{name:>8}: default {default['best_ms']:8.1f} ms ({default['bytes']:,} B) | "
+              f"fast {fast['best_ms']:8.1f} ms ({fast['bytes']:,} B) | "
+              f"speedup x{default['best_ms'] / fast['best_ms']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Measure password verification throughput of the login path.
+
+Runs `PasswordHasher.verify_and_update` concurrently against a bcrypt hash and
+reports logins per second, overall and per core used by the hash pool.
+
+Usage (from `alphabot-back/`):
+    python -m benchmarks.login_throughput --logins 200 --workers 4 --rounds 12
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from passlib.context import CryptContext
+
+from app.core.security import PasswordHasher, PasswordHasherBusy
+
+
+async def _run(hasher: PasswordHasher, hashed: str, logins: int, concurrency: int) -> int:
+    semaphore = asyncio.Semaphore(concurrency)
+    rejected = 0
+
+    async def one() -> None:
+        nonlocal rejected
+        async with semaphore:
+            try:
+                ok, _ = await hasher.verify_and_update("benchmark-password", hashed)
+            except PasswordHasherBusy:
+                rejected += 1
+                return
+            if not ok:
+                raise RuntimeError("verification failed")
+
+    await asyncio.gather(*(one() for _ in range(logins)))
+    return rejected
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the login throughput benchmark using CLI arguments."""
+
+    parser = argparse.ArgumentParser(description="bcrypt login throughput benchmark")
+    parser.add_argument("--logins", type=int, default=100, help="Number of verifications to run")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Hash pool size")
+    parser.add_argument("--max-pending", type=int, default=1024, help="Hash pool queue limit")
+    parser.add_argument("--concurrency", type=int, default=64, help="Concurrent login requests")
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost factor")
+    args = parser.parse_args(argv or sys.argv[1:])
+
+    context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=args.rounds)
+    hashed = context.hash("benchmark-password")
+    hasher = PasswordHasher(context, max_workers=args.workers, max_pending=args.max_pending)
+
+    started = time.perf_counter()
+    rejected = asyncio.run(_run(hasher, hashed, args.logins, args.concurrency))
+    elapsed = time.perf_counter() - started
+    hasher.shutdown()
+
+    completed = args.logins - rejected
+    cores = min(hasher.max_workers, os.cpu_count() or 1)
+    per_sec = completed / elapsed if elapsed > 0 else 0.0
+    print(f"rounds={args.rounds} workers={hasher.max_workers} cores={cores}")
+    print(f"completed={completed} rejected={rejected} elapsed={elapsed:.3f}s")
+    print(f"logins/sec={per_sec:.1f} logins/sec/core={per_sec / cores:.1f}")
+
+
+if __name__ == "__main__":
+    main()
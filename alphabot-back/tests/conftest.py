@@ -0,0 +1,51 @@
+"""Shared fixtures. Run from `alphabot-back/` with `python -m pytest`.
+
+The app reads its settings at import time, so the database URL points at a
+throwaway SQLite file before anything from `app` is imported.
+"""
+
+import os
+import tempfile
+
+_TMP = tempfile.mkdtemp(prefix="alphabot-tests-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_TMP}/api.db")
+os.environ.setdefault("COLLECTOR_DATABASE_URL", f"sqlite:///{_TMP}/collector.db")
+os.environ.setdefault("VECTOR_INDEX_DIR", f"{_TMP}/vector_index")
+os.environ.setdefault("ARCHIVE_DIR", f"{_TMP}/archive")
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.models import Base, TableVersion
+from app.models.models import Base as CollectorBase
+from app.models.models import Stock
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/test.db")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def collector_db(tmp_path):
+    # 수집기 모델은 public 스키마를 쓰므로 SQLite에서는 스키마 없이 매핑
+    engine = create_engine(f"sqlite:///{tmp_path}/collector.db").execution_options(
+        schema_translate_map={"public": None}
+    )
+    CollectorBase.metadata.create_all(engine)
+    TableVersion.__table__.create(engine)
+    with Session(engine) as session:
+        session.add_all([Stock(code="AAPL", company_name="Apple"), Stock(code="MSFT", company_name="Microsoft")])
+        session.commit()
+        yield session
+    engine.dispose()
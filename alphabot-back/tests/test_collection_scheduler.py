@@ -0,0 +1,40 @@
+from datetime import timedelta
+
+from sqlalchemy import update
+
+from app.models.models import CollectionJob
+from app.pipelines.collection_scheduler import QUOTE_JOB, STATEMENTS_JOB, _now, claim_due_jobs
+
+
+def _due_jobs(session):
+    due = _now() - timedelta(minutes=1)
+    session.add_all([
+        CollectionJob(stock_code=code, kind=kind, priority=priority, interval_seconds=60, next_run_at=due)
+        for code in ("AAPL", "MSFT")
+        for kind, priority in ((QUOTE_JOB, 100), (STATEMENTS_JOB, 10))
+    ])
+    session.commit()
+
+
+def test_claim_respects_running_leases_across_schedulers(collector_db):
+    _due_jobs(collector_db)
+
+    # 다른 스케줄러 프로세스의 claim도 같은 테이블의 임대 수로 제한된다
+    first = claim_due_jobs(collector_db, 10, max_running=3)
+    second = claim_due_jobs(collector_db, 10, max_running=3)
+
+    assert len(first) == 3
+    assert {kind for _, _, kind in first[:2]} == {QUOTE_JOB}
+    assert second == []
+
+
+def test_expired_or_finished_leases_free_slots(collector_db):
+    _due_jobs(collector_db)
+    claimed = claim_due_jobs(collector_db, 10, max_running=2)
+
+    collector_db.execute(
+        update(CollectionJob).where(CollectionJob.job_id == claimed[0][0]).values(locked_until=None)
+    )
+    collector_db.commit()
+
+    assert len(claim_due_jobs(collector_db, 10, max_running=2)) == 1
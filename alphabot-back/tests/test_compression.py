@@ -0,0 +1,155 @@
+import gzip
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from sqlalchemy import select
+
+from app.core import compression
+from app.core.compression import CompressionMiddleware, choose_encoding
+from app.core.serialization import iter_json_array, streamed_response
+from app.models import User
+
+BIG = {"rows": ["x" * 40] * 100}
+
+
+@pytest.fixture(autouse=True)
+def no_brotli(monkeypatch):
+    # 설치 여부와 관계없이 gzip 경로를 검사
+    monkeypatch.setattr(compression, "brotli", None)
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("", None),
+        ("gzip", "gzip"),
+        ("gzip;q=0, deflate", None),
+        ("*", "gzip"),
+        ("*;q=0.5, gzip;q=0", None),
+        ("br", None),
+    ],
+)
+def test_choose_encoding(header, expected):
+    assert choose_encoding(header) == expected
+
+
+def test_brotli_is_preferred_when_available(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", object())
+
+    assert choose_encoding("gzip, br") == "br"
+    assert choose_encoding("gzip, br;q=0.5") == "gzip"
+
+
+def make_client():
+    app = FastAPI()
+
+    @app.get("/big")
+    def big():
+        return BIG
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([b'{"a":', b"1", b"}"]), media_type="application/json")
+
+    @app.get("/events")
+    def events():
+        return StreamingResponse(iter([b"data: 1\n\n"]), media_type="text/event-stream")
+
+    @app.get("/encoded")
+    def encoded():
+        return Response(gzip.compress(b"{}" * 1000), media_type="application/json", headers={"Content-Encoding": "gzip"})
+
+    @app.get("/binary")
+    def binary():
+        return Response(b"\0" * 2000, media_type="application/octet-stream")
+
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+    # TestClient(httpx)는 본문을 자동으로 풀어 주므로 압축 여부는 헤더와 원본 바이트로 확인
+    return TestClient(app)
+
+
+def _raw(client, path, encoding="gzip"):
+    with client.stream("GET", path, headers={"Accept-Encoding": encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+def test_large_json_is_gzipped():
+    response, raw = _raw(make_client(), "/big")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) == len(raw)
+    assert json.loads(gzip.decompress(raw)) == BIG
+
+
+def test_small_or_unaccepted_responses_are_not_compressed():
+    client = make_client()
+
+    response, raw = _raw(client, "/small")
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert json.loads(raw) == {"ok": True}
+
+    response, raw = _raw(client, "/big", encoding="identity")
+    assert "content-encoding" not in response.headers
+    assert json.loads(raw) == BIG
+
+
+def test_streamed_json_is_compressed_chunk_by_chunk():
+    response, raw = _raw(make_client(), "/stream")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert json.loads(gzip.decompress(raw)) == {"a": 1}
+
+
+@pytest.mark.parametrize("path", ["/events", "/binary"])
+def test_excluded_types_pass_through(path):
+    response, _ = _raw(make_client(), path)
+
+    assert "content-encoding" not in response.headers
+
+
+def test_already_encoded_bodies_are_not_recompressed():
+    response, raw = _raw(make_client(), "/encoded")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(raw) == b"{}" * 1000
+
+
+class UserRow(BaseModel):
+    user_id: int
+    username: str
+
+
+@pytest.mark.parametrize("count, chunk_rows", [(0, 2), (1, 2), (4, 2), (5, 2)])
+def test_iter_json_array_is_valid_json(count, chunk_rows):
+    rows = [{"user_id": i, "username": f"u{i}"} for i in range(count)]
+
+    chunks = list(iter_json_array(rows, UserRow, chunk_rows=chunk_rows))
+
+    assert json.loads(b"".join(chunks)) == rows
+    assert len(chunks) == 2 + -(-count // chunk_rows)
+
+
+def test_streamed_response_reads_rows_in_its_own_session(db):
+    db.add_all(User(user_id=i, username=f"u{i}", email=f"u{i}@example.com", password="x") for i in range(1, 6))
+    db.commit()
+    app = FastAPI()
+
+    @app.get("/users")
+    def users():
+        return streamed_response(db.get_bind(), select(User).order_by(User.user_id), UserRow, chunk_rows=2)
+
+    response = TestClient(app).get("/users")
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == [{"user_id": i, "username": f"u{i}"} for i in range(1, 6)]
@@ -0,0 +1,79 @@
+from sqlalchemy import select
+
+from app.crud.crud_base import CRUDBase
+from app.models import Category
+from app.schemas.category import CategoryCreate, CategoryUpdate
+
+crud = CRUDBase[Category, CategoryCreate, CategoryUpdate](Category)
+
+
+def _create(db, *titles):
+    return crud.create_many(db, objs_in=[CategoryCreate(title=t, description="d") for t in titles])
+
+
+def test_create_many_returns_persisted_rows(db):
+    created = _create(db, "a", "b", "c")
+
+    assert sorted(c.title for c in created) == ["a", "b", "c"]
+    assert all(c.category_id is not None for c in created)
+    assert db.scalar(select(Category.title).where(Category.category_id == created[0].category_id))
+
+
+def test_create_many_empty(db):
+    assert crud.create_many(db, objs_in=[]) == []
+
+
+def test_update_many_counts_matched_rows(db):
+    a, b = sorted(_create(db, "a", "b"), key=lambda c: c.title)
+
+    updated = crud.update_many(db, objs_in={
+        a.category_id: CategoryUpdate(title="a2"),
+        b.category_id: {"description": "new"},
+        9999: {"title": "missing"},
+    })
+
+    assert updated == 2
+    db.expire_all()
+    assert db.get(Category, a.category_id).title == "a2"
+    assert db.get(Category, b.category_id).description == "new"
+
+
+def test_update_many_ignores_primary_key_and_unknown_fields(db):
+    (a,) = _create(db, "a")
+
+    assert crud.update_many(db, objs_in={a.category_id: {"category_id": 5, "nope": 1}}) == 0
+    assert crud.update_many(db, objs_in={}) == 0
+
+
+def test_delete_many(db):
+    created = _create(db, "a", "b", "c")
+
+    assert crud.delete_many(db, ids=[created[0].category_id, created[1].category_id, 9999]) == 2
+    assert db.scalars(select(Category.title)).all() == [created[2].title]
+    assert crud.delete_many(db, ids=[]) == 0
+
+
+def test_upsert_many_inserts_and_updates(db):
+    _create(db, "a")
+
+    rows = crud.upsert_many(
+        db,
+        objs_in=[CategoryCreate(title="a", description="updated"), CategoryCreate(title="b", description="d")],
+        index_elements=["title"],
+    )
+
+    assert {(c.title, c.description) for c in rows} == {("a", "updated"), ("b", "d")}
+    assert db.scalar(select(Category.description).where(Category.title == "a")) == "updated"
+    assert len(db.scalars(select(Category)).all()) == 2
+
+
+def test_upsert_by_select_fallback(db):
+    # ON CONFLICT가 없는 DB 경로를 SQLite에서 직접 확인
+    _create(db, "a")
+    rows = [{"title": "a", "description": "updated"}, {"title": "b", "description": "d"}]
+
+    objs = crud._upsert_by_select(db, rows, ["title"])
+    db.commit()
+
+    assert {(c.title, c.description) for c in objs} == {("a", "updated"), ("b", "d")}
+    assert len(db.scalars(select(Category)).all()) == 2
@@ -0,0 +1,25 @@
+import subprocess
+import sys
+
+from benchmarks.import_time import DEFAULT_BUDGET_MS, DEFAULT_MODULE, EAGER_FORBIDDEN, measure
+
+
+def test_collector_import_stays_within_budget():
+    total_ms, cumulative = min((measure(DEFAULT_MODULE) for _ in range(3)), key=lambda run: run[0])
+
+    assert total_ms <= DEFAULT_BUDGET_MS
+    assert [name for name in EAGER_FORBIDDEN if name in cumulative] == []
+
+
+def test_collector_import_does_not_load_pandas_or_yfinance():
+    # 새 인터프리터에서 확인 (테스트 프로세스는 이미 다른 모듈을 불러왔을 수 있음)
+    proc = subprocess.run(
+        [sys.executable, "-c", f"import sys, {DEFAULT_MODULE}; print(*sorted(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    loaded = set(proc.stdout.split())
+
+    assert DEFAULT_MODULE in loaded
+    assert not loaded & {"pandas", "yfinance"}
@@ -0,0 +1,100 @@
+import gzip
+import json
+from datetime import date, datetime, timedelta
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+from app.db import partitions
+from app.models import ArchivedChat, Bookmark, Chat, DeletedMessage, Message, RoleEnum, TrashEnum, User
+from app.pipelines.message_archiver import archive_batch
+from app.services import retrieval
+
+NOW = datetime(2026, 6, 15, 12, 0)
+
+
+def _seed(db):
+    db.add(User(user_id=1, username="u", email="u@example.com", password="x"))
+    chats = {
+        # 휴지통에서 오래된 채팅, 오래 쓰지 않은 채팅, 최근 채팅
+        1: (TrashEnum.OUT, NOW - timedelta(days=40)),
+        2: (TrashEnum.IN, NOW - timedelta(days=400)),
+        3: (TrashEnum.IN, NOW - timedelta(days=1)),
+    }
+    for chat_id, (trash, at) in chats.items():
+        db.add(Chat(chat_id=chat_id, user_id=1, title=f"chat {chat_id}", trash_can=trash, created_at=at, lastchat_at=at))
+        for n in range(2):
+            message_id = chat_id * 10 + n
+            db.add(Message(messages_id=message_id, user_id=1, chat_id=chat_id, role=RoleEnum.USER,
+                           content=f"message {message_id}", created_at=at))
+        db.add(Bookmark(user_id=1, messages_id=chat_id * 10))
+    db.commit()
+
+
+def _count(db, model):
+    return db.scalar(select(func.count()).select_from(model))
+
+
+def test_archive_batch_writes_file_and_purges_chats(db, tmp_path):
+    _seed(db)
+
+    chats, messages = archive_batch(db, now=NOW, batch_size=10, archive_dir=tmp_path)
+
+    assert (chats, messages) == (2, 4)
+    assert db.scalars(select(Chat.chat_id)).all() == [3]
+    assert _count(db, Message) == 2 and _count(db, Bookmark) == 1
+    assert sorted(db.scalars(select(DeletedMessage.messages_id))) == [10, 11, 20, 21]
+
+    archived = db.scalars(select(ArchivedChat).order_by(ArchivedChat.chat_id)).all()
+    assert [(row.chat_id, row.message_count) for row in archived] == [(1, 2), (2, 2)]
+    with gzip.open(archived[0].archive_path, "rt") as archive:
+        records = [json.loads(line) for line in archive]
+    assert [record["chat"]["chat_id"] for record in records] == [1, 2]
+    assert [m["messages_id"] for m in records[0]["messages"]] == [10, 11]
+    assert [b["messages_id"] for b in records[0]["bookmarks"]] == [10]
+
+    assert archive_batch(db, now=NOW, batch_size=10, archive_dir=tmp_path) == (0, 0)
+
+
+def test_purged_messages_are_removed_from_the_vector_index(db, tmp_path):
+    _seed(db)
+    index = retrieval._index(retrieval.MESSAGES_NAMESPACE)
+    vectors = np.eye(index.dim, dtype=np.float32)[:2]
+    index.add([10, 30], vectors, [{"user_id": 1}, {"user_id": 1}])
+    archive_batch(db, now=NOW, batch_size=10, archive_dir=tmp_path)
+
+    assert retrieval.remove_purged_messages(db) == 1
+
+    assert 10 not in index and 30 in index
+    assert _count(db, DeletedMessage) == 0
+
+
+def test_orm_chat_delete_removes_messages_and_bookmarks(db):
+    _seed(db)
+
+    db.delete(db.get(Chat, 3))
+    db.commit()
+
+    assert _count(db, Message) == 4
+    assert db.scalars(select(Bookmark.messages_id).order_by(Bookmark.messages_id)).all() == [10, 20]
+
+
+def test_partitioned_messages_ddl():
+    ddl = str(CreateTable(partitions._partitioned_table()).compile(dialect=postgresql.dialect()))
+
+    assert "PARTITION BY RANGE (created_at)" in ddl
+    assert "PRIMARY KEY (messages_id, created_at)" in ddl
+    assert partitions.partition_name(date(2026, 12, 1)) == "messages_p2026_12"
+    assert partitions._month(date(2026, 12, 31), 1) == date(2027, 1, 1)
+    assert partitions._month(date(2026, 1, 5), -1) == date(2025, 12, 1)
+
+
+def test_partition_helpers_are_noops_on_sqlite(db):
+    connection = db.connection()
+
+    assert not partitions.is_partitioned(connection)
+    assert partitions.ensure_message_partitions(connection) == []
+    assert partitions.drop_empty_partitions(connection) == []
+    assert not partitions.partition_messages(connection)
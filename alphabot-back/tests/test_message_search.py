@@ -0,0 +1,36 @@
+from app.crud.crud_message import message_crud
+from app.models import Chat, Message, RoleEnum, TrashEnum, User
+
+
+def _seed(db, *contents):
+    db.add(User(user_id=1, username="u", email="u@example.com", password="x"))
+    db.add(Chat(chat_id=1, user_id=1, title="t", trash_can=TrashEnum.IN))
+    for i, content in enumerate(contents, start=1):
+        db.add(Message(messages_id=i, user_id=1, chat_id=1, role=RoleEnum.USER, content=content))
+    db.commit()
+
+
+def test_snippet_escapes_message_html_and_marks_matches(db):
+    _seed(db, 'apple <img src=x onerror="alert(1)"> & more')
+
+    rows, has_more = message_crud.search_messages(db, user_id=1, query="apple")
+
+    assert not has_more
+    snippet = rows[0].snippet
+    assert snippet.startswith("<mark>apple</mark>")
+    assert "<img" not in snippet
+    assert "&lt;img src=x onerror=&quot;alert(1)&quot;&gt; &amp; more" in snippet
+
+
+def test_search_is_scoped_and_paginated(db):
+    _seed(db, "apple one", "apple two", "banana")
+
+    first, has_more = message_crud.search_messages(db, user_id=1, query="apple", limit=1)
+    second, _ = message_crud.search_messages(
+        db, user_id=1, query="apple", limit=1,
+        before_score=first[0].score, before_id=first[0].messages_id,
+    )
+
+    assert has_more
+    assert {first[0].messages_id, second[0].messages_id} == {1, 2}
+    assert message_crud.search_messages(db, user_id=2, query="apple") == ([], False)
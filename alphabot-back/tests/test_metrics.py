@@ -0,0 +1,71 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.cache import CacheRule, ResponseCacheMiddleware
+from app.core.config import settings
+from app.core.metrics import MetricsMiddleware, MetricsRegistry
+from app.routers import health as health_router
+from app.routers import metrics as metrics_router
+from tests.test_response_cache import FakeRegistry
+
+
+def _request_lines(registry):
+    return [line for line in registry.render().splitlines() if line.startswith("http_requests_total{")]
+
+
+def test_cache_hits_and_304s_are_labelled_with_the_route():
+    registry = MetricsRegistry(slow_query_seconds=1.0, slow_query_samples=10)
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        return {"id": item_id}
+
+    app.add_middleware(ResponseCacheMiddleware, rules=[CacheRule("/items", ("items",))], registry=FakeRegistry())
+    app.add_middleware(MetricsMiddleware, registry=registry)
+    client = TestClient(app)
+
+    etag = client.get("/items/1").headers["etag"]
+    client.get("/items/1")
+    client.get("/items/1", headers={"If-None-Match": etag})
+    client.get("/missing")
+
+    assert _request_lines(registry) == [
+        'http_requests_total{method="GET",route="/items/{item_id}",status="200"} 2',
+        'http_requests_total{method="GET",route="/items/{item_id}",status="304"} 1',
+        'http_requests_total{method="GET",route="unrouted",status="404"} 1',
+    ]
+
+
+def _metrics_client(client_host="testclient"):
+    app = FastAPI()
+    app.include_router(metrics_router.router, prefix="/metrics")
+    return TestClient(app, client=(client_host, 50000))
+
+
+def test_metrics_require_the_profile_token(monkeypatch):
+    monkeypatch.setattr(settings, "PROFILE_TOKEN", "secret")
+    client = _metrics_client()
+
+    assert client.get("/metrics").status_code == 403
+    assert client.get("/metrics/slow-queries", headers={"Authorization": "Bearer wrong"}).status_code == 403
+    assert client.get("/metrics", headers={"Authorization": "Bearer secret"}).status_code == 200
+    assert client.get("/metrics/slow-queries", headers={"Authorization": "Bearer secret"}).status_code == 200
+
+
+def test_metrics_without_token_are_loopback_only(monkeypatch):
+    monkeypatch.setattr(settings, "PROFILE_TOKEN", None)
+
+    assert _metrics_client("203.0.113.9").get("/metrics").status_code == 403
+    assert _metrics_client("127.0.0.1").get("/metrics").status_code == 200
+
+
+def test_pool_health_requires_metrics_access(monkeypatch):
+    monkeypatch.setattr(settings, "PROFILE_TOKEN", "secret")
+    app = FastAPI()
+    app.include_router(health_router.router, prefix="/health")
+    client = TestClient(app)
+
+    assert client.get("/health/pool").status_code == 403
+    assert client.get("/health/pool", headers={"Authorization": "Bearer secret"}).status_code == 200
+    assert client.get("/health/live").status_code == 200
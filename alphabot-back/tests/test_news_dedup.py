@@ -0,0 +1,67 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import func, select
+
+from app.models.models import NewsItem
+from app.pipelines.news_collector import NewsEntry, _insert_news, store_news
+
+
+def _entry(ticker, url, title, published_at=None):
+    return NewsEntry(ticker, url, title, "pub", "summary", published_at or datetime(2026, 1, 1, tzinfo=timezone.utc), "test")
+
+
+def _count(session, ticker=None):
+    stmt = select(func.count()).select_from(NewsItem)
+    if ticker:
+        stmt = stmt.where(NewsItem.stock_code == ticker)
+    return session.scalar(stmt)
+
+
+def test_same_article_is_stored_once_per_ticker(collector_db):
+    shared = "https://example.com/big-tech"
+    inserted = store_news(collector_db, {
+        "AAPL": [_entry("AAPL", shared, "Big tech rallies"), _entry("AAPL", shared + "?utm_source=x", "Big tech rallies")],
+        "MSFT": [_entry("MSFT", shared, "Big tech rallies")],
+    })
+    collector_db.commit()
+
+    assert inserted == 2
+    assert _count(collector_db, "AAPL") == 1
+    assert _count(collector_db, "MSFT") == 1
+
+
+def test_rerun_skips_stored_articles(collector_db):
+    fetched = {"AAPL": [_entry("AAPL", "https://example.com/a", "A")]}
+    store_news(collector_db, fetched)
+    collector_db.commit()
+
+    # 커서를 지난 기사라도 이미 저장된 URL/본문이면 다시 넣지 않는다
+    later = datetime(2026, 2, 1, tzinfo=timezone.utc)
+    assert store_news(collector_db, {"AAPL": [_entry("AAPL", "https://example.com/a2", "A", later)]}) == 0
+    assert _count(collector_db) == 1
+
+
+def test_articles_sharing_the_cursor_timestamp_are_kept(collector_db):
+    minute = datetime(2026, 3, 1, 9, 30, tzinfo=timezone.utc)
+    store_news(collector_db, {"AAPL": [_entry("AAPL", "https://example.com/a", "A", minute)]})
+    collector_db.commit()
+
+    # 분 단위 피드: 다음 실행에서 같은 시각에 새 기사가 올라온 경우
+    inserted = store_news(collector_db, {"AAPL": [
+        _entry("AAPL", "https://example.com/a", "A", minute),
+        _entry("AAPL", "https://example.com/b", "B", minute),
+        _entry("AAPL", "https://example.com/old", "Old", datetime(2026, 2, 1, tzinfo=timezone.utc)),
+    ]})
+
+    assert inserted == 1
+    assert _count(collector_db) == 2
+
+
+def test_insert_ignores_conflicts_from_concurrent_runs(collector_db):
+    row = {
+        "stock_code": "AAPL", "url": "u", "url_hash": "h1", "content_hash": "c1",
+        "title": "t", "publisher": None, "summary": None, "published_at": None, "source": "test",
+    }
+    assert _insert_news(collector_db, [row]) == 1
+    assert _insert_news(collector_db, [dict(row, url_hash="h2"), dict(row, stock_code="MSFT")]) == 1
+    assert _count(collector_db) == 2
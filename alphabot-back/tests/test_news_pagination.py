@@ -0,0 +1,40 @@
+from datetime import datetime, timezone
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.db import get_db
+from app.models.models import NewsItem
+from app.routers import news
+
+
+def _client(collector_db):
+    app = FastAPI()
+    app.include_router(news.router, prefix="/news")
+    app.dependency_overrides[get_db] = lambda: collector_db
+    return TestClient(app)
+
+
+def test_pages_cover_tied_timestamps_and_the_null_tail(collector_db):
+    minute = datetime(2026, 3, 1, 9, 30, tzinfo=timezone.utc)
+    times = [minute] * 3 + [datetime(2026, 3, 1, 9, 0, tzinfo=timezone.utc), None, None]
+    collector_db.add_all(
+        NewsItem(stock_code="AAPL", url=f"u{i}", url_hash=f"h{i}", content_hash=f"c{i}",
+                 title=f"t{i}", published_at=at, source="test")
+        for i, at in enumerate(times)
+    )
+    collector_db.commit()
+    client = _client(collector_db)
+
+    titles, params = [], {"limit": 2}
+    while True:
+        page = client.get("/news/aapl", params=params).json()
+        titles += [item["title"] for item in page["items"]]
+        if page["next_before_id"] is None:
+            break
+        params = {"limit": 2, "before_id": page["next_before_id"]}
+        if page["next_before_at"] is not None:
+            params["before_at"] = page["next_before_at"]
+
+    # 같은 시각 3건이 페이지 경계에 걸려도, 게시 시각 없는 기사도 빠짐없이
+    assert titles == ["t2", "t1", "t0", "t3", "t5", "t4"]
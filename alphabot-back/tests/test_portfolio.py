@@ -0,0 +1,23 @@
+from app.services import portfolio
+from app.services.portfolio import PortfolioValuationCache
+
+
+def test_valuation_cache_is_keyed_on_stock_prices_only(monkeypatch):
+    versions = {"stocks": 1, "holdings": 1}
+    calls = []
+    monkeypatch.setattr(portfolio.table_versions, "current", lambda tables: tuple(versions[t] for t in tables))
+    monkeypatch.setattr(portfolio, "value_holdings", lambda session, user_id: calls.append(user_id) or {"user": user_id})
+    cache = PortfolioValuationCache()
+    cache.get(None, 1)
+    cache.get(None, 2)
+
+    # 다른 사용자의 보유 종목 수정은 전역 holdings 버전만 올린다
+    versions["holdings"] += 1
+    cache.invalidate(2)
+    cache.get(None, 1)
+    cache.get(None, 2)
+    assert calls == [1, 2, 2]
+
+    versions["stocks"] += 1
+    cache.get(None, 1)
+    assert calls == [1, 2, 2, 1]
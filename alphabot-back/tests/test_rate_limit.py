@@ -0,0 +1,134 @@
+import threading
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import rate_limit as rate_limit_module
+from app.core.coalesce import SingleFlight
+from app.core.config import settings
+from app.core.dependencies import get_current_user
+from app.core.rate_limit import InMemoryRateLimitBackend, rate_limit, set_rate_limit_backend
+from app.models import User
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(rate_limit_module, "_backend", None)
+    set_rate_limit_backend(InMemoryRateLimitBackend())
+    app = FastAPI()
+    user = {"id": 1}
+
+    @app.get("/search")
+    def search(current_user: User = Depends(rate_limit("search", 2))):
+        return {"user_id": current_user.user_id}
+
+    app.dependency_overrides[get_current_user] = lambda: User(user_id=user["id"])
+    return TestClient(app), user
+
+
+def test_requests_over_the_limit_get_429(client):
+    client, _ = client
+
+    statuses = [client.get("/search").status_code for _ in range(3)]
+
+    assert statuses == [200, 200, 429]
+    response = client.get("/search")
+    assert response.status_code == 429
+    assert 1 <= int(response.headers["retry-after"]) <= 60
+
+
+def test_limits_are_per_user(client):
+    client, user = client
+    client.get("/search")
+    client.get("/search")
+
+    user["id"] = 2
+
+    assert client.get("/search").json() == {"user_id": 2}
+
+
+def test_disabled_rate_limit_allows_everything(client, monkeypatch):
+    client, _ = client
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", False)
+
+    assert {client.get("/search").status_code for _ in range(5)} == {200}
+
+
+def test_window_rollover_resets_the_counter(monkeypatch):
+    backend = InMemoryRateLimitBackend()
+    now = [120.0]
+    monkeypatch.setattr(rate_limit_module.time, "time", lambda: now[0])
+
+    assert [backend.hit("k", 1, 60).allowed for _ in range(2)] == [True, False]
+    now[0] = 180.0
+    assert backend.hit("k", 1, 60).allowed
+
+
+def _concurrent(flight, key, fn, callers):
+    results = [None] * callers
+    errors = [None] * callers
+
+    def call(i):
+        try:
+            results[i] = flight.do(key, fn)
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(callers)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def _wait_for_followers(flight, count):
+    # 리더가 fn 안에서 기다리는 동안 나머지 호출이 합류할 때까지 대기
+    for _ in range(500):
+        if flight.stats()[1] >= count:
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError("followers did not join the flight")
+
+
+def test_single_flight_shares_one_call():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def load():
+        calls.append(1)
+        release.wait(5)
+        return b"payload"
+
+    threads, results, errors = _concurrent(flight, "key", load, 5)
+    _wait_for_followers(flight, 4)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
+    assert results == [b"payload"] * 5 and errors == [None] * 5
+    assert flight.stats() == (0, 4)
+
+    # 끝난 뒤에는 결과를 남기지 않고 다시 실행
+    assert flight.do("key", lambda: b"fresh") == b"fresh"
+
+
+def test_single_flight_shares_errors():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def load():
+        release.wait(5)
+        raise ValueError("boom")
+
+    threads, results, errors = _concurrent(flight, "key", load, 3)
+    _wait_for_followers(flight, 2)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == [None] * 3
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert flight.stats()[0] == 0
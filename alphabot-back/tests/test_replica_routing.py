@@ -0,0 +1,106 @@
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.cache import CacheRule, ResponseCacheMiddleware
+from app.db import ReadYourWritesMiddleware, get_db, requires_primary
+from app.db import session as db_session
+from tests.test_response_cache import FakeRegistry
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    engines = {name: create_engine(f"sqlite:///{tmp_path}/{name}.db") for name in ("primary", "replica")}
+    monkeypatch.setattr(db_session, "SessionLocal", sessionmaker(bind=engines["primary"]))
+    monkeypatch.setattr(db_session, "ReplicaSessionLocal", sessionmaker(bind=engines["replica"]))
+
+    app = FastAPI()
+
+    def database(db: Session) -> str:
+        return db.get_bind().url.database.rsplit("/", 1)[-1].removesuffix(".db")
+
+    @app.get("/read")
+    def read(db: Session = Depends(get_db)):
+        return database(db)
+
+    @app.post("/write")
+    def write(commit: bool = True, db: Session = Depends(get_db)):
+        db.execute(text("SELECT 1"))
+        if commit:
+            db.commit()
+        return database(db)
+
+    @app.get("/read-and-write")
+    @requires_primary
+    def read_and_write(db: Session = Depends(get_db)):
+        return database(db)
+
+    @app.get("/cached")
+    def cached(db: Session = Depends(get_db)):
+        return database(db)
+
+    app.add_middleware(ResponseCacheMiddleware, rules=[CacheRule("/cached", ("items",))], registry=FakeRegistry())
+    app.add_middleware(ReadYourWritesMiddleware, window=5)
+    yield TestClient(app)
+    for engine in engines.values():
+        engine.dispose()
+
+
+def test_safe_reads_use_the_replica(client):
+    assert client.get("/read").json() == "replica"
+
+
+def test_writes_and_marked_routes_use_the_primary(client):
+    assert client.post("/write").json() == "primary"
+    assert client.get("/read-and-write").json() == "primary"
+
+
+def test_response_cache_fills_read_from_the_primary(client):
+    first = client.get("/cached")
+    second = client.get("/cached")
+
+    assert first.json() == second.json() == "primary"
+    assert client.get("/read").json() == "replica"
+
+
+def test_commit_sets_cookie_that_routes_later_reads_to_the_primary(client):
+    response = client.post("/write")
+
+    assert "rw_until=" in response.headers["set-cookie"]
+    # 쿠키가 클라이언트와 함께 다니므로 어느 워커가 받아도 primary에서 읽는다
+    assert client.get("/read").json() == "primary"
+    client.cookies.clear()
+    assert client.get("/read").json() == "replica"
+
+
+def test_requests_without_commit_or_with_forged_cookie_stay_on_the_replica(client):
+    assert "set-cookie" not in client.post("/write", params={"commit": False}).headers
+
+    client.cookies.set(db_session.READ_YOUR_WRITES_COOKIE, "99999999999")
+    assert client.get("/read").json() == "replica"
+
+
+def test_portfolio_valuation_fills_its_cache_from_the_primary(tmp_path, monkeypatch):
+    from app.core.dependencies import get_current_user
+    from app.models import User
+    from app.routers import portfolio
+
+    engines = {name: create_engine(f"sqlite:///{tmp_path}/{name}.db") for name in ("primary", "replica")}
+    monkeypatch.setattr(db_session, "SessionLocal", sessionmaker(bind=engines["primary"]))
+    monkeypatch.setattr(db_session, "ReplicaSessionLocal", sessionmaker(bind=engines["replica"]))
+    sessions = []
+
+    class FakeCache:
+        def get(self, db, user_id):
+            sessions.append(db.get_bind().url.database.rsplit("/", 1)[-1])
+            return {"positions": []}
+
+    monkeypatch.setattr(portfolio, "portfolio_cache", FakeCache())
+    app = FastAPI()
+    app.include_router(portfolio.router)
+    app.dependency_overrides[get_current_user] = lambda: User(user_id=1)
+
+    assert TestClient(app).get("/valuation").status_code == 200
+    assert sessions == ["primary.db"]
@@ -0,0 +1,103 @@
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.core.cache import CacheRule, ResponseCacheMiddleware
+
+
+class FakeRegistry:
+    """Table versions controlled by the test (no database)."""
+
+    def __init__(self):
+        self.versions = {"items": 1}
+
+    def is_stale(self):
+        return False
+
+    def refresh(self):
+        pass
+
+    def current(self, tables):
+        return tuple(self.versions.get(table, 0) for table in tables)
+
+
+def make_client():
+    calls = []
+    hits = []
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        calls.append(item_id)
+        if item_id == 404:
+            raise HTTPException(status_code=404)
+        return {"id": item_id, "calls": len(calls)}
+
+    @app.get("/other")
+    def other():
+        calls.append("other")
+        return {"ok": True}
+
+    registry = FakeRegistry()
+    app.add_middleware(
+        ResponseCacheMiddleware,
+        rules=[CacheRule("/items", ("items",), ttl=60, on_hit=hits.append)],
+        registry=registry,
+    )
+    return TestClient(app), registry, calls, hits
+
+
+def test_second_request_is_served_from_cache():
+    client, _, calls, hits = make_client()
+
+    first = client.get("/items/1")
+    second = client.get("/items/1")
+
+    assert first.status_code == second.status_code == 200
+    assert second.json() == first.json()
+    assert calls == [1]
+    assert hits == ["/items/1"]
+    assert first.headers["etag"] == second.headers["etag"]
+
+
+def test_if_none_match_returns_304():
+    client, _, calls, hits = make_client()
+    etag = client.get("/items/1").headers["etag"]
+
+    response = client.get("/items/1", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert calls == [1]
+    assert hits == ["/items/1"]
+
+
+def test_table_version_change_invalidates_entry_and_etag():
+    client, registry, calls, _ = make_client()
+    etag = client.get("/items/1").headers["etag"]
+
+    registry.versions["items"] = 2
+    response = client.get("/items/1", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert calls == [1, 1]
+
+
+def test_query_order_does_not_change_key():
+    client, _, calls, _ = make_client()
+
+    client.get("/items/1?a=1&b=2")
+    client.get("/items/1?b=2&a=1")
+
+    assert calls == [1]
+
+
+def test_errors_and_unmatched_paths_are_not_cached():
+    client, _, calls, _ = make_client()
+
+    assert client.get("/items/404").status_code == 404
+    assert client.get("/items/404").status_code == 404
+    client.get("/other")
+    client.get("/other")
+
+    assert calls == [404, 404, "other", "other"]
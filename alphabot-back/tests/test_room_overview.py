@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.dependencies import get_current_user
+from app.db import get_db
+from app.models import Chat, Message, RoleEnum, TrashEnum, User
+from app.routers import chat
+
+START = datetime(2026, 5, 1, 9, 0)
+
+
+def test_overview_pages_rooms_with_last_message_and_count(db):
+    db.add_all([
+        User(user_id=1, username="u1", email="u1@example.com", password="x"),
+        User(user_id=2, username="u2", email="u2@example.com", password="x"),
+    ])
+    # 채팅방 1~4는 사용자 1, 5는 사용자 2, 4는 휴지통 밖
+    for chat_id in range(1, 6):
+        db.add(Chat(chat_id=chat_id, user_id=2 if chat_id == 5 else 1, title=f"room {chat_id}",
+                    trash_can=TrashEnum.OUT if chat_id == 4 else TrashEnum.IN,
+                    created_at=START, lastchat_at=START + timedelta(minutes=chat_id % 3)))
+    message_id = 0
+    for chat_id in (1, 2, 4, 5):
+        for n in range(chat_id):
+            message_id += 1
+            db.add(Message(messages_id=message_id, user_id=1, chat_id=chat_id, role=RoleEnum.USER,
+                           content=f"room {chat_id} message {n}", created_at=START))
+    db.commit()
+
+    app = FastAPI()
+    app.include_router(chat.router)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: User(user_id=1)
+    client = TestClient(app)
+
+    first = client.get("/api/rooms/overview", params={"limit": 2}).json()
+    second = client.get("/api/rooms/overview", params={
+        "limit": 2, "before_at": first["next_before_at"], "before_id": first["next_before_id"],
+    }).json()
+
+    rooms = first["rooms"] + second["rooms"]
+    # lastchat_at: 방 2 > 방 1 > 방 3
+    assert [room["chat_id"] for room in rooms] == [2, 1, 3]
+    assert [room["message_count"] for room in rooms] == [2, 1, 0]
+    assert [room["last_message"] for room in rooms] == ["room 2 message 1", "room 1 message 0", None]
+    assert second["next_before_id"] is None
@@ -0,0 +1,19 @@
+from sqlalchemy.orm import Session
+
+from app.models.models import Stock
+from app.pipelines.snapshot_sinks import StockTableSink
+
+
+def test_upsert_keeps_stored_metrics_missing_from_snapshot(collector_db):
+    bind = collector_db.get_bind()
+    with StockTableSink(lambda: Session(bind)) as sink:
+        sink.write({"ticker": "AAPL", "long_name": "Apple Inc.", "market_cap": 3e12, "dividend_yield": 0.5})
+    with StockTableSink(lambda: Session(bind)) as sink:
+        sink.write({"ticker": "aapl", "market_cap": float("nan"), "previous_close": 190.0})
+
+    collector_db.expire_all()
+    stock = collector_db.get(Stock, "AAPL")
+    assert stock.company_name == "Apple Inc."
+    assert stock.market_cap == 3_000_000_000_000
+    assert stock.dividend_yield == 0.5
+    assert stock.previous_close == 190.0
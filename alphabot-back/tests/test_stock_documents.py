@@ -0,0 +1,50 @@
+import gzip
+import json
+from datetime import datetime, timezone
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from app.db import get_db
+from app.models.models import Stock, StockDocument
+from app.pipelines.stock_documents import refresh_stock_documents
+from app.routers import stock_info
+
+
+def _stamp(db, when):
+    db.execute(update(Stock).values(last_updated=when))
+    db.commit()
+
+
+def test_collector_timestamp_alone_does_not_rewrite_documents(collector_db):
+    _stamp(collector_db, datetime(2026, 1, 1, tzinfo=timezone.utc))
+    assert refresh_stock_documents(collector_db, ["AAPL", "MSFT"]) == 2
+    collector_db.commit()
+
+    # 스냅샷 업서트마다 찍히는 last_updated만 바뀐 경우
+    _stamp(collector_db, datetime(2026, 1, 2, tzinfo=timezone.utc))
+    assert refresh_stock_documents(collector_db, ["AAPL", "MSFT"]) == 0
+
+    collector_db.execute(update(Stock).where(Stock.code == "AAPL").values(current_price=190.5))
+    assert refresh_stock_documents(collector_db, ["AAPL", "MSFT"]) == 1
+
+
+def test_detail_serves_last_updated_as_header(collector_db, monkeypatch):
+    _stamp(collector_db, datetime(2026, 1, 2, 9, 30))
+    refresh_stock_documents(collector_db, ["AAPL"])
+    collector_db.commit()
+    monkeypatch.setattr(stock_info.stock_interest, "record", lambda code, factory: None)
+    app = FastAPI()
+    app.include_router(stock_info.router, prefix="/stocks")
+    app.dependency_overrides[get_db] = lambda: collector_db
+    client = TestClient(app)
+
+    response = client.get("/stocks/aapl", headers={"Accept-Encoding": "identity"})
+
+    assert response.headers["last-modified"] == "Fri, 02 Jan 2026 09:30:00 GMT"
+    assert response.json()["code"] == "AAPL"
+    assert "last_updated" not in response.json()
+    stored = collector_db.get(StockDocument, "AAPL").payload
+    assert json.loads(gzip.decompress(stored)) == response.json()
+    assert client.get("/stocks/none").status_code == 404
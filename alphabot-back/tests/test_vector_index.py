@@ -0,0 +1,88 @@
+import json
+
+import numpy as np
+
+from app.services.vector_index import FlatIndex, IVFIndex
+
+DIM = 8
+
+
+def _vectors(n, seed=0):
+    vectors = np.random.default_rng(seed).normal(size=(n, DIM)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _open(cls, path, **kwargs):
+    return cls(path, dim=DIM, embedder_name="test", **kwargs)
+
+
+def test_add_appends_to_log_instead_of_rewriting_metadata(tmp_path):
+    index = _open(FlatIndex, tmp_path)
+    index.add([1, 2], _vectors(2), [{"user_id": 1}, {"user_id": 2}])
+    log = tmp_path / json.loads((tmp_path / "meta.json").read_text())["log"]
+    size = log.stat().st_size
+
+    index.add([3], _vectors(1, seed=1), [{"user_id": 1}])
+    index.delete([2])
+
+    lines = [json.loads(line) for line in log.read_text().splitlines()]
+    assert log.stat().st_size > size
+    assert lines[-2:] == [["+", 3, {"user_id": 1}], ["-", 2]]
+    assert "keys" not in json.loads((tmp_path / "meta.json").read_text())
+
+
+def test_other_instance_sees_writes(tmp_path):
+    reader = _open(FlatIndex, tmp_path)
+    writer = _open(FlatIndex, tmp_path)
+    vectors = _vectors(3)
+
+    writer.add([1, 2, 3], vectors, [{}, {}, {}], state={"cursor": 3})
+    assert [key for key, _, _ in reader.search(vectors[1], k=1)] == [2]
+    assert reader.state["cursor"] == 3
+
+    writer.delete([2])
+    assert 2 not in [key for key, _, _ in reader.search(vectors[1], k=3)]
+
+    # 다시 열어도 로그에서 같은 상태를 복원
+    reopened = _open(FlatIndex, tmp_path)
+    assert sorted(key for key, _, _ in reopened.search(vectors[0], k=10)) == [1, 3]
+
+
+def test_compaction_starts_a_new_log(tmp_path):
+    index = _open(FlatIndex, tmp_path)
+    index.add(list(range(10)), _vectors(10))
+    old_log = json.loads((tmp_path / "meta.json").read_text())["log"]
+
+    index.delete(list(range(5)))
+    index.compact()
+
+    new_log = json.loads((tmp_path / "meta.json").read_text())["log"]
+    assert new_log != old_log
+    assert not (tmp_path / old_log).exists()
+    assert _open(FlatIndex, tmp_path).live_count == 5
+
+
+def test_ivf_filtered_search_returns_k_matches(tmp_path):
+    index = _open(IVFIndex, tmp_path, nprobe=1)
+    vectors = _vectors(600)
+    # 필터에 맞는 행은 소수라 nprobe=1 버킷만으로는 k개를 채우지 못한다
+    metadata = [{"user_id": 1 if i % 50 == 0 else 2} for i in range(600)]
+    index.add(list(range(600)), vectors, metadata)
+    assert index.centroids is not None
+
+    hits = index.search(vectors[1], k=10, filters={"user_id": 1})
+
+    assert len(hits) == 10
+    assert all(metadata[key]["user_id"] == 1 for key, _, _ in hits)
+    assert [score for _, score, _ in hits] == sorted((score for _, score, _ in hits), reverse=True)
+
+
+def test_ivf_reader_reloads_after_training(tmp_path):
+    reader = _open(IVFIndex, tmp_path)
+    writer = _open(IVFIndex, tmp_path)
+    vectors = _vectors(300)
+
+    writer.add(list(range(300)), vectors)
+
+    assert reader.search(vectors[7], k=1)[0][0] == 7
+    assert reader.nlist == writer.nlist > 0
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import warmup as warmup_module
+from app.core.config import settings
+from app.core.warmup import WarmupState, run_warmup, warmup
+from app.routers import health as health_router
+
+
+@pytest.fixture
+def steps(monkeypatch):
+    calls = {name: 0 for name in ("pool", "table_versions", "stock_suggest", "embedder")}
+    failures = {"pool": 0}
+
+    def step(name):
+        def run(*args):
+            calls[name] += 1
+            if failures.get(name, 0) > 0:
+                failures[name] -= 1
+                raise ConnectionError("database unreachable")
+        return run
+
+    for name in calls:
+        monkeypatch.setattr(warmup_module, f"warm_{name}", step(name))
+    monkeypatch.setattr(warmup_module, "warm_response_models", lambda app: 0)
+    return calls, failures
+
+
+def _app(state):
+    app = FastAPI()
+    app.include_router(health_router.router, prefix="/health")
+    app.state.warmup = state
+    return app
+
+
+def test_failed_pool_step_keeps_readiness_at_503(steps):
+    _, failures = steps
+    failures["pool"] = 1
+    state = WarmupState()
+    app = _app(state)
+
+    assert not run_warmup(app, state)
+
+    response = TestClient(app).get("/health/ready")
+    assert response.status_code == 503
+    assert "database unreachable" in response.json()["steps"]["pool"]
+
+
+def test_warmup_retries_failed_steps_until_ready(steps, monkeypatch):
+    calls, failures = steps
+    failures["pool"] = 2
+    monkeypatch.setattr(settings, "STARTUP_JITTER_SECONDS", 0)
+    monkeypatch.setattr(settings, "STARTUP_RETRY_SECONDS", 0)
+    state = WarmupState()
+    app = _app(state)
+
+    asyncio.run(warmup(app, state))
+
+    assert state.ready and state.attempts == 3
+    # 성공한 단계는 다시 실행하지 않는다
+    assert calls == {"pool": 3, "table_versions": 1, "stock_suggest": 1, "embedder": 1}
+    assert TestClient(app).get("/health/ready").status_code == 200
+
+
+def test_best_effort_step_failure_does_not_block_readiness(steps):
+    _, failures = steps
+    failures["embedder"] = 1
+    state = WarmupState()
+
+    assert run_warmup(_app(state), state)
+    assert "database unreachable" in state.steps["embedder"]